@@ -97,6 +97,30 @@ DATABASES = {
     }
 }
 
+# Shared by every web worker and the import commands, which bump the data version in it
+# once they finish; e.g. CACHE_URL=redis://localhost:6379/1 on a multi-host deployment
+CACHES = {
+    "default": env.cache("CACHE_URL", default=f"filecache://{BASE_DIR / '.cache'}"),
+}
+
+# Lifetime in seconds of the cached reference data (constructors, colors, drivers, tyre compounds) of a season
+REFERENCE_DATA_CACHE_TIMEOUT = env.int("REFERENCE_DATA_CACHE_TIMEOUT", default=24 * 60 * 60)
+
+# Rendered plot images: "filesystem" (PNG files in PLOT_CACHE_DIR, shared by the workers of one host),
+# "memory" (per process) or "cache" (the Django cache PLOT_CACHE_ALIAS, e.g. Redis shared by several hosts)
+PLOT_CACHE_BACKEND = env("PLOT_CACHE_BACKEND", default="filesystem")
+PLOT_CACHE_DIR = env("PLOT_CACHE_DIR", default=str(BASE_DIR / ".cache" / "plots"))
+PLOT_CACHE_ALIAS = env("PLOT_CACHE_ALIAS", default="default")
+# Size bound in bytes of the filesystem and memory plot caches, least recently used plots are evicted first
+PLOT_CACHE_MAX_BYTES = env.int("PLOT_CACHE_MAX_BYTES", default=512 * 1024 ** 2)
+# Worker processes rendering the plots of a visual concurrently, per web worker process; 0 or 1 renders them in the request
+PLOT_RENDER_WORKERS = env.int("PLOT_RENDER_WORKERS", default=0)
+# Seconds browsers and proxies may reuse a plot image before revalidating it with its ETag
+PLOT_IMAGE_MAX_AGE = env.int("PLOT_IMAGE_MAX_AGE", default=24 * 60 * 60)
+
+# Memory budget in bytes of the per-process cache of session data shared by the visuals
+SESSION_BUNDLE_CACHE_BYTES = env.int("SESSION_BUNDLE_CACHE_BYTES", default=256 * 1024 ** 2)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -0,0 +1,87 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from static_data.models import Lap
+from static_data.tests.fixtures import create_session
+from static_visuals.plotting.plot_cache import MemoryPlotStore, plot_cache, plot_cache_key
+
+PNG = b"\x89PNG\r\n\x1a\n"
+
+
+@mock.patch("static_visuals.plotting.plot_cache.data_version", return_value=1)
+@mock.patch.object(plot_cache, "_store", new_callable=lambda: MemoryPlotStore(max_bytes=10000))
+class PlotImageTests(TestCase):
+
+    def setUp(self):
+        self.session = create_session(drivers=1, laps=1)
+        self.url = reverse("plot_image", args=["team_pace", "lap_time_distribution", 2024, self.session.id])
+
+    @property
+    def key(self) -> str:
+        # Of the patched data version, which setUp does not see
+        return plot_cache_key("TeamLapVisuals", "lap_time_distribution", 2024, self.session.id)
+
+    def test_serves_the_cached_plot(self, store, data_version):
+        store.set(self.key, PNG)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response["Content-Type"], response.content), ("image/png", PNG))
+        self.assertIn("max-age", response["Cache-Control"])
+        self.assertTrue(response.has_header("ETag"))
+
+    def test_not_modified_for_a_current_etag(self, store, data_version):
+        store.set(self.key, PNG)
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_etag_changes_with_the_data_version(self, store, data_version):
+        store.set(self.key, PNG)
+        etag = self.client.get(self.url)["ETag"]
+        data_version.return_value = 2
+
+        self.assertNotEqual(self.client.get(self.url)["ETag"], etag)
+
+    def test_renders_on_a_miss(self, store, data_version):
+        with mock.patch("frontend.views.render_plot", return_value=PNG) as render_plot:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.content, PNG)
+        render_plot.assert_called_once()
+
+    def test_empty_plot_is_not_found(self, store, data_version):
+        # Also an empty image cached before they were left out
+        store.set(self.key, b"")
+        with mock.patch("frontend.views.render_plot", return_value=None):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.has_header("Cache-Control"))
+
+    def test_unknown_plots_are_not_found(self, store, data_version):
+        for args in (["team_pace", "unknown", 2024, self.session.id], ["unknown", "lap_time_distribution", 2024, self.session.id],
+                     ["team_pace", "lap_time_distribution", 2024, self.session.id, 1, 1]):
+            with self.subTest(args=args):
+                self.assertEqual(self.client.get(reverse("plot_image", args=args)).status_code, 404)
+
+    def test_missing_session_is_not_found(self, store, data_version):
+        for args in (["team_pace", "lap_time_distribution", 2024, self.session.id + 1],
+                     ["team_pace", "lap_time_distribution", 2023, self.session.id]):
+            with self.subTest(args=args):
+                self.assertEqual(self.client.get(reverse("plot_image", args=args)).status_code, 404)
+
+    def test_lap_of_another_session_is_not_found(self, store, data_version):
+        other = Lap.objects.filter(session=create_session(drivers=1, laps=1, round_number=2)).first()
+        lap = Lap.objects.get(session=self.session)
+        with mock.patch("frontend.views.render_plot") as render_plot:
+            for driver_id, lap_id in ((other.driver_id, other.id), (lap.driver_id, lap.id + 100), (lap.driver_id + 100, lap.id)):
+                with self.subTest(driver_id=driver_id, lap_id=lap_id):
+                    url = reverse("plot_image", args=["telemetry", "telemetry_plot", 2024, self.session.id, driver_id, lap_id])
+                    self.assertEqual(self.client.get(url).status_code, 404)
+
+        render_plot.assert_not_called()
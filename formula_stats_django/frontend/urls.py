@@ -12,5 +12,7 @@ urlpatterns = [
     path("get-sessions/<int:event_id>/", views.get_sessions, name="get_sessions"),
     path("ajax/get-drivers/<int:session_id>/", views.get_drivers, name="get_drivers"),
     path("ajax/get-laps/<int:session_id>/<int:driver_id>/", views.get_laps, name="get_laps"),
+    path("plots/<slug:visual>/<slug:plot>/<int:year>/<int:session_id>.png", views.plot_image, name="plot_image"),
+    path("plots/<slug:visual>/<slug:plot>/<int:year>/<int:session_id>/<int:driver_id>/<int:lap_id>.png", views.plot_image, name="plot_image"),
 
 ]
\ No newline at end of file
@@ -1,6 +1,11 @@
-from django.shortcuts import render
-from django.http import JsonResponse
-from django.views.decorators.http import require_GET
+import hashlib
+
+from django.conf import settings
+from django.shortcuts import render, get_object_or_404
+from django.http import Http404, HttpResponse, JsonResponse
+from django.urls import reverse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET
 
 from static_data.models import Season, Event, Session, Driver, Lap
 
@@ -10,6 +15,20 @@ from static_visuals.plotting.driver_pace_lap_times import DriverLapVisuals
 from static_visuals.plotting.tyres import TyreVisuals
 from static_visuals.plotting.telemetry import TelemetryVisuals
 from static_visuals.plotting.performance import PerformanceVisuals
+from static_visuals.plotting.plot_cache import plot_cache, plot_cache_key, render_plot, render_plots
+
+
+# Visual of every plot image URL, /plots/<visual>/<plot>/<year>/<session>.png
+PLOT_VISUALS = {
+    "team_pace": TeamLapVisuals,
+    "driver_pace": DriverLapVisuals,
+    "weather": WeatherVisuals,
+    "tyres": TyreVisuals,
+    "telemetry": TelemetryVisuals,
+    "performance": PerformanceVisuals,
+}
+# Visuals of a single lap, their URLs end in /<driver>/<lap>.png
+LAP_VISUALS = {"telemetry"}
 
 
 def home(request):
@@ -86,28 +105,29 @@ def analysis(request):
                 )
                 
             try:
+                # Visual and its arguments besides the year, event and session
+                visual_args = ()
                 if selected_visual == "Team Pace/Lap Times":
-                    plotter = TeamLapVisuals(selected_year, selected_event_id, selected_session_id)
+                    visual = "team_pace"
                 elif selected_visual == "Drivers Pace/Lap Times":
-                    plotter = DriverLapVisuals(selected_year, selected_event_id, selected_session_id)
+                    visual = "driver_pace"
                 elif selected_visual == "Weather Data":
-                    plotter = WeatherVisuals(selected_year, selected_event_id, selected_session_id)
+                    visual = "weather"
                 elif selected_visual == "Tyres":
-                    plotter = TyreVisuals(selected_year, selected_event_id, selected_session_id)
+                    visual = "tyres"
                 elif selected_visual == "Telemetry":
-                    plotter = TelemetryVisuals(
-                        selected_year, selected_event_id, selected_session_id, selected_driver_id, selected_lap_id)
+                    visual = "telemetry"
+                    visual_args = (selected_driver_id, selected_lap_id)
                 elif selected_visual == 'Performance':
-                    plotter = PerformanceVisuals(selected_year, selected_event_id, selected_session_id)
+                    visual = "performance"
                 else:
-                    plotter = None
+                    visual = None
 
-                if plotter:
-                    for method_name in plotter.PLOT_METHODS:
-                        method = getattr(plotter, method_name)
-                        plot = method()
-                        plots.append(plot)
-                        selected_visual_names.append(method.plot_name)
+                if visual:
+                    # Plots missing from the cache are rendered here, the page only links to their images
+                    for name in render_plots(PLOT_VISUALS[visual], selected_year, selected_event_id, selected_session_id, *visual_args):
+                        plots.append(plot_url(visual, name, selected_year, selected_session_id, *visual_args))
+                        selected_visual_names.append(name)
 
             except Exception as e:
                 print(f"Error while generating plots: {e}")
@@ -165,6 +185,59 @@ def get_laps(request, session_id, driver_id):
     return JsonResponse({"laps": list(laps)})
 
 
+def plot_url(visual: str, plot: str, year: int, session_id: int, *args) -> str:
+    """URL of a plot image, versioned so an import into the season or a new plot style changes it."""
+    path = reverse("plot_image", args=(visual, plot, year, session_id, *args))
+    return f"{path}?v={_plot_etag(PLOT_VISUALS[visual], plot, year, session_id, *args)[:12]}"
+
+
+def _plot_etag(visual_cls, plot: str, year: int, session_id: int, *args) -> str:
+    return hashlib.sha1(plot_cache_key(visual_cls.__name__, plot, year, session_id, *args).encode()).hexdigest()
+
+
+def _plot_visual(visual: str, plot: str, args: tuple):
+    # Unknown visuals and plots, and lap arguments on the wrong visuals, are not found
+    visual_cls = PLOT_VISUALS.get(visual)
+    if visual_cls is None or plot not in visual_cls.PLOT_METHODS or bool(args) != (visual in LAP_VISUALS):
+        raise Http404(f"No plot {visual}/{plot}")
+    return visual_cls
+
+
+def _lap_args(driver_id: int | None, lap_id: int | None) -> tuple:
+    return () if driver_id is None else (driver_id, lap_id)
+
+
+def plot_etag(request, visual, plot, year, session_id, driver_id=None, lap_id=None):
+    args = _lap_args(driver_id, lap_id)
+    return _plot_etag(_plot_visual(visual, plot, args), plot, year, session_id, *args)
+
+
+@require_GET
+@cache_control(public=True, max_age=settings.PLOT_IMAGE_MAX_AGE)
+@condition(etag_func=plot_etag)
+def plot_image(request, visual, plot, year, session_id, driver_id=None, lap_id=None):
+    """A plot as a PNG image, served from the plot cache and rendered on a miss.
+
+    Answered with 304 Not Modified when the browser's ETag is still current, and with
+    404 Not Found (without the caching headers) when the visual has nothing to plot.
+    """
+    args = _lap_args(driver_id, lap_id)
+    visual_cls = _plot_visual(visual, plot, args)
+
+    png = plot_cache.get(plot_cache_key(visual_cls.__name__, plot, year, session_id, *args))
+    # Empty images cached before they were left out are rendered again
+    if not png:
+        session = get_object_or_404(Session.objects.select_related("event"), id=session_id, event__season_year=year)
+        # Only the laps of the session's drivers are rendered
+        if lap_id is not None and not Lap.objects.filter(id=lap_id, session_id=session_id, driver_id=driver_id).exists():
+            raise Http404(f"No lap {lap_id} of driver {driver_id} in session {session_id}")
+        png = render_plot(visual_cls, plot, year, session.event_id, session_id, *args)
+    if png is None:
+        raise Http404(f"Nothing to plot for {visual}/{plot} of session {session_id}")
+
+    return HttpResponse(png, content_type="image/png")
+
+
 def machine_learning(request):
     return render(request, "machine_learning.html")
 
@@ -4,7 +4,7 @@ from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder
 
 # Import your Django models
-from static_data.models import Lap, Weather, Session, Driver
+from static_data.models import Event, Lap, LapAggregate, Weather, Session, Driver
 
 class FastestLapPredictor:
     """
@@ -17,6 +17,7 @@ class FastestLapPredictor:
         year (int): The season year for the prediction.
         event_id (int): The ID of the event (race) for the prediction.
         model: The trained machine learning model (e.g., RandomForestRegressor).
+        driver_encoder (LabelEncoder | None): Driver ID -> model feature, set by `train`.
     """
 
     def __init__(self, year, event_id):
@@ -34,5 +35,73 @@ class FastestLapPredictor:
         self.event_id = int(event_id)
         self.model = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
         self.feature_names = []
+        self.driver_encoder = None
 
-    
\ No newline at end of file
+    def load_lap_features(self) -> pd.DataFrame:
+        """
+        Fetches the per lap training features of the season before the selected event.
+
+        The telemetry features come from the lap aggregates computed at import time,
+        one row per lap, instead of the raw telemetry samples. The laps of the selected
+        event itself are left out, their lap times are what is to be predicted.
+
+        Returns:
+            pd.DataFrame: One row per lap with its driver, event, lap time and
+                telemetry statistics, laps without a lap time left out.
+        """
+        round_number = Event.objects.get(id=self.event_id).round_number
+        aggregates = LapAggregate.objects.filter(
+            lap__session__event__season_year=self.year,
+            lap__session__event__round_number__lt=round_number,
+            lap__lap_time__isnull=False,
+        ).values(
+            "lap",
+            "lap__driver",
+            "lap__session__event",
+            "lap__lap_time",
+            "max_speed",
+            "mean_speed",
+            "min_speed",
+            "max_rpm",
+            "full_throttle_pct",
+            "braking_pct",
+            "drs_open_distance",
+            "gear_changes",
+        )
+
+        features_df = pd.DataFrame(aggregates).rename(columns={
+            "lap__driver": "driver",
+            "lap__session__event": "event",
+            "lap__lap_time": "lap_time",
+        })
+        self.feature_names = [
+            column for column in features_df.columns if column not in ("lap", "driver", "event", "lap_time")
+        ]
+        return features_df
+
+    def train(self, test_size: float = 0.2) -> float:
+        """
+        Trains the model on the laps of the season before the selected event.
+
+        Every lap is one sample: the driver (label encoded) and the lap's telemetry
+        aggregates are the features, its lap time the target.
+
+        Args:
+            test_size (float): Share of the laps held out to score the model.
+
+        Returns:
+            float: R² of the predicted lap times on the held out laps.
+        """
+        features_df = self.load_lap_features()
+        if features_df.empty:
+            raise ValueError(f"No laps with telemetry aggregates before event {self.event_id} of {self.year}.")
+
+        self.driver_encoder = LabelEncoder().fit(features_df["driver"])
+        features = features_df[self.feature_names].assign(driver=self.driver_encoder.transform(features_df["driver"]))
+        self.feature_names = list(features.columns)
+
+        X_train, X_test, y_train, y_test = train_test_split(
+            features, features_df["lap_time"], test_size=test_size, random_state=42
+        )
+        self.model.fit(X_train, y_train)
+        return self.model.score(X_test, y_test)
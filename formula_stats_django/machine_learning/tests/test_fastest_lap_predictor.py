@@ -0,0 +1,46 @@
+from django.test import TestCase
+
+from machine_learning.ml_models.fastest_lap_predictor import FastestLapPredictor
+from static_data.models import Lap, LapAggregate
+from static_data.tests.fixtures import create_session
+
+
+def aggregate_laps(session) -> None:
+    """Gives every lap of a session aggregates that follow its lap time."""
+    LapAggregate.objects.bulk_create([
+        LapAggregate(
+            lap=lap, samples=100, max_speed=330.0, mean_speed=300000.0 / lap.lap_time * 90, min_speed=90.0,
+            max_rpm=12000.0, full_throttle_pct=70.0, braking_pct=15.0, drs_open_distance=800.0, gear_changes=40
+        )
+        for lap in Lap.objects.filter(session=session)
+    ])
+
+
+class FastestLapPredictorTests(TestCase):
+
+    def setUp(self):
+        self.first_race = create_session(laps=10, round_number=1)
+        self.second_race = create_session(laps=10, round_number=2)
+        aggregate_laps(self.first_race)
+        aggregate_laps(self.second_race)
+
+    def test_features_leave_out_the_selected_event(self):
+        features_df = FastestLapPredictor(2024, self.second_race.event_id).load_lap_features()
+
+        self.assertEqual(set(features_df["event"]), {self.first_race.event_id})
+        self.assertEqual(len(features_df), 20)
+
+    def test_no_features_before_the_first_event(self):
+        predictor = FastestLapPredictor(2024, self.first_race.event_id)
+
+        self.assertTrue(predictor.load_lap_features().empty)
+        with self.assertRaises(ValueError):
+            predictor.train()
+
+    def test_trains_on_the_earlier_laps(self):
+        predictor = FastestLapPredictor(2024, self.second_race.event_id)
+        score = predictor.train(test_size=0.25)
+
+        self.assertIn("mean_speed", predictor.feature_names)
+        self.assertIn("driver", predictor.feature_names)
+        self.assertGreater(score, 0.5)
@@ -0,0 +1,179 @@
+import numpy as np
+import pandas as pd
+from django.core.exceptions import EmptyResultSet
+
+from static_data.models import Telemetry, CarData, PositionData, Lap, Weather
+
+
+# Rows fetched from the cursor per round trip, and the initial capacity of the arrays
+# when the database does not report the number of rows up front
+CHUNK_SIZE = 10000
+
+INTEGER_FIELD_TYPES = (
+    "IntegerField", "SmallIntegerField", "BigIntegerField", "PositiveIntegerField",
+    "PositiveSmallIntegerField", "AutoField", "BigAutoField", "SmallAutoField"
+)
+
+# Columns fetched when none are selected, the ones the visuals read
+DEFAULT_COLUMNS = {
+    Telemetry: ["lap", "time", "speed", "rpm", "n_gear", "throttle", "brake", "drs", "distance", "x", "y"],
+    CarData: ["lap", "time", "speed", "rpm", "gear", "throttle", "brake", "drs"],
+    PositionData: ["lap", "time", "x", "y", "z"],
+    Lap: ["id", "driver", "lap_number", "lap_time", "compound"],
+    Weather: ["time_delta", "air_temp", "track_temp", "rainfall", "humidity", "air_pressure", "wind_speed", "wind_direction"],
+}
+
+# Narrower dtypes for the sample channels, e.g. `fetch_frame(qs, dtypes=NARROW_DTYPES[Telemetry])`
+NARROW_DTYPES = {
+    Telemetry: {"time": "int32", "speed": "float32", "rpm": "float32", "n_gear": "int8", "throttle": "float32",
+                "brake": "bool", "drs": "int8", "distance": "float32", "x": "float32", "y": "float32"},
+    CarData: {"time": "int32", "speed": "int16", "rpm": "int16", "gear": "int8", "throttle": "int16",
+              "brake": "bool", "drs": "int8"},
+    PositionData: {"time": "int32", "x": "int32", "y": "int32", "z": "int32"},
+    Lap: {"lap_number": "int16", "lap_time": "float64"},
+    Weather: {"time_delta": "int32", "air_temp": "float32", "track_temp": "float32", "humidity": "float32",
+              "air_pressure": "float32", "wind_speed": "float32", "wind_direction": "float32"},
+}
+
+
+def _default_dtype(field) -> np.dtype:
+    """NumPy dtype a model field is fetched as when no dtype is given.
+
+    Nullable integer and boolean fields are fetched as float64, so NULL becomes NaN
+    instead of a sentinel value.
+    """
+    internal_type = field.target_field.get_internal_type() if field.is_relation else field.get_internal_type()
+    if internal_type == "FloatField":
+        return np.dtype("float64")
+    if internal_type in INTEGER_FIELD_TYPES:
+        return np.dtype("float64" if field.null else "int64")
+    if internal_type == "BooleanField":
+        return np.dtype("float64" if field.null else "bool")
+    return np.dtype("object")
+
+
+def _fill(array: np.ndarray, start: int, values: tuple) -> np.ndarray | None:
+    """Copies one column of a chunk of rows into its preallocated array.
+
+    Returns:
+        np.ndarray | None: Which values of the chunk are NULL, for an integer or boolean
+        array that cannot hold them; None if there are none.
+    """
+    missing = None
+    if array.dtype.kind in "iub" and None in values:
+        missing = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+        sentinel = False if array.dtype.kind == "b" else -1
+        values = [sentinel if value is None else value for value in values]
+    # None becomes NaN in float arrays
+    array[start:start + len(values)] = values
+    return missing
+
+
+def fetch_arrays(queryset, columns: list[str] | None = None, dtypes: dict[str, str] | None = None) -> dict[str, np.ndarray]:
+    """Runs a queryset through a raw cursor into one NumPy array per column.
+
+    The rows are fetched in chunks and copied column by column into preallocated
+    arrays, without building a model instance or a dict per row. Numeric columns skip
+    Django's value converters entirely; the others (dates, durations, text) are
+    converted as usual and stored in object arrays.
+
+    Args:
+        queryset (QuerySet): Filtered queryset of `Telemetry`, `CarData`, `PositionData`,
+            `Lap`, `Weather` or any other model.
+        columns (list[str] | None): Fields to fetch (foreign keys as their ID), the
+            model's `DEFAULT_COLUMNS` by default.
+        dtypes (dict[str, str] | None): Field -> NumPy dtype overriding the default one,
+            e.g. `NARROW_DTYPES[Telemetry]`. Missing values are NaN in float arrays;
+            integer and boolean arrays with missing values are masked arrays, their
+            masked values are -1 and False.
+
+    Returns:
+        dict[str, np.ndarray]: Column -> array, in `columns` order.
+    """
+    model = queryset.model
+    columns = list(columns or DEFAULT_COLUMNS.get(model) or [field.name for field in model._meta.concrete_fields])
+    dtypes = dtypes or {}
+    column_dtypes = [np.dtype(dtypes[column]) if column in dtypes else _default_dtype(model._meta.get_field(column)) for column in columns]
+
+    compiler = queryset.values_list(*columns).query.get_compiler(using=queryset.db)
+    try:
+        sql, params = compiler.as_sql()
+    except EmptyResultSet:
+        return {column: np.empty(0, dtype=dtype) for column, dtype in zip(columns, column_dtypes)}
+    # Only the columns that end up in object arrays need Django's converters
+    converters = {
+        position: converter
+        for position, converter in compiler.get_converters([expression for expression, _, _ in compiler.select]).items()
+        if column_dtypes[position].kind == "O"
+    }
+
+    with compiler.connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        # PostgreSQL reports the number of rows of a SELECT up front, the arrays are then
+        # allocated once; elsewhere they start at one chunk and grow
+        capacity = cursor.rowcount if cursor.rowcount > 0 else CHUNK_SIZE
+        arrays = [np.empty(capacity, dtype=dtype) for dtype in column_dtypes]
+        # Allocated for a column once its first NULL shows up
+        masks = [None] * len(columns)
+        length = 0
+
+        while chunk := cursor.fetchmany(CHUNK_SIZE):
+            if converters:
+                chunk = list(compiler.apply_converters(chunk, converters))
+
+            # Grow geometrically, so the number of copies stays logarithmic in the rows
+            if length + len(chunk) > capacity:
+                capacity = max(capacity * 2, length + len(chunk))
+                arrays = [np.resize(array, capacity) for array in arrays]
+                masks = [None if mask is None else np.concatenate([mask, np.zeros(capacity - len(mask), dtype=bool)]) for mask in masks]
+
+            for position, (array, values) in enumerate(zip(arrays, zip(*chunk))):
+                missing = _fill(array, length, values)
+                if missing is not None:
+                    if masks[position] is None:
+                        masks[position] = np.zeros(capacity, dtype=bool)
+                    masks[position][length:length + len(missing)] = missing
+            length += len(chunk)
+
+    return {
+        column: array[:length] if mask is None else np.ma.MaskedArray(array[:length], mask[:length])
+        for column, array, mask in zip(columns, arrays, masks)
+    }
+
+
+def frame_from_arrays(arrays: dict[str, np.ndarray]) -> pd.DataFrame:
+    """A DataFrame of column arrays, e.g. from `fetch_arrays` or `LapTelemetry.arrays`.
+
+    Masked integer and boolean arrays become pandas' nullable Int and boolean columns,
+    so their missing values are NA instead of the -1 or False underneath; the other
+    arrays are used as they are, without copying them.
+
+    Args:
+        arrays (dict[str, np.ndarray]): Column -> array, all of the same length.
+
+    Returns:
+        pd.DataFrame: One column per array.
+    """
+    columns = {}
+    for column, array in arrays.items():
+        if isinstance(array, np.ma.MaskedArray):
+            mask = np.ma.getmaskarray(array)
+            array = pd.arrays.BooleanArray(array.data, mask) if array.dtype.kind == "b" else pd.arrays.IntegerArray(array.data, mask)
+        columns[column] = array
+    return pd.DataFrame(columns, copy=False)
+
+
+def fetch_frame(queryset, columns: list[str] | None = None, dtypes: dict[str, str] | None = None) -> pd.DataFrame:
+    """`fetch_arrays` as a DataFrame, one column per array without copying the rows again.
+
+    Args:
+        queryset (QuerySet): Filtered queryset.
+        columns (list[str] | None): Fields to fetch, see `fetch_arrays`.
+        dtypes (dict[str, str] | None): Field -> NumPy dtype, see `fetch_arrays`.
+
+    Returns:
+        pd.DataFrame: One row per database row, empty (with the columns) if none matched.
+        Narrowed integer and boolean columns with missing values are nullable, see
+        `frame_from_arrays`.
+    """
+    return frame_from_arrays(fetch_arrays(queryset, columns, dtypes))
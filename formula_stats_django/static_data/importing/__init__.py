@@ -0,0 +1,8 @@
+"""
+Helpers used by the `import_fastf1_data` management command.
+
+The command itself stays responsible for talking to FastF1 and deciding what gets
+imported; the modules in this package hold the reusable, session-independent pieces
+(DataFrame conversion, database loaders, lookup maps) so they can be benchmarked and
+reused on their own.
+"""
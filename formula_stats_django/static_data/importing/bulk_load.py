@@ -0,0 +1,119 @@
+from django.db import connection, transaction
+
+from static_data.models import Telemetry, CarData, PositionData
+
+
+# Tables whose natural key constraint and lap index are deferred while bulk loading
+SAMPLE_MODELS = (Telemetry, CarData, PositionData)
+
+
+def _existing_structures(model) -> set[str]:
+    with connection.cursor() as cursor:
+        return set(connection.introspection.get_constraints(cursor, model._meta.db_table))
+
+
+def deferred_structures(model) -> list:
+    """The unique constraints and indexes of a sample table, as declared on the model."""
+    return [*model._meta.constraints, *model._meta.indexes]
+
+
+def missing_structures(models=SAMPLE_MODELS) -> list[str]:
+    """Names of the deferred structures that are not in the database.
+
+    Anything missing means a bulk load was started and not finished; the structures
+    themselves are the state of the bulk load, there is nothing else to keep in sync.
+    """
+    missing = []
+    for model in models:
+        existing = _existing_structures(model)
+        missing.extend(structure.name for structure in deferred_structures(model) if structure.name not in existing)
+    return missing
+
+
+def begin_bulk_load(models=SAMPLE_MODELS) -> list[str]:
+    """Drops the natural key constraints and lap indexes of the sample tables.
+
+    Safe to call again on an interrupted bulk load, structures that are already gone
+    are skipped.
+
+    Returns:
+        list[str]: Names of the structures dropped by this call.
+    """
+    dropped = []
+    for model in models:
+        existing = _existing_structures(model)
+        with connection.schema_editor() as editor:
+            for constraint in model._meta.constraints:
+                if constraint.name in existing:
+                    editor.remove_constraint(model, constraint)
+                    dropped.append(constraint.name)
+            for index in model._meta.indexes:
+                if index.name in existing:
+                    editor.remove_index(model, index)
+                    dropped.append(index.name)
+    return dropped
+
+
+def _delete_duplicates(model, constraint) -> int:
+    """Deletes all but the newest row of every duplicated natural key.
+
+    The newest row is the last one loaded, which is what the upsert of the regular
+    import would have kept.
+    """
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    primary_key = quote(model._meta.pk.column)
+    matches = " AND ".join(
+        f"older.{column} = newer.{column}"
+        for column in (quote(model._meta.get_field(field).column) for field in constraint.fields)
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {table} AS older USING {table} AS newer "
+            f"WHERE {matches} AND older.{primary_key} < newer.{primary_key}"
+        )
+        return cursor.rowcount
+
+
+def finish_bulk_load(models=SAMPLE_MODELS) -> dict[str, int]:
+    """Rebuilds and validates the structures dropped by `begin_bulk_load`.
+
+    Every table is rebuilt in one pass: the lap index first, so it is built from the
+    loaded data in a single sort, then duplicated samples (from sessions loaded more
+    than once) are removed and the unique constraint is added, which validates that no
+    duplicates are left. Each table is committed on its own, so an interrupted rebuild
+    picks up at the first structure that is still missing.
+
+    Returns:
+        dict[str, int]: Table name -> duplicated rows removed.
+
+    Raises:
+        RuntimeError: If a structure is still missing afterwards.
+    """
+    removed = {}
+    for model in models:
+        existing = _existing_structures(model)
+        table = model._meta.db_table
+
+        with connection.schema_editor() as editor:
+            for index in model._meta.indexes:
+                if index.name not in existing:
+                    editor.add_index(model, index)
+
+        for constraint in model._meta.constraints:
+            if constraint.name in existing:
+                continue
+            with transaction.atomic():
+                removed[table] = removed.get(table, 0) + _delete_duplicates(model, constraint)
+                with connection.schema_editor() as editor:
+                    editor.add_constraint(model, constraint)
+
+        # Fresh planner statistics for a table that just grew by millions of rows
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {connection.ops.quote_name(table)}")
+
+    missing = missing_structures(models)
+    if missing:
+        raise RuntimeError(f"Bulk load could not rebuild {', '.join(missing)}")
+    return removed
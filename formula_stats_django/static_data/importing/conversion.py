@@ -0,0 +1,321 @@
+import numpy as np
+import pandas as pd
+from django.utils.timezone import get_current_timezone
+
+
+# FastF1 column -> model field for the value columns of the sample level tables.
+# Date, SessionTime and Time are shared by all three and converted separately.
+POS_DATA_COLUMNS = {
+    "Status": "status",
+    "X": "x",
+    "Y": "y",
+    "Z": "z",
+    "Source": "source",
+}
+
+CAR_DATA_COLUMNS = {
+    "Speed": "speed",
+    "RPM": "rpm",
+    "nGear": "gear",
+    "Throttle": "throttle",
+    "Brake": "brake",
+    "DRS": "drs",
+    "Source": "source",
+}
+
+TELEMETRY_COLUMNS = {
+    "RPM": "rpm",
+    "Speed": "speed",
+    "nGear": "n_gear",
+    "Throttle": "throttle",
+    "Brake": "brake",
+    "DRS": "drs",
+    "Source": "source",
+    "Status": "status",
+    "X": "x",
+    "Y": "y",
+    "Z": "z",
+    "DifferentialDistance": "differential_distance",
+    "Distance": "distance",
+    "DriverAhead": "driver_ahead",
+    "DistanceToDriverAhead": "distance_to_driver_ahead",
+    "RelativeDistance": "relative_distance",
+}
+
+
+# FastF1 column -> channel of the packed per lap telemetry (`LapTelemetry`)
+PACKED_TELEMETRY_COLUMNS = {
+    "Time": "time",
+    "Speed": "speed",
+    "RPM": "rpm",
+    "nGear": "n_gear",
+    "Throttle": "throttle",
+    "Brake": "brake",
+    "DRS": "drs",
+    "Distance": "distance",
+    "X": "x",
+    "Y": "y",
+}
+
+
+# Session level tables: FastF1 column -> model field, split by how the column is converted
+LAP_COLUMNS = {
+    "LapNumber": "lap_number",
+    "Stint": "stint",
+    "SpeedI1": "speed_i1",
+    "SpeedI2": "speed_i2",
+    "SpeedFL": "speed_fl",
+    "SpeedST": "speed_st",
+    "Compound": "compound",
+    "TyreLife": "tyre_life",
+    "TrackStatus": "track_status",
+    "Position": "position",
+    "DeletedReason": "deleted_reason",
+}
+
+LAP_DURATION_COLUMNS = {
+    "LapTime": "lap_time",
+    "PitOutTime": "pit_out_time",
+    "PitInTime": "pit_in_time",
+    "Sector1Time": "sector_1_time",
+    "Sector2Time": "sector_2_time",
+    "Sector3Time": "sector_3_time",
+    "Sector1SessionTime": "sector_1_session_time",
+    "Sector2SessionTime": "sector_2_session_time",
+    "Sector3SessionTime": "sector_3_session_time",
+}
+
+LAP_FLAG_COLUMNS = {
+    "IsPersonalBest": "is_personal_best",
+    "FreshTyre": "fresh_tyre",
+    "Deleted": "deleted",
+    "FastF1Generated": "fastf1_generated",
+    "IsAccurate": "is_accurate",
+}
+
+RESULT_COLUMNS = {
+    "Position": "position",
+    "ClassifiedPosition": "classified_position",
+    "GridPosition": "grid_position",
+    "Status": "status",
+    "Points": "points",
+}
+
+RESULT_DURATION_COLUMNS = {
+    "Q1": "q1",
+    "Q2": "q2",
+    "Q3": "q3",
+    "Time": "time",
+}
+
+WEATHER_COLUMNS = {
+    "AirTemp": "air_temp",
+    "TrackTemp": "track_temp",
+    "Rainfall": "rainfall",
+    "Humidity": "humidity",
+    "Pressure": "air_pressure",
+    "WindSpeed": "wind_speed",
+    "WindDirection": "wind_direction",
+}
+
+RACE_CONTROL_MESSAGE_COLUMNS = {
+    "Lap": "lap",
+    "Category": "category",
+    "Message": "message",
+    "Status": "status",
+    "Flag": "flag",
+    "Scope": "scope",
+    "Sector": "sector",
+}
+
+
+def _nullable(values: pd.Series) -> list:
+    """Turn a Series into a list of Python scalars with missing values as None."""
+    return values.astype(object).where(values.notna(), None).tolist()
+
+
+def aware_dates(dates: pd.Series, tz=None) -> list:
+    """Converts a Date column into timezone aware datetimes.
+
+    Naive timestamps are localised to `tz` (the current Django timezone by default),
+    which is what `make_aware` did for each sample individually.
+
+    Args:
+        dates (pd.Series): The FastF1 `Date` column.
+        tz: Timezone of naive timestamps.
+
+    Returns:
+        list: Aware datetimes, None where the date is missing.
+    """
+    dates = pd.to_datetime(dates)
+    if dates.dt.tz is None:
+        dates = dates.dt.tz_localize(tz or get_current_timezone())
+    return _nullable(dates)
+
+
+def _timedeltas(durations: pd.Series) -> pd.Series:
+    """A duration column as timedelta64, also when it has no values at all.
+
+    FastF1 types a column without any value by what it held in other sessions, e.g.
+    datetime64 or object of NaT; to_timedelta refuses datetime64 even with
+    `errors="coerce"`.
+    """
+    if pd.api.types.is_datetime64_any_dtype(durations) and durations.isna().all():
+        return pd.Series(pd.NaT, index=durations.index, dtype="timedelta64[ns]")
+    return pd.to_timedelta(durations, errors="coerce")
+
+
+def to_timedeltas(durations: pd.Series) -> list:
+    """Converts a timedelta column into `datetime.timedelta` objects (None for NaT)."""
+    return _timedeltas(durations).to_numpy(dtype="timedelta64[us]").astype(object).tolist()
+
+
+def to_milliseconds(durations: pd.Series) -> list:
+    """Converts a timedelta column into whole milliseconds (None for NaT).
+
+    Truncated like the integer fields truncate `total_seconds() * 1000`, so the values
+    match the row by row import to the millisecond.
+    """
+    milliseconds = np.trunc(_timedeltas(durations).dt.total_seconds() * 1000).astype("Int64")
+    return _nullable(milliseconds)
+
+
+def convert_samples(samples: pd.DataFrame, columns: dict[str, str]) -> dict[str, list]:
+    """Converts a FastF1 sample frame into model field values one column at a time.
+
+    Every column is converted with a single pandas/NumPy operation instead of
+    looping over the rows, so the cost per sample is a fraction of `iterrows`.
+
+    Args:
+        samples (pd.DataFrame): Position, car or merged telemetry data.
+        columns (dict[str, str]): FastF1 column -> model field for the value columns.
+
+    Returns:
+        dict[str, list]: Model field -> list of values, all lists of equal length.
+    """
+    converted = {
+        "date": aware_dates(samples["Date"]),
+        "session_time": to_timedeltas(samples["SessionTime"]),
+        "time": to_milliseconds(samples["Time"]),
+    }
+    for column, field in columns.items():
+        converted[field] = _nullable(samples[column])
+
+    return converted
+
+
+def pack_samples(samples: pd.DataFrame, columns: dict[str, str], dtypes: dict[str, str]) -> dict:
+    """Packs the samples of one lap into one little-endian array per channel.
+
+    Args:
+        samples (pd.DataFrame): Merged telemetry of one lap.
+        columns (dict[str, str]): FastF1 column -> channel, e.g. `PACKED_TELEMETRY_COLUMNS`.
+        dtypes (dict[str, str]): Channel -> NumPy dtype of its array, e.g. `LapTelemetry.CHANNELS`.
+
+    Returns:
+        dict: Channel -> packed bytes, plus "samples" (the number of samples). Missing
+        values are NaN in float channels and -1 in integer channels, durations are
+        whole milliseconds.
+    """
+    packed = {"samples": len(samples)}
+    for column, channel in columns.items():
+        values = samples[column]
+        if pd.api.types.is_timedelta64_dtype(values):
+            values = values.dt.total_seconds() * 1000
+        values = pd.to_numeric(values, errors="coerce").astype("float64").to_numpy()
+
+        dtype = np.dtype(dtypes[channel])
+        if dtype.kind in "iu":
+            values = np.where(np.isnan(values), -1, np.round(values))
+        packed[channel] = values.astype(dtype).tobytes()
+
+    return packed
+
+
+def _channel(samples: pd.DataFrame, column: str) -> np.ndarray:
+    return pd.to_numeric(samples[column], errors="coerce").astype("float64").to_numpy()
+
+
+def _statistic(function, values: np.ndarray) -> float | None:
+    values = values[~np.isnan(values)]
+    return float(function(values)) if len(values) else None
+
+
+def aggregate_samples(samples: pd.DataFrame) -> dict:
+    """Computes the per lap statistics stored in `LapAggregate`.
+
+    Args:
+        samples (pd.DataFrame): Merged telemetry of one lap.
+
+    Returns:
+        dict: `LapAggregate` field -> value. Statistics of a channel without any valid
+        sample are None.
+    """
+    speed = _channel(samples, "Speed")
+    throttle = _channel(samples, "Throttle")
+    brake = _channel(samples, "Brake")
+    drs = _channel(samples, "DRS")
+    distance = _channel(samples, "Distance")
+    gears = _channel(samples, "nGear")
+    gears = gears[~np.isnan(gears)]
+
+    # Every distance step is credited to the DRS state of the sample it ends at
+    # (10, 12 and 14 are the open flap codes, see `drs_to_boolean`)
+    steps = np.diff(distance, prepend=distance[0] if len(distance) else np.nan)
+    drs_open = np.isin(drs, (10, 12, 14)) & ~np.isnan(steps)
+
+    return {
+        "samples": len(samples),
+        "max_speed": _statistic(np.max, speed),
+        "mean_speed": _statistic(np.mean, speed),
+        "min_speed": _statistic(np.min, speed),
+        "max_rpm": _statistic(np.max, _channel(samples, "RPM")),
+        # FastF1 reports full throttle as 100 and occasionally slightly above
+        "full_throttle_pct": _statistic(lambda values: np.mean(values >= 99) * 100, throttle),
+        "braking_pct": _statistic(lambda values: np.mean(values > 0) * 100, brake),
+        "drs_open_distance": float(steps[drs_open].sum()) if not np.isnan(distance).all() else None,
+        "gear_changes": int(np.count_nonzero(np.diff(gears))),
+    }
+
+
+def convert_frame(
+        frame: pd.DataFrame,
+        columns: dict[str, str] | None = None,
+        durations: dict[str, str] | None = None,
+        flags: dict[str, str] | None = None
+    ) -> dict[str, list]:
+    """Converts a session level frame (laps, results, weather, ...) one column at a time.
+
+    Args:
+        frame (pd.DataFrame): The FastF1 frame.
+        columns (dict[str, str]): Columns copied as they are, missing values become None.
+        durations (dict[str, str]): Timedelta columns stored as milliseconds.
+        flags (dict[str, str]): Boolean columns, missing values become False.
+
+    Returns:
+        dict[str, list]: Model field -> list of values, all lists of equal length.
+    """
+    converted = {}
+    for column, field in (columns or {}).items():
+        converted[field] = _nullable(frame[column])
+    for column, field in (durations or {}).items():
+        converted[field] = to_milliseconds(frame[column])
+    for column, field in (flags or {}).items():
+        converted[field] = frame[column].astype("boolean").fillna(False).astype(bool).tolist()
+
+    return converted
+
+
+def build_instances(model, converted: dict[str, list], **fixed) -> list:
+    """Creates unsaved model instances from converted columns.
+
+    Args:
+        model: The model class.
+        converted (dict[str, list]): Output of `convert_samples` or `convert_frame`.
+        **fixed: Values shared by every instance, e.g. `lap_id` or `session_id`.
+
+    Returns:
+        list: Model instances ready for `bulk_create`.
+    """
+    fields = list(converted)
+    return [model(**fixed, **dict(zip(fields, values))) for values in zip(*converted.values())]
@@ -0,0 +1,204 @@
+import numpy as np
+import pandas as pd
+
+
+def _seconds(session_time) -> np.ndarray:
+    """SessionTime values as float seconds."""
+    return pd.to_timedelta(np.asarray(session_time)).to_numpy(dtype="timedelta64[ns]").astype("int64") / 1e9
+
+
+class _CarTrack:
+    """
+    Distance a car has covered over the session, and where its timed laps start and end.
+
+    Distance is integrated from Speed the way FastF1's `add_distance` does it, once for
+    the whole session; only the car's own samples and laps are kept.
+    """
+
+    def __init__(self, car_data: pd.DataFrame, laps: pd.DataFrame):
+        self.times = _seconds(car_data["SessionTime"])
+        speed = car_data["Speed"].to_numpy(dtype=float)
+        self.total = np.cumsum(speed / 3.6 * np.diff(self.times, prepend=self.times[0]))
+
+        laps = laps[laps["LapStartTime"].notna() & laps["Time"].notna()].sort_values("LapStartTime")
+        self.located = not laps.empty and len(self.times) >= 2
+        if not self.located:
+            return
+
+        self.starts = _seconds(laps["LapStartTime"])
+        self.ends = _seconds(laps["Time"])
+        self.start_distance = np.interp(self.starts, self.times, self.total)
+        self.lap_lengths = np.where(
+            (self.starts >= self.times[0]) & (self.ends <= self.times[-1]),
+            np.interp(self.ends, self.times, self.total) - self.start_distance,
+            np.nan,
+        )
+        self.lap_numbers = laps["LapNumber"].to_numpy(dtype=float)
+
+    def at(self, grid: np.ndarray, previous: np.ndarray) -> dict[str, np.ndarray]:
+        """Where the car is on track at the given grid times.
+
+        Args:
+            grid (np.ndarray): Grid times in seconds.
+            previous (np.ndarray): The grid time before each of them, NaN for the first
+                one; a car that covered no distance since then is not moving.
+
+        Returns:
+            dict[str, np.ndarray]: "position" (meters into the current lap), "lap" (lap
+            number) and "lap_length" (length of the current lap, NaN if the lap is not fully
+            covered by car data) per grid time, NaN when the car is not on a timed lap or not
+            moving.
+        """
+        if not self.located:
+            empty = np.full(len(grid), np.nan)
+            return {"position": empty, "lap": empty, "lap_length": empty}
+
+        lap = (np.searchsorted(self.starts, grid, side="right") - 1).clip(0)
+        on_lap = (grid >= self.starts[0]) & (grid <= self.ends[lap])
+
+        total = np.interp(grid, self.times, self.total, left=np.nan, right=np.nan)
+        positions = np.where(on_lap, total - self.start_distance[lap], np.nan)
+        # A car that does not move (stopped, retired, no data) is nobody's car ahead
+        moved = total - np.interp(previous, self.times, self.total, left=np.nan, right=np.nan)
+        positions[~(moved > 0)] = np.nan
+        off_track = np.isnan(positions)
+
+        return {
+            "position": positions,
+            "lap": np.where(off_track, np.nan, self.lap_numbers[lap]),
+            "lap_length": np.where(off_track, np.nan, self.lap_lengths[lap]),
+        }
+
+
+def _median(values: np.ndarray, counts: np.ndarray) -> float:
+    """Median of sorted distinct values, each repeated `counts` times."""
+    total = counts.sum()
+    if not total:
+        return np.nan
+    bounds = np.cumsum(counts)
+    middle = values[np.searchsorted(bounds, [(total - 1) // 2, total // 2], side="right")]
+    return float(middle[0]) if total % 2 else float((middle[0] + middle[1]) / 2)
+
+
+class DriverAheadGrid:
+    """
+    Driver ahead and distance to the driver ahead of every car, for a whole session.
+
+    Every car's position on track (distance since the start of its current lap) is taken
+    on one time grid shared by all cars, the union of their car data timestamps. Each
+    grid row is sorted by position: the car ahead of a car is the next one in the
+    sorted row (wrapping around the finish line) unless that car is really right behind
+    it on an earlier lap, and the gap is the difference in position, plus the rest of
+    the lap when the car ahead is across the line. This replaces FastF1's `add_driver_ahead`, which compares a
+    single lap against every other car's stream and runs once per lap.
+
+    Only the grid times and each car's own distance are kept; the rows are evaluated
+    when a lap's samples are looked up, for the grid times around those samples, so
+    memory stays independent of the number of grid times times cars.
+
+    Attributes:
+        drivers (list[str]): Racing numbers of the cars on the grid, in column order.
+        session_time (np.ndarray): Grid times in seconds.
+        lap_length (float): Median length of a timed lap in meters.
+    """
+
+    def __init__(self, session):
+        self.drivers = [
+            driver for driver in session.drivers
+            if driver in session.car_data and not session.laps.pick_drivers(driver).empty
+        ]
+        self.session_time = np.unique(np.concatenate(
+            [_seconds(session.car_data[driver]["SessionTime"]) for driver in self.drivers] or [np.zeros(0)]
+        ))
+        self._cars = [_CarTrack(session.car_data[driver], session.laps.pick_drivers(driver)) for driver in self.drivers]
+        self._columns = {driver: column for column, driver in enumerate(self.drivers)}
+
+        # Laps not fully covered by car data are taken to be of median length, the
+        # median of every car's lap length over the grid times it is on track
+        previous = np.concatenate([[np.nan], self.session_time[:-1]])
+        lengths = [np.unique(car.at(self.session_time, previous)["lap_length"], return_counts=True) for car in self._cars]
+        values = np.concatenate([values for values, _ in lengths] or [np.zeros(0)])
+        counts = np.concatenate([counts for _, counts in lengths] or [np.zeros(0, dtype=int)])
+        located = ~np.isnan(values)
+        order = np.argsort(values[located], kind="stable")
+        self.lap_length = _median(values[located][order], counts[located][order])
+
+    def _rows(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Car ahead and distance to it of every car at the given grid rows."""
+        grid = self.session_time[rows]
+        previous = np.where(rows > 0, self.session_time[rows - 1], np.nan)
+
+        track = {channel: np.full((len(rows), len(self._cars)), np.nan) for channel in ("position", "lap", "lap_length")}
+        for column, car in enumerate(self._cars):
+            for channel, values in car.at(grid, previous).items():
+                track[channel][:, column] = values
+        track["lap_length"][np.isnan(track["lap_length"])] = self.lap_length
+
+        return self._cars_ahead(track["position"], track["lap"], track["lap_length"])
+
+    def _cars_ahead(self, positions: np.ndarray, laps: np.ndarray, lap_lengths: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Finds the next car on track for every car in every grid row at once."""
+        rows, cars = positions.shape
+        driver_ahead = np.full((rows, cars), -1, dtype=np.int16)
+        distance = np.full((rows, cars), np.nan)
+        if not rows or cars < 2:
+            return driver_ahead, distance
+
+        # Cars without a position sort last, `on_track` of them per row
+        order = np.argsort(positions, axis=1)
+        ordered = np.take_along_axis(positions, order, axis=1)
+        ordered_laps = np.take_along_axis(laps, order, axis=1)
+        ordered_lengths = np.take_along_axis(lap_lengths, order, axis=1)
+        on_track = np.count_nonzero(~np.isnan(positions), axis=1)[:, None]
+
+        rank = np.arange(cars)[None, :]
+        # The car in front of the last one in a row is the first one, across the finish line
+        next_rank = np.where(rank + 1 < on_track, rank + 1, 0)
+        next_position = np.take_along_axis(ordered, next_rank, axis=1)
+        across_line = next_position <= ordered
+        gap = np.where(across_line, ordered_lengths - ordered + next_position, next_position - ordered)
+
+        # A car further in the race is always ahead; one behind in the race (a lapped car)
+        # only if it is closer in front than behind, otherwise it is the car right behind
+        progress = (
+            np.take_along_axis(ordered_laps + ordered / ordered_lengths, next_rank, axis=1)
+            - (ordered_laps + ordered / ordered_lengths)
+        )
+        valid = (rank < on_track) & (on_track >= 2) & ((progress >= 0) | (gap <= ordered_lengths / 2))
+
+        ahead = np.where(valid, np.take_along_axis(order, next_rank, axis=1), -1)
+        gap = np.where(valid, gap, np.nan)
+
+        np.put_along_axis(driver_ahead, order, ahead.astype(np.int16), axis=1)
+        np.put_along_axis(distance, order, gap, axis=1)
+        return driver_ahead, distance
+
+    def lookup(self, driver: str, session_time: pd.Series) -> tuple[pd.Series, np.ndarray]:
+        """Returns the driver ahead and the distance to them at the given times.
+
+        Args:
+            driver (str): Racing number of the driver.
+            session_time (pd.Series): SessionTime of the driver's samples.
+
+        Returns:
+            tuple[pd.Series, np.ndarray]: Racing number of the car ahead (nullable
+            integers) from the last grid time at or before each sample, and the distance
+            to it interpolated between grid times.
+        """
+        times = _seconds(session_time)
+        column = self._columns.get(driver)
+        if column is None or not len(self.session_time) or not len(times):
+            return pd.Series(pd.NA, index=session_time.index, dtype="Int64"), np.full(len(times), np.nan)
+
+        # The grid rows at or before each sample and after it, to interpolate the distance
+        row = np.searchsorted(self.session_time, times, side="right") - 1
+        rows = np.unique(np.concatenate([row, row + 1]))
+        rows = rows[(rows >= 0) & (rows < len(self.session_time))]
+        cars_ahead, distances = self._rows(rows)
+
+        ahead = np.where(row >= 0, cars_ahead[np.searchsorted(rows, row).clip(0, len(rows) - 1), column], -1)
+
+        numbers = np.array([int(number) for number in self.drivers])
+        driver_ahead = pd.Series(numbers[ahead.clip(0)], index=session_time.index, dtype="Int64").where(ahead >= 0)
+        distance = np.interp(times, self.session_time[rows], distances[:, column], left=np.nan, right=np.nan)
+        return driver_ahead, distance
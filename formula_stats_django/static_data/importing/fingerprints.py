@@ -0,0 +1,79 @@
+import hashlib
+from typing import NamedTuple
+
+import pandas as pd
+
+
+# Tables the importer fingerprints, in the order they are populated
+FINGERPRINT_TABLES = ("results", "weather", "laps", "race_control_messages", "pos_data", "car_data", "telemetry", "lap_telemetry", "lap_aggregates")
+
+
+class Fingerprint(NamedTuple):
+    """Row count and content hash of the source frames behind one table."""
+    row_count: int
+    digest: str
+
+
+def _update_digest(digest, frame: pd.DataFrame) -> None:
+    """Feeds the column names and the content of a frame into a running hash."""
+    frame = pd.DataFrame(frame)
+    digest.update("\x1f".join(map(str, frame.columns)).encode())
+    try:
+        hashed = pd.util.hash_pandas_object(frame, index=False)
+    except TypeError:
+        # Unhashable cells (lists, dicts) are hashed through their string form
+        hashed = pd.util.hash_pandas_object(frame.astype(str), index=False)
+    digest.update(hashed.to_numpy().tobytes())
+
+
+def frame_fingerprint(*frames: pd.DataFrame) -> Fingerprint:
+    """Fingerprints one or more frames together.
+
+    Args:
+        *frames (pd.DataFrame): Source frames, order matters.
+
+    Returns:
+        Fingerprint: Total row count and SHA-256 of the frames.
+    """
+    digest = hashlib.sha256()
+    for frame in frames:
+        _update_digest(digest, frame)
+    return Fingerprint(sum(len(frame) for frame in frames), digest.hexdigest())
+
+
+def session_fingerprints(session, driver_ahead: bool = True) -> dict[str, Fingerprint]:
+    """Fingerprints the source data of every table the importer fills for a session.
+
+    The sample tables are fingerprinted from the session wide car and position streams
+    together with the laps they are split by, so their samples never need to be computed
+    to find out whether they changed.
+
+    Args:
+        session (fastf1.core.Session): A loaded FastF1 session.
+        driver_ahead (bool): Whether the telemetry is imported with its driver ahead
+            channels; importing it with and without them gives different fingerprints.
+
+    Returns:
+        dict[str, Fingerprint]: Table name (see `FINGERPRINT_TABLES`) -> fingerprint.
+    """
+    laps = pd.DataFrame(session.laps)
+    car_data = [session.car_data[driver] for driver in sorted(session.car_data)]
+    pos_data = [session.pos_data[driver] for driver in sorted(session.pos_data)]
+
+    # The packed lap telemetry and the lap aggregates have no driver ahead channels
+    lap_aggregates = lap_telemetry = telemetry = frame_fingerprint(laps, *car_data, *pos_data)
+    if not driver_ahead:
+        telemetry = Fingerprint(telemetry.row_count, hashlib.sha256(f"{telemetry.digest}:no-driver-ahead".encode()).hexdigest())
+
+    return {
+        "results": frame_fingerprint(session.results),
+        "weather": frame_fingerprint(session.weather_data),
+        "laps": frame_fingerprint(laps),
+        "race_control_messages": frame_fingerprint(session.race_control_messages),
+        "pos_data": frame_fingerprint(laps, *pos_data),
+        "car_data": frame_fingerprint(laps, *car_data),
+        "telemetry": telemetry,
+        "lap_telemetry": lap_telemetry,
+        "lap_aggregates": lap_aggregates,
+    }
+
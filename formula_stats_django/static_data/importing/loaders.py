@@ -0,0 +1,317 @@
+import csv
+import io
+from datetime import timedelta
+
+import psutil
+from django.db import connection, transaction
+
+from static_data.importing.conversion import build_instances
+from static_data.importing.profiling import ImportProfiler
+
+
+# Natural key shared by the sample level tables (Telemetry, CarData, PositionData),
+# led by the season they are partitioned by
+SAMPLE_UNIQUE_FIELDS = ["season_year", "lap", "date"]
+
+# Marker of a NULL value in the staged CSV. An unquoted empty field would be read as
+# NULL as well, which turns empty strings into NULLs unlike the bulk_create path
+COPY_NULL = "\\N"
+
+# FastF1 delivers most integer channels as floats; they are staged as double precision
+# and rounded by PostgreSQL's assignment cast on the way into the target table.
+INTEGER_FIELD_TYPES = ("IntegerField", "SmallIntegerField", "BigIntegerField")
+
+
+def _update_fields(batches: list) -> list[str]:
+    """Every converted field apart from the natural key is refreshed on conflict."""
+    _, converted = batches[0]
+    return [field for field in converted if field not in SAMPLE_UNIQUE_FIELDS]
+
+
+def _interval(value: timedelta | None) -> str | None:
+    """Formats a timedelta as a PostgreSQL interval literal without losing precision."""
+    if value is None:
+        return None
+    return f"{value // timedelta(microseconds=1)} microseconds"
+
+
+class BulkCreateLoader:
+    """
+    Loads sample batches with `bulk_create(update_conflicts=True)`.
+
+    Works on every database backend Django supports and is used whenever the COPY
+    loader is not available.
+
+    Attributes:
+        batch_size (int): Number of rows per INSERT statement.
+    """
+
+    def __init__(self, batch_size: int = 1000):
+        self.batch_size = batch_size
+
+    def load(self, model, batches: list, **fixed) -> int:
+        """Upserts the samples of a session.
+
+        Args:
+            model: `Telemetry`, `CarData` or `PositionData`.
+            batches (list): (lap_id, converted columns) pairs, one per lap.
+            **fixed: Field values shared by every sample, e.g. `season_year`.
+
+        Returns:
+            int: Number of rows sent to the database.
+        """
+        if not batches:
+            return 0
+
+        fixed = {model._meta.get_field(field).attname: value for field, value in fixed.items()}
+        instances = []
+        for lap_id, converted in batches:
+            instances.extend(build_instances(model, converted, lap_id=lap_id, **fixed))
+
+        model.objects.bulk_create(
+            instances,
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            update_fields=_update_fields(batches),
+            unique_fields=SAMPLE_UNIQUE_FIELDS
+        )
+        return len(instances)
+
+
+def _mark_nulls(column):
+    """Replaces the None values of a column with the COPY NULL marker.
+
+    Empty strings stay empty strings; numeric columns hold no None and are
+    returned as they are.
+    """
+    if getattr(column, "dtype", object) != object or None not in column:
+        return column
+    return [COPY_NULL if value is None else value for value in column]
+
+
+class PostgresCopyLoader:
+    """
+    Loads sample batches with PostgreSQL `COPY FROM STDIN`.
+
+    The samples are streamed into a temporary staging table with psycopg2's
+    `copy_expert` and merged into the target table with a single
+    `INSERT ... SELECT ... ON CONFLICT DO UPDATE`, instead of one INSERT statement
+    per thousand rows.
+
+    The staging table is dropped right after the merge, so a session can be flushed
+    several times within one transaction (a season import job, a bulk-load session,
+    a replay benchmark).
+    """
+
+    # Suffix of the staging table's name, distinct per loader class
+    staging_suffix = "_staging"
+
+    def load(self, model, batches: list, **fixed) -> int:
+        """Upserts the samples of a session.
+
+        Args:
+            model: `Telemetry`, `CarData` or `PositionData`.
+            batches (list): (lap_id, converted columns) pairs, one per lap.
+            **fixed: Field values shared by every sample, e.g. `season_year`.
+
+        Returns:
+            int: Number of rows copied into the staging table.
+        """
+        if not batches:
+            return 0
+
+        quote = connection.ops.quote_name
+        update_fields = _update_fields(batches)
+        fields = ["lap", *fixed, *batches[0][1]]
+
+        table = quote(model._meta.db_table)
+        staging = quote(f"{model._meta.db_table}{self.staging_suffix}")
+        columns = [quote(model._meta.get_field(field).column) for field in fields]
+        staging_columns = [
+            f"CAST({column} AS double precision) AS {column}"
+            if model._meta.get_field(field).get_internal_type() in INTEGER_FIELD_TYPES else column
+            for field, column in zip(fields, columns)
+        ]
+        key_columns = [quote(model._meta.get_field(field).column) for field in SAMPLE_UNIQUE_FIELDS]
+        update_columns = [quote(model._meta.get_field(field).column) for field in update_fields]
+
+        buffer, rows = self._to_csv(fields, batches, fixed)
+
+        column_list = ", ".join(columns)
+        key_list = ", ".join(key_columns)
+        update_list = ", ".join(f"{column} = EXCLUDED.{column}" for column in update_columns)
+
+        # ON COMMIT DROP only drops the staging table when the outermost transaction
+        # commits; an enclosing atomic block would still hold the previous flush's table
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {staging} ON COMMIT DROP AS "
+                f"SELECT {', '.join(staging_columns)} FROM {table} WITH NO DATA"
+            )
+            cursor.copy_expert(f"COPY {staging} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')", buffer)
+            cursor.execute(self._insert_sql(table, staging, column_list, key_list, update_list))
+            cursor.execute(f"DROP TABLE {staging}")
+
+        return rows
+
+    def _insert_sql(self, table: str, staging: str, column_list: str, key_list: str, update_list: str) -> str:
+        """Merges the staging table into the target table on the natural key."""
+        # DISTINCT ON keeps a duplicated (lap, date) sample from hitting the same row twice
+        return (
+            f"INSERT INTO {table} ({column_list}) "
+            f"SELECT DISTINCT ON ({key_list}) {column_list} FROM {staging} ORDER BY {key_list} "
+            f"ON CONFLICT ({key_list}) DO UPDATE SET {update_list}"
+        )
+
+    def _to_csv(self, fields: list[str], batches: list, fixed: dict) -> tuple[io.StringIO, int]:
+        """Writes the batches into an in-memory CSV buffer in `fields` order."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        rows = 0
+
+        for lap_id, converted in batches:
+            values = dict(converted)
+            if "session_time" in values:
+                values["session_time"] = [_interval(value) for value in values["session_time"]]
+            samples = len(values["date"])
+            values["lap"] = [lap_id] * samples
+            for field, value in fixed.items():
+                values[field] = [value] * samples
+
+            writer.writerows(zip(*(_mark_nulls(values[field]) for field in fields)))
+            rows += samples
+
+        buffer.seek(0)
+        return buffer, rows
+
+
+class PostgresBulkLoader(PostgresCopyLoader):
+    """
+    COPY loader for the bulk-load mode of `static_data.importing.bulk_load`.
+
+    The natural key constraint is dropped while bulk loading, so the staged samples
+    are appended without any conflict handling; duplicates are removed once, when the
+    constraint is rebuilt at the end of the load.
+    """
+
+    staging_suffix = "_bulk_staging"
+
+    def _insert_sql(self, table: str, staging: str, column_list: str, key_list: str, update_list: str) -> str:
+        return f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging}"
+
+
+class SampleBuffer:
+    """
+    Collects converted sample batches and hands them to a loader in bounded chunks.
+
+    Without a budget the whole session is buffered and written at the end; with one
+    the buffer is flushed as soon as it holds `flush_rows` samples, so peak memory no
+    longer grows with the length of the session.
+
+    Attributes:
+        model: `Telemetry`, `CarData` or `PositionData`.
+        loader: `PostgresCopyLoader` or `BulkCreateLoader`.
+        flush_rows (int | None): Row budget that triggers a flush, None to disable.
+        profiler (ImportProfiler | None): Profiler that times every write as the stage
+            "write:<table>".
+        fixed (dict): Field values shared by every sample, passed on to the loader.
+        rows_written (int): Rows handed to the loader so far.
+        peak_rss (int): Highest resident set size (bytes) seen while buffering.
+    """
+
+    def __init__(self, model, loader, flush_rows: int | None = None, profiler=None, **fixed):
+        self.model = model
+        self.loader = loader
+        self.flush_rows = flush_rows
+        self.profiler = profiler or ImportProfiler(enabled=False)
+        self.fixed = fixed
+        self.rows_written = 0
+        self.peak_rss = 0
+
+        self._batches = []
+        self._buffered_rows = 0
+        self._process = psutil.Process()
+
+    def add(self, lap_id: int, converted: dict[str, list]) -> None:
+        """Buffers the samples of one lap and flushes if the row budget is reached."""
+        self._batches.append((lap_id, converted))
+        self._buffered_rows += len(converted["date"])
+        self._sample_memory()
+
+        if self.flush_rows and self._buffered_rows >= self.flush_rows:
+            self.flush()
+
+    def flush(self) -> int:
+        """Writes everything buffered so far and releases it.
+
+        Returns:
+            int: Number of rows written by this flush.
+        """
+        if not self._batches:
+            return 0
+
+        with self.profiler.stage(f"write:{self.model._meta.db_table}") as stage:
+            written = stage.rows = self.loader.load(self.model, self._batches, **self.fixed)
+        self._sample_memory()
+
+        self.rows_written += written
+        self._batches = []
+        self._buffered_rows = 0
+        return written
+
+    def _sample_memory(self) -> None:
+        self.peak_rss = max(self.peak_rss, self._process.memory_info().rss)
+
+
+def upsert(model, instances: list, unique_fields: list[str], batch_size: int = 1000) -> int:
+    """Inserts or updates the rows of a session level table with set-based statements.
+
+    Rows are matched on their natural key, so importing the same session again
+    refreshes the existing rows instead of duplicating them. Rows repeating a natural
+    key within `instances` are collapsed to the last one, as a single upsert statement
+    cannot touch the same row twice.
+
+    Args:
+        model: `Lap`, `Result`, `Weather` or `RaceControlMessage`.
+        instances (list): Unsaved model instances.
+        unique_fields (list[str]): Fields of the model's natural key unique constraint.
+        batch_size (int): Number of rows per statement.
+
+    Returns:
+        int: Number of rows upserted.
+    """
+    key_attnames = [model._meta.get_field(field).attname for field in unique_fields]
+    unique = {tuple(getattr(instance, attname) for attname in key_attnames): instance for instance in instances}
+
+    update_fields = [
+        field.name for field in model._meta.concrete_fields
+        if not field.primary_key and field.name not in unique_fields
+    ]
+
+    model.objects.bulk_create(
+        list(unique.values()),
+        batch_size=batch_size,
+        update_conflicts=True,
+        update_fields=update_fields,
+        unique_fields=unique_fields
+    )
+    return len(unique)
+
+
+def get_sample_loader(use_copy: bool = True, bulk_load: bool = False):
+    """Picks the fastest loader the configured database supports.
+
+    Args:
+        use_copy (bool): Allow the COPY loader. Set to False to force `bulk_create`.
+        bulk_load (bool): The sample tables are in bulk-load mode (PostgreSQL only).
+
+    Returns:
+        PostgresBulkLoader in bulk-load mode, PostgresCopyLoader on PostgreSQL,
+        BulkCreateLoader otherwise.
+    """
+    if bulk_load:
+        return PostgresBulkLoader()
+    if use_copy and connection.vendor == "postgresql":
+        return PostgresCopyLoader()
+    return BulkCreateLoader()
@@ -0,0 +1,140 @@
+import logging
+from collections import defaultdict
+
+from rapidfuzz import process
+
+from static_data.models import Constructor, Driver, DriverRacingNumber, ImportFingerprint, Lap, Session
+from static_data.importing.fingerprints import Fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+def lap_id_map(session: Session) -> dict[tuple[int, int], int]:
+    """Loads every lap of a session into a (driver_id, lap_number) -> lap_id map.
+
+    One query per session replaces a `Lap.objects.filter(...).first()` per lap, per
+    driver and per sample table.
+
+    Args:
+        session (Session): The session whose laps were just imported.
+
+    Returns:
+        dict[tuple[int, int], int]: Lap ID for each (driver_id, lap_number) pair.
+    """
+    laps = Lap.objects.filter(session=session).values_list("driver_id", "lap_number", "id")
+    return {(driver_id, lap_number): lap_id for driver_id, lap_number, lap_id in laps}
+
+
+def stored_fingerprints(session: Session) -> dict[str, Fingerprint]:
+    """Loads the fingerprints recorded by the last import of a session.
+
+    Args:
+        session (Session): The session being imported.
+
+    Returns:
+        dict[str, Fingerprint]: Table name -> fingerprint, empty for a new session.
+    """
+    fingerprints = ImportFingerprint.objects.filter(session=session).values_list("table", "row_count", "digest")
+    return {table: Fingerprint(row_count, digest) for table, row_count, digest in fingerprints}
+
+
+class IdentityResolver:
+    """
+    In-memory lookup of drivers, constructors and racing numbers for one import run.
+
+    Everything is loaded with one query per table when the import starts and kept up
+    to date as the importer creates new rows, so resolving the identity of a result,
+    lap or race control message costs a dictionary lookup instead of a query.
+    Fuzzy name matches are computed once and memoized.
+    """
+
+    # Minimum rapidfuzz score for a last name to be accepted as a fuzzy match
+    FUZZY_MATCH_THRESHOLD = 85
+
+    def __init__(self):
+        self._drivers = {}
+        self._drivers_by_first_name = defaultdict(dict)
+        self._constructors = {}
+        self._racing_numbers = {}
+        self._fuzzy_matches = {}
+
+    @classmethod
+    def load(cls) -> "IdentityResolver":
+        """Creates a resolver holding every driver, constructor and racing number in the database."""
+        resolver = cls()
+        for driver in Driver.objects.all():
+            resolver.remember_driver(driver)
+        for constructor in Constructor.objects.all():
+            resolver.remember_constructor(constructor)
+        for racing_number in DriverRacingNumber.objects.all():
+            resolver.remember_racing_number(racing_number)
+        return resolver
+
+    def remember_driver(self, driver: Driver) -> None:
+        self._drivers[(driver.first_name, driver.last_name)] = driver.id
+        self._drivers_by_first_name[driver.first_name][driver.last_name] = driver.id
+
+    def remember_constructor(self, constructor: Constructor) -> None:
+        self._constructors[constructor.name] = constructor.id
+
+    def remember_racing_number(self, racing_number: DriverRacingNumber) -> None:
+        self._racing_numbers[(int(racing_number.season_year_id), int(racing_number.racing_number))] = racing_number.id
+
+    def driver(self, first_name: str, last_name: str) -> int:
+        """Returns the ID of the driver with exactly this name.
+
+        Raises:
+            Driver.DoesNotExist: If no such driver has been imported.
+        """
+        try:
+            return self._drivers[(first_name, last_name)]
+        except KeyError:
+            raise Driver.DoesNotExist(f"No match found for '{first_name} {last_name}'") from None
+
+    def match_driver(self, first_name: str, last_name: str) -> int:
+        """Returns the ID of a driver, falling back to a fuzzy match on the last name.
+
+        FastF1 occasionally spells a last name differently between its results and laps
+        (e.g. accents), so drivers sharing the first name are compared with rapidfuzz.
+
+        Raises:
+            Driver.DoesNotExist: If neither an exact nor a close enough match exists.
+        """
+        if (first_name, last_name) in self._drivers:
+            return self._drivers[(first_name, last_name)]
+        if (first_name, last_name) in self._fuzzy_matches:
+            return self._fuzzy_matches[(first_name, last_name)]
+
+        logger.warning(f"No exact match for: '{first_name} {last_name}'. Trying fuzzy match...")
+        candidates = self._drivers_by_first_name.get(first_name, {})
+        result = process.extractOne(last_name, list(candidates)) if candidates else None
+
+        if result is None or result[1] <= self.FUZZY_MATCH_THRESHOLD:
+            raise Driver.DoesNotExist(f"No match found for '{first_name} {last_name}'")
+
+        match, score, _ = result
+        logger.info(f"Fuzzy matched last name '{last_name}' -> '{match}' (score={score})")
+        self._fuzzy_matches[(first_name, last_name)] = candidates[match]
+        return candidates[match]
+
+    def constructor(self, name: str) -> int:
+        """Returns the ID of the constructor with this name.
+
+        Raises:
+            Constructor.DoesNotExist: If the constructor has not been imported.
+        """
+        try:
+            return self._constructors[name]
+        except KeyError:
+            raise Constructor.DoesNotExist(f"No constructor named '{name}'") from None
+
+    def racing_number(self, year: int, number) -> int:
+        """Returns the ID of the DriverRacingNumber for a racing number in a season.
+
+        Raises:
+            DriverRacingNumber.DoesNotExist: If nobody raced with the number that season.
+        """
+        try:
+            return self._racing_numbers[(int(year), int(number))]
+        except KeyError:
+            raise DriverRacingNumber.DoesNotExist(f"No racing number {number} in {year}") from None
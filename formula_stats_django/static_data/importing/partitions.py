@@ -0,0 +1,124 @@
+from django.db import connection, transaction
+
+
+# Sample tables partitioned by LIST (season_year_id) on PostgreSQL, see migration 0008
+PARTITIONED_TABLES = ("telemetry", "car_data", "pos_data")
+
+
+def partition_name(table: str, year: int) -> str:
+    return f"{table}_{year}"
+
+
+def is_partitioned(table: str) -> bool:
+    """Whether `table` is a partitioned table, always False off PostgreSQL."""
+    if connection.vendor != "postgresql":
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+            [table]
+        )
+        return cursor.fetchone() is not None
+
+
+def season_partitions(tables=PARTITIONED_TABLES) -> dict[str, list[tuple[str, str, int]]]:
+    """Attached partitions of every partitioned sample table.
+
+    Returns:
+        dict[str, list[tuple[str, str, int]]]: Table name -> (partition name, bound,
+            approximate rows) of each partition, ordered by name.
+    """
+    partitions = {}
+    for table in tables:
+        if not is_partitioned(table):
+            continue
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid), GREATEST(child.reltuples, 0)::bigint "
+                "FROM pg_inherits JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = to_regclass(%s) ORDER BY child.relname",
+                [table]
+            )
+            partitions[table] = cursor.fetchall()
+    return partitions
+
+
+def create_season_partitions(year: int, tables=PARTITIONED_TABLES) -> list[str]:
+    """Creates the partitions holding the samples of a season.
+
+    Rows of a season without a partition land in the default partition, so this only
+    has to run before a season is imported, not before it can be imported. A no-op on
+    databases where the sample tables are not partitioned.
+
+    Returns:
+        list[str]: Names of the partitions created by this call.
+    """
+    created = []
+    for table in tables:
+        if not is_partitioned(table):
+            continue
+        partition = partition_name(table, year)
+        if _exists(partition):
+            continue
+        # Rows of the season that were written before its partition existed are moved
+        # out of the default partition, the new partition would clash with them otherwise
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS)")
+            cursor.execute(f"WITH moved AS (DELETE FROM {table}_default WHERE season_year_id = %s RETURNING *) "
+                           f"INSERT INTO {partition} SELECT * FROM moved", [year])
+            cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {partition} FOR VALUES IN ({int(year)})")
+        created.append(partition)
+    return created
+
+
+def detach_season_partitions(year: int, tables=PARTITIONED_TABLES) -> list[str]:
+    """Detaches the partitions of a season, keeping them as standalone tables.
+
+    The samples leave the sample tables in a single metadata change, the detached
+    tables can be archived (pg_dump) and dropped, or attached again later.
+
+    Returns:
+        list[str]: Names of the detached partitions.
+    """
+    detached = []
+    for table in tables:
+        partition = partition_name(table, year)
+        if not is_partitioned(table) or not _is_attached(table, partition):
+            continue
+        with connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {partition}")
+        detached.append(partition)
+    return detached
+
+
+def drop_season_partitions(year: int, tables=PARTITIONED_TABLES) -> list[str]:
+    """Drops the partitions of a season, attached or detached, with all their samples.
+
+    Returns:
+        list[str]: Names of the dropped partitions.
+    """
+    dropped = []
+    for table in tables:
+        partition = partition_name(table, year)
+        if connection.vendor != "postgresql" or not _exists(partition):
+            continue
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE {partition}")
+        dropped.append(partition)
+    return dropped
+
+
+def _exists(table: str) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [table])
+        return cursor.fetchone()[0]
+
+
+def _is_attached(table: str, partition: str) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_inherits WHERE inhparent = to_regclass(%s) AND inhrelid = to_regclass(%s)",
+            [table, partition]
+        )
+        return cursor.fetchone() is not None
@@ -0,0 +1,176 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import psutil
+from django.db import connection
+
+
+class StageStats:
+    """
+    Totals of one importer stage over every time it ran.
+
+    Attributes:
+        name (str): Stage name, e.g. "fastf1_load", "populate_laps" or "write:car_data".
+        calls (int): Number of times the stage ran.
+        wall_time (float): Seconds spent in the stage.
+        rows (int): Rows the stage handled, as reported by the caller.
+        queries (int): SQL statements executed on the default connection.
+        peak_rss (int): Highest resident set size (bytes) seen while the stage ran.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.wall_time = 0.0
+        self.rows = 0
+        self.queries = 0
+        self.peak_rss = 0
+
+    @property
+    def rows_per_second(self) -> float | None:
+        return self.rows / self.wall_time if self.rows and self.wall_time else None
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "wall_time": round(self.wall_time, 4),
+            "rows": self.rows,
+            "rows_per_second": round(self.rows_per_second, 1) if self.rows_per_second else None,
+            "queries": self.queries,
+            "peak_rss": self.peak_rss,
+        }
+
+
+class StageRun:
+    """One run of a stage; the caller reports the rows it handled through `rows`."""
+
+    def __init__(self):
+        self.rows = 0
+        self.queries = 0
+        self.peak_rss = 0
+
+
+class ImportProfiler:
+    """
+    Measures where the importer spends its time.
+
+    Every `stage` records wall time, rows, query count and peak memory, and runs of
+    the same stage are added up, so a stage entered once per lap (e.g. the DataFrame
+    conversion) reports one line for the whole import. Stages can be nested.
+
+    Memory is sampled by a background thread while the profiler is running. A
+    disabled profiler measures nothing and costs next to nothing, so the importer can
+    always go through it.
+
+    Attributes:
+        enabled (bool): Whether stages are measured.
+        stages (dict[str, StageStats]): Stage name -> totals, in the order first entered.
+    """
+
+    def __init__(self, enabled: bool = True, sample_interval: float = 0.05):
+        self.enabled = enabled
+        self.stages = {}
+        self.sample_interval = sample_interval
+
+        self._process = psutil.Process()
+        self._open_runs = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = None
+        self._started_at = None
+        self._start_time = None
+        self._peak_rss = 0
+
+    def start(self) -> "ImportProfiler":
+        """Starts the memory sampler and the overall clock."""
+        if self.enabled and self._sampler is None:
+            self._started_at = datetime.now(timezone.utc)
+            self._start_time = time.perf_counter()
+            self._stop.clear()
+            self._sampler = threading.Thread(target=self._sample_memory, daemon=True)
+            self._sampler.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the memory sampler."""
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            self._sampler = None
+
+    @contextmanager
+    def stage(self, name: str):
+        """Measures the enclosed block as one run of the stage `name`.
+
+        Yields:
+            StageRun: Set its `rows` to the number of rows the block handled.
+        """
+        run = StageRun()
+        if not self.enabled:
+            yield run
+            return
+
+        def count_query(execute, sql, params, many, context):
+            run.queries += 1
+            return execute(sql, params, many, context)
+
+        with self._lock:
+            self._open_runs.append(run)
+        self._record_rss()
+
+        start_time = time.perf_counter()
+        try:
+            with connection.execute_wrapper(count_query):
+                yield run
+        finally:
+            wall_time = time.perf_counter() - start_time
+            self._record_rss()
+            with self._lock:
+                self._open_runs.remove(run)
+
+            stats = self.stages.setdefault(name, StageStats(name))
+            stats.calls += 1
+            stats.wall_time += wall_time
+            stats.rows += run.rows
+            stats.queries += run.queries
+            stats.peak_rss = max(stats.peak_rss, run.peak_rss)
+
+    def report(self) -> dict:
+        """Returns the measurements as a JSON serializable dict."""
+        return {
+            "started_at": self._started_at.isoformat() if self._started_at else None,
+            "wall_time": round(time.perf_counter() - self._start_time, 4) if self._start_time else None,
+            "peak_rss": self._peak_rss,
+            "stages": [stats.as_dict() for stats in self.stages.values()],
+        }
+
+    def write_json(self, path: str) -> None:
+        """Writes `report()` to a JSON file."""
+        with open(path, "w") as file:
+            json.dump(self.report(), file, indent=2)
+
+    def table(self) -> str:
+        """Formats the stages as a plain text table."""
+        lines = [f"{'stage':<32} {'calls':>6} {'seconds':>9} {'rows':>10} {'rows/s':>11} {'queries':>8} {'peak MB':>8}"]
+        for stats in self.stages.values():
+            rows_per_second = f"{stats.rows_per_second:,.0f}" if stats.rows_per_second else "-"
+            lines.append(
+                f"{stats.name:<32} {stats.calls:>6} {stats.wall_time:>9.2f} {stats.rows:>10} {rows_per_second:>11} "
+                f"{stats.queries:>8} {stats.peak_rss / 1024 ** 2:>8.0f}"
+            )
+        return "\n".join(lines)
+
+    def _record_rss(self) -> None:
+        rss = self._process.memory_info().rss
+        with self._lock:
+            self._peak_rss = max(self._peak_rss, rss)
+            for run in self._open_runs:
+                run.peak_rss = max(run.peak_rss, rss)
+
+    def _sample_memory(self) -> None:
+        while not self._stop.wait(self.sample_interval):
+            self._record_rss()
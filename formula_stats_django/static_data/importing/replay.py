@@ -0,0 +1,138 @@
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+import pandas as pd
+from fastf1.core import Laps, Telemetry
+
+
+# Session level frames of a recording, named like the `fastf1.core.Session` attributes
+RECORDED_FRAMES = ("results", "laps", "weather_data", "race_control_messages")
+# Per driver sample streams of a recording
+RECORDED_STREAMS = ("car_data", "pos_data")
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", str(name).lower()).strip("_")
+
+
+def fixture_path(fixtures_dir: str, year: int, event_name: str, session_name: str) -> Path:
+    """Directory of one recorded session, e.g. `<fixtures_dir>/2025/australian_grand_prix/race`."""
+    return Path(fixtures_dir) / str(year) / _slug(event_name) / _slug(session_name)
+
+
+def record_session(session, fixtures_dir: str, metadata: dict) -> Path:
+    """Records a loaded FastF1 session as a replay fixture.
+
+    Every frame is written with `pandas.to_pickle`, the format FastF1's own cache
+    uses, so dtypes (timedeltas, nullable integers, timestamps) come back exactly as
+    FastF1 produced them.
+
+    Args:
+        session (fastf1.core.Session): A loaded FastF1 session.
+        fixtures_dir (str): Root directory of the fixtures.
+        metadata (dict): `session_metadata` of the session.
+
+    Returns:
+        Path: Directory the session was recorded to.
+    """
+    year = int(session.event.year)
+    event = pd.Series(session.event)
+    path = fixture_path(fixtures_dir, year, event["EventName"], session.name)
+    path.mkdir(parents=True, exist_ok=True)
+
+    pd.to_pickle({
+        "year": year,
+        "event": event,
+        "session_name": session.name,
+        "session_info": session.session_info,
+        "drivers": list(session.drivers),
+        "t0_date": session.t0_date,
+        **metadata,
+    }, path / "session.pkl")
+
+    for name in RECORDED_FRAMES:
+        pd.to_pickle(pd.DataFrame(getattr(session, name)), path / f"{name}.pkl")
+    for name in RECORDED_STREAMS:
+        streams = getattr(session, name)
+        pd.to_pickle({driver: pd.DataFrame(streams[driver]) for driver in streams}, path / f"{name}.pkl")
+
+    return path
+
+
+class ReplaySession:
+    """
+    A recorded session that stands in for a loaded `fastf1.core.Session`.
+
+    It has the attributes the importer reads from a FastF1 session, with the laps and
+    sample streams as FastF1 `Laps` and `Telemetry` objects, so lap samples are
+    extracted from it exactly as from a live session, without network access.
+
+    Attributes:
+        year (int): Season year.
+        event (pd.Series): The event's row of the FastF1 event schedule.
+        name (str): Session name, e.g. "Race".
+        session_info (dict): FastF1 session info.
+        drivers (list[str]): Racing numbers of the drivers in the session.
+        t0_date (pd.Timestamp): Date of SessionTime zero.
+        metadata (dict): Recorded `session_metadata`.
+        results, laps, weather_data, race_control_messages: The recorded frames.
+        car_data, pos_data (dict[str, Telemetry]): Racing number -> sample stream.
+    """
+
+    def __init__(self, path: str | Path):
+        path = Path(path)
+        if not (path / "session.pkl").exists():
+            raise FileNotFoundError(f"No recorded session in {path}")
+
+        recorded = pd.read_pickle(path / "session.pkl")
+        self.year = recorded.pop("year")
+        self.event = recorded.pop("event")
+        self.name = recorded.pop("session_name")
+        self.session_info = recorded.pop("session_info")
+        self.drivers = recorded.pop("drivers")
+        self.t0_date = recorded.pop("t0_date")
+        self.metadata = recorded
+
+        self.results = pd.read_pickle(path / "results.pkl")
+        self.laps = Laps(pd.read_pickle(path / "laps.pkl"), session=self)
+        self.weather_data = pd.read_pickle(path / "weather_data.pkl")
+        self.race_control_messages = pd.read_pickle(path / "race_control_messages.pkl")
+
+        for name in RECORDED_STREAMS:
+            setattr(self, name, {
+                driver: Telemetry(stream, session=self, driver=driver)
+                for driver, stream in pd.read_pickle(path / f"{name}.pkl").items()
+            })
+
+
+class Recording(NamedTuple):
+    """A recorded session found in a fixture directory."""
+    year: int
+    event: pd.Series
+    session_number: int
+    session_name: str
+
+
+def recorded_sessions(fixtures_dir: str, year: int | None = None) -> list[Recording]:
+    """Lists the sessions recorded in a fixture directory.
+
+    Args:
+        fixtures_dir (str): Root directory of the fixtures.
+        year (int | None): Only list this season.
+
+    Returns:
+        list[Recording]: Recorded sessions in schedule order (year, round, session).
+    """
+    recordings = []
+    for path in Path(fixtures_dir).glob("*/*/*/session.pkl"):
+        recorded = pd.read_pickle(path)
+        if year is not None and recorded["year"] != year:
+            continue
+
+        event = recorded["event"]
+        # The number of the session is the N of its `SessionN` schedule column
+        number = next(n for n in range(1, 6) if event.get(f"Session{n}") == recorded["session_name"])
+        recordings.append(Recording(recorded["year"], event, number, recorded["session_name"]))
+
+    return sorted(recordings, key=lambda recording: (recording.year, recording.event["RoundNumber"], recording.session_number))
@@ -0,0 +1,374 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, NamedTuple
+
+import fastf1 as ff1
+from fastf1 import plotting
+import numpy as np
+import pandas as pd
+
+from static_data.importing.driver_ahead import DriverAheadGrid
+from static_data.importing.fingerprints import session_fingerprints
+from static_data.importing.replay import ReplaySession, fixture_path, record_session
+
+
+# Per-lap sample streams the importer writes, keyed by the name used throughout the importer
+SAMPLE_KINDS = ("pos_data", "car_data", "telemetry")
+
+
+def scheduled_sessions(event) -> list[tuple[int, str]]:
+    """Lists the sessions of a FastF1 schedule row.
+
+    Args:
+        event: A row of `fastf1.get_event_schedule` or a `fastf1.events.Event`.
+
+    Returns:
+        list[tuple[int, str]]: (session number, session name) pairs, the number being
+        the N of the `SessionN` / `SessionNDateUtc` schedule columns.
+    """
+    sessions = []
+    for number in range(1, 6):
+        name = event.get(f"Session{number}")
+        # Unused slots are "None" in older FastF1 schedules and empty or missing in newer ones
+        if pd.notna(name) and name not in ("", "None"):
+            sessions.append((number, name))
+    return sessions
+
+
+class LapSamples(NamedTuple):
+    """Samples of one lap of one driver, or the error FastF1 raised producing them."""
+    lap_number: int
+    samples: pd.DataFrame | None
+    error: str | None = None
+
+
+def _slice_laps(stream: pd.DataFrame, starts: np.ndarray, ends: np.ndarray) -> tuple[pd.DataFrame, np.ndarray]:
+    """Cuts a session wide sample stream into laps with a single `take`.
+
+    Samples are selected like FastF1's `slice_by_lap` does (lap start <= SessionTime
+    <= lap end, Time restarting at zero every lap), but the lap boundaries of all laps
+    are found with one binary search over the sorted SessionTime column.
+
+    Args:
+        stream (pd.DataFrame): Car, position or merged data of one driver, sorted by SessionTime.
+        starts (np.ndarray): `LapStartTime` of every lap, as timedelta64.
+        ends (np.ndarray): `Time` (lap end session time) of every lap, as timedelta64.
+
+    Returns:
+        tuple[pd.DataFrame, np.ndarray]: The samples of all laps back to back, and the
+        position of the lap (in `starts`) each sample belongs to.
+    """
+    session_time = stream["SessionTime"].to_numpy()
+    first = np.searchsorted(session_time, starts, side="left")
+    counts = np.maximum(np.searchsorted(session_time, ends, side="right") - first, 0)
+
+    lap_index = np.repeat(np.arange(len(starts)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    sliced = stream.iloc[np.repeat(first, counts) + offsets].reset_index(drop=True)
+
+    sliced["Time"] = sliced["SessionTime"].to_numpy() - starts[lap_index]
+    return sliced, lap_index
+
+
+def _add_distance_channels(samples: pd.DataFrame, lap_index: np.ndarray) -> None:
+    """Adds DifferentialDistance, Distance and RelativeDistance to back to back laps.
+
+    Same definitions as FastF1's `add_differential_distance`, `add_distance` and
+    `add_relative_distance` applied to every lap separately, computed for all laps
+    of a driver at once.
+    """
+    seconds = samples["Time"].dt.total_seconds()
+    dt = seconds.diff()
+    # The first sample of a lap is integrated from the lap start
+    lap_starts = np.r_[True, lap_index[1:] != lap_index[:-1]] if len(lap_index) else np.zeros(0, dtype=bool)
+    dt[lap_starts] = seconds[lap_starts]
+
+    samples["DifferentialDistance"] = samples["Speed"] / 3.6 * dt
+    samples["Distance"] = samples["DifferentialDistance"].groupby(lap_index).cumsum()
+    samples["RelativeDistance"] = samples["Distance"] / samples["Distance"].groupby(lap_index).transform("last")
+
+
+def driver_lap_samples(session, driver: str, kinds=SAMPLE_KINDS, driver_ahead: DriverAheadGrid | None = None) -> dict[str, list[LapSamples]]:
+    """Extracts the lap samples of one driver from a loaded FastF1 session.
+
+    The driver's car and position streams are taken for the whole session once,
+    merged once, given their derived distance channels in one vectorized pass and
+    then cut into laps by the lap start and end session times, instead of slicing and
+    merging the session wide streams again for every lap and every table.
+
+    Args:
+        session (fastf1.core.Session): A loaded FastF1 session.
+        driver (str): Racing number of the driver.
+        kinds: The `SAMPLE_KINDS` to extract.
+        driver_ahead (DriverAheadGrid | None): Session wide driver ahead data, None to
+            leave DriverAhead and DistanceToDriverAhead empty.
+
+    Returns:
+        dict[str, list[LapSamples]]: Kind -> samples of every lap from lap 1 to the
+        driver's last lap, with an error entry for laps that have no samples.
+    """
+    laps = session.laps.pick_drivers(driver)
+    laps = laps[laps["LapNumber"].notna()]
+    if laps.empty:
+        return {kind: [] for kind in kinds}
+
+    lap_numbers = np.arange(1, int(laps["LapNumber"].max()) + 1)
+    laps = pd.DataFrame(laps).drop_duplicates("LapNumber").set_index("LapNumber").reindex(lap_numbers)
+    starts = laps["LapStartTime"].to_numpy(dtype="timedelta64[ns]")
+    ends = laps["Time"].to_numpy(dtype="timedelta64[ns]")
+    timed = ~(np.isnat(starts) | np.isnat(ends))
+
+    try:
+        streams = {"pos_data": session.pos_data[driver], "car_data": session.car_data[driver]}
+        if "telemetry" in kinds:
+            streams["telemetry"] = streams["pos_data"].merge_channels(streams["car_data"])
+    except Exception as e:
+        return {kind: [LapSamples(int(lap_number), None, str(e)) for lap_number in lap_numbers] for kind in kinds}
+
+    samples = {}
+    for kind in kinds:
+        sliced, lap_index = _slice_laps(streams[kind], starts[timed], ends[timed])
+        if kind == "telemetry":
+            _add_distance_channels(sliced, lap_index)
+            if driver_ahead is not None:
+                sliced["DriverAhead"], sliced["DistanceToDriverAhead"] = driver_ahead.lookup(driver, sliced["SessionTime"])
+            else:
+                sliced["DriverAhead"], sliced["DistanceToDriverAhead"] = pd.NA, np.nan
+
+        bounds = np.searchsorted(lap_index, np.arange(len(lap_numbers[timed]) + 1))
+        lap_slices = iter(zip(bounds[:-1], bounds[1:]))
+
+        samples[kind] = []
+        for lap_number, has_times in zip(lap_numbers, timed):
+            if not has_times:
+                samples[kind].append(LapSamples(int(lap_number), None, "Lap has no start or end time"))
+                continue
+
+            first, last = next(lap_slices)
+            if first == last:
+                samples[kind].append(LapSamples(int(lap_number), None, "No samples between lap start and end"))
+                continue
+
+            samples[kind].append(LapSamples(int(lap_number), pd.DataFrame(sliced.iloc[first:last].reset_index(drop=True))))
+
+    return samples
+
+
+def session_metadata(session) -> dict:
+    """Collects what the importer reads from FastF1's plotting and circuit helpers.
+
+    These helpers need a fully loaded FastF1 session, so they are evaluated once and
+    recorded along with replay fixtures.
+
+    Args:
+        session (fastf1.core.Session): A loaded FastF1 session.
+
+    Returns:
+        dict: "driver_names", "circuit_rotation", "compound_colors" and "team_colors",
+        as described on `SessionData`.
+    """
+    try:
+        circuit_rotation = session.get_circuit_info().rotation
+    except Exception:
+        # Circuit info is missing for some sessions (e.g. testing), only the first session of an event needs it
+        circuit_rotation = None
+
+    return {
+        "driver_names": {
+            abbreviation: plotting.get_driver_name(abbreviation, session)
+            for abbreviation in session.laps["Driver"].dropna().unique()
+        },
+        "circuit_rotation": circuit_rotation,
+        "compound_colors": plotting.get_compound_mapping(session),
+        "team_colors": {
+            team: {
+                "official": plotting.get_team_color(team, session, colormap="official"),
+                "fastf1": plotting.get_team_color(team, session, colormap="fastf1"),
+            }
+            for team in plotting.list_team_names(session)
+        },
+    }
+
+
+class SessionData:
+    """
+    The parts of a loaded FastF1 session the importer uses, as plain DataFrames.
+
+    The attribute names follow `fastf1.core.Session` (`results`, `laps`, `session_info`,
+    ...) so the populate methods read the same either way. `session` can also be a
+    `ReplaySession`, which comes with its recorded `metadata`. Lap samples are extracted from
+    the live FastF1 session one driver at a time, on demand; `detach` computes them all up
+    front and drops the FastF1 session so the object can be pickled and sent between processes.
+
+    Attributes:
+        session_info (dict): FastF1 session info (meeting, start and end dates).
+        drivers (list[str]): Racing numbers of the drivers in the session.
+        results (pd.DataFrame): Session results.
+        laps (pd.DataFrame): Lap timing data.
+        weather_data (pd.DataFrame): Weather samples.
+        race_control_messages (pd.DataFrame): Race control messages.
+        driver_names (dict[str, str]): Driver abbreviation -> full name.
+        circuit_rotation (float | None): Track map rotation in degrees.
+        compound_colors (dict[str, str]): Tyre compound -> hex color.
+        team_colors (dict[str, dict[str, str]]): Team -> {"official": hex, "fastf1": hex}.
+        fingerprints (dict[str, Fingerprint]): Table name -> fingerprint of its source data.
+    """
+
+    def __init__(self, session, driver_ahead: bool = True, metadata: dict | None = None):
+        self.session_info = session.session_info
+        self.drivers = list(session.drivers)
+        self.results = pd.DataFrame(session.results)
+        self.laps = pd.DataFrame(session.laps)
+        self.weather_data = pd.DataFrame(session.weather_data)
+        self.race_control_messages = pd.DataFrame(session.race_control_messages)
+
+        metadata = metadata or session_metadata(session)
+        self.driver_names = metadata["driver_names"]
+        self.circuit_rotation = metadata["circuit_rotation"]
+        self.compound_colors = metadata["compound_colors"]
+        self.team_colors = metadata["team_colors"]
+
+        self.fingerprints = session_fingerprints(session, driver_ahead)
+
+        self._session = session
+        self._samples = None
+        self._driver_ahead = driver_ahead
+        self._driver_ahead_grid = None
+
+    def driver_laps(self, driver: str) -> pd.DataFrame:
+        """Returns the laps of one driver (by racing number)."""
+        return self.laps[self.laps["DriverNumber"] == driver]
+
+    def driver_samples(self, driver: str, kinds=SAMPLE_KINDS) -> dict[str, list[LapSamples]]:
+        """Returns the samples of every lap of a driver, from lap 1 to their last lap.
+
+        Args:
+            driver (str): Racing number of the driver.
+            kinds: The `SAMPLE_KINDS` to return.
+
+        Returns:
+            dict[str, list[LapSamples]]: Kind -> samples per lap.
+        """
+        if self._samples is not None:
+            driver_samples = self._samples.get(driver, {})
+            return {kind: driver_samples.get(kind, []) for kind in kinds}
+
+        # Computed for the whole session the first time telemetry is needed
+        if self._driver_ahead and "telemetry" in kinds and self._driver_ahead_grid is None:
+            self._driver_ahead_grid = DriverAheadGrid(self._session)
+
+        return driver_lap_samples(self._session, driver, kinds, self._driver_ahead_grid)
+
+    def detach(self) -> "SessionData":
+        """Computes every lap sample stream and releases the FastF1 session.
+
+        Returns:
+            SessionData: self, now safe to pickle.
+        """
+        if self._samples is None:
+            self._samples = {driver: self.driver_samples(driver) for driver in self.drivers}
+            self._session = None
+            self._driver_ahead_grid = None
+        return self
+
+
+def load_session_data(year: int, event: str | int, session_name: str, detach: bool = False, driver_ahead: bool = True, replay_dir: str | None = None) -> SessionData:
+    """Loads a session from FastF1 and wraps it for the importer.
+
+    This is the unit of work of the importer's process pool: it does all the
+    CPU-bound FastF1 parsing and never touches the database. With `replay_dir` the
+    session is read from a recorded fixture instead and no network access is needed.
+
+    Args:
+        year (int): Season year.
+        event (str | int): Event name, fuzzy matched by FastF1, or round number.
+        session_name (str): Session name, e.g. "Practice 1" or "Sprint".
+        detach (bool): Precompute all lap samples and drop the FastF1 session.
+        driver_ahead (bool): Fill the DriverAhead and DistanceToDriverAhead telemetry channels.
+        replay_dir (str | None): Fixture directory written by `record_fastf1_session`,
+            `event` must then be the recorded event name.
+
+    Returns:
+        SessionData: The loaded session.
+    """
+    if replay_dir:
+        session = ReplaySession(fixture_path(replay_dir, year, event, session_name))
+        session_data = SessionData(session, driver_ahead, session.metadata)
+    else:
+        session = ff1.get_session(year, event, session_name)
+        session.load()
+        session_data = SessionData(session, driver_ahead)
+
+    return session_data.detach() if detach else session_data
+
+
+def record_fastf1_session(year: int, event: str | int, session_name: str, fixtures_dir: str) -> str:
+    """Loads a session from FastF1 and records it as a replay fixture.
+
+    Args:
+        year (int): Season year.
+        event (str | int): Event name, fuzzy matched by FastF1, or round number.
+        session_name (str): Session name, e.g. "Practice 1" or "Sprint".
+        fixtures_dir (str): Root directory of the fixtures.
+
+    Returns:
+        str: Directory the session was recorded to.
+    """
+    session = ff1.get_session(year, event, session_name)
+    session.load()
+    return str(record_session(session, fixtures_dir, session_metadata(session)))
+
+
+def load_sessions(requests: list[tuple], workers: int = 1, lookahead: int | None = None, **options) -> Iterator[tuple[tuple, SessionData | None, Exception | None]]:
+    """Loads sessions and yields them in the order they were requested.
+
+    With more than one worker the sessions are loaded and detached in a process pool,
+    while the caller keeps doing the database writes in its own process in request
+    order. At most `lookahead` sessions are loading or waiting to be consumed at any
+    time, so a whole season never sits in memory at once.
+
+    A session that fails to load does not stop the others; its error is yielded in
+    place of the session so the caller can decide what to do with it.
+
+    Args:
+        requests (list[tuple]): (year, event, session name) arguments of `load_session_data`.
+        workers (int): Number of worker processes, 1 loads in this process.
+        lookahead (int | None): Sessions submitted ahead of the one being consumed, twice the workers by default.
+        **options: Keyword arguments of `load_session_data`, e.g. `driver_ahead` or `replay_dir`.
+
+    Yields:
+        tuple: (request, SessionData or None, Exception or None).
+    """
+    if workers <= 1:
+        for request in requests:
+            try:
+                loaded, error = load_session_data(*request, **options), None
+            except Exception as e:
+                loaded, error = None, e
+            yield request, loaded, error
+        return
+
+    requests = iter(requests)
+    lookahead = lookahead or workers * 2
+
+    # Spawned workers never inherit the caller's database connections
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pending = deque()
+
+        def submit() -> None:
+            request = next(requests, None)
+            if request is not None:
+                pending.append((request, pool.submit(load_session_data, *request, detach=True, **options)))
+
+        for _ in range(lookahead):
+            submit()
+
+        while pending:
+            request, future = pending.popleft()
+            submit()
+            try:
+                loaded, error = future.result(), None
+            except Exception as e:
+                loaded, error = None, e
+            yield request, loaded, error
@@ -0,0 +1,156 @@
+import pandas as pd
+from django.db import transaction
+
+from static_data.columnar import fetch_frame
+from static_data.models import Lap, Result, SessionPaceSummary
+
+
+def lap_time_bounds(laps_df: pd.DataFrame) -> tuple[float, float]:
+    """Lap times outside these bounds, 1.5 IQR of all lap times of the session, are outliers.
+
+    The same bounds the lap time visuals filter with, so the stored summaries match what
+    they would compute from the laps.
+    """
+    q1 = laps_df["lap_time"].quantile(0.25)
+    q3 = laps_df["lap_time"].quantile(0.75)
+    iqr = q3 - q1
+    return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+
+def remove_lap_time_outliers(laps_df: pd.DataFrame, bounds: tuple[float, float] | None = None) -> pd.DataFrame:
+    """Drops the lap time outliers of a session.
+
+    Args:
+        laps_df (pd.DataFrame): Laps of the session with a "lap_time" column.
+        bounds (tuple[float, float] | None): Stored bounds of the session, see
+            `summary_lap_time_bounds`; computed from `laps_df` when None.
+
+    Returns:
+        pd.DataFrame: The laps within the bounds.
+    """
+    lower_bound, upper_bound = bounds or lap_time_bounds(laps_df)
+    return laps_df[(laps_df["lap_time"] >= lower_bound) & (laps_df["lap_time"] <= upper_bound)]
+
+
+def pace_statistics(laps_df: pd.DataFrame, by: list[str]) -> pd.DataFrame:
+    """Lap count, min, quartiles, median and max lap time of every group.
+
+    Args:
+        laps_df (pd.DataFrame): Laps with a "lap_time" column.
+        by (list[str]): Columns to group the laps by.
+
+    Returns:
+        pd.DataFrame: One row per group, with the `SessionPaceSummary` statistic columns.
+    """
+    lap_times = laps_df.dropna(subset=["lap_time"]).groupby(by)["lap_time"]
+    return pd.DataFrame({
+        "laps": lap_times.count(),
+        "min_lap_time": lap_times.min(),
+        "q1_lap_time": lap_times.quantile(0.25),
+        "median_lap_time": lap_times.median(),
+        "q3_lap_time": lap_times.quantile(0.75),
+        "max_lap_time": lap_times.max(),
+    }).reset_index()
+
+
+def build_pace_summaries(session_id: int) -> int:
+    """Rebuilds the driver and constructor pace summaries of a session.
+
+    Laps are assigned to the constructor of their driver's result, laps of drivers
+    without a result are left out, as in the lap time visuals. Every row also holds the
+    session's outlier bounds and the number of laps of its group outside them.
+
+    Args:
+        session_id (int): ID of the session.
+
+    Returns:
+        int: Number of summary rows written.
+    """
+    driver_constructor = dict(Result.objects.filter(session=session_id).values_list("driver", "constructor"))
+
+    laps_df = fetch_frame(Lap.objects.filter(session=session_id), ["lap_time", "driver"])
+    laps_df["constructor"] = laps_df["driver"].map(driver_constructor)
+    laps_df = laps_df.dropna(subset=["constructor"])
+
+    summaries = []
+    if not laps_df.empty:
+        bounds = lap_time_bounds(laps_df)
+        filtered_laps = remove_lap_time_outliers(laps_df, bounds)
+        for by in (["constructor", "driver"], ["constructor"]):
+            # Laps of the group outside the session's bounds, on both of its rows
+            outlier_laps = (
+                laps_df.dropna(subset=["lap_time"]).groupby(by).size()
+                .sub(filtered_laps.groupby(by).size(), fill_value=0).astype(int).rename("outlier_laps")
+            )
+            for outliers_removed, session_laps in ((False, laps_df), (True, filtered_laps)):
+                for row in pace_statistics(session_laps, by).join(outlier_laps, on=by).to_dict("records"):
+                    summaries.append(SessionPaceSummary(
+                        session_id=session_id,
+                        constructor_id=int(row["constructor"]),
+                        driver_id=int(row["driver"]) if "driver" in row else None,
+                        outliers_removed=outliers_removed,
+                        laps=row["laps"],
+                        min_lap_time=row["min_lap_time"],
+                        q1_lap_time=row["q1_lap_time"],
+                        median_lap_time=row["median_lap_time"],
+                        q3_lap_time=row["q3_lap_time"],
+                        max_lap_time=row["max_lap_time"],
+                        lower_bound_lap_time=bounds[0],
+                        upper_bound_lap_time=bounds[1],
+                        outlier_laps=row["outlier_laps"],
+                    ))
+
+    # The summaries of a session are replaced as a whole
+    with transaction.atomic():
+        SessionPaceSummary.objects.filter(session=session_id).delete()
+        SessionPaceSummary.objects.bulk_create(summaries)
+    return len(summaries)
+
+
+def pace_summaries(session_id: int) -> pd.DataFrame:
+    """Loads the stored pace summaries of a session.
+
+    Args:
+        session_id (int): ID of the session.
+
+    Returns:
+        pd.DataFrame: One row per summary (constructor rows have a null driver), empty
+            if the session has not been summarised.
+    """
+    rows = SessionPaceSummary.objects.filter(session=session_id).values(
+        "constructor", "driver", "outliers_removed", "laps",
+        "min_lap_time", "q1_lap_time", "median_lap_time", "q3_lap_time", "max_lap_time",
+        "lower_bound_lap_time", "upper_bound_lap_time", "outlier_laps"
+    )
+    return pd.DataFrame(list(rows))
+
+
+def summary_lap_time_bounds(summaries_df: pd.DataFrame) -> tuple[float, float] | None:
+    """The session's outlier bounds stored with its `pace_summaries`.
+
+    Returns:
+        tuple[float, float] | None: Lower and upper lap time bound in milliseconds, None
+            if the session has not been summarised or was summarised without them.
+    """
+    if summaries_df.empty or summaries_df["lower_bound_lap_time"].isna().all():
+        return None
+    row = summaries_df.iloc[0]
+    return row["lower_bound_lap_time"], row["upper_bound_lap_time"]
+
+
+def summary_statistics(summaries_df: pd.DataFrame, by: str, outliers_removed: bool) -> pd.DataFrame:
+    """Selects the driver or constructor summaries from `pace_summaries`.
+
+    Args:
+        summaries_df (pd.DataFrame): Summaries of a session.
+        by (str): "driver" or "constructor".
+        outliers_removed (bool): Select the summaries without the lap time outliers.
+
+    Returns:
+        pd.DataFrame: Statistic columns indexed by driver or constructor ID.
+    """
+    selected = summaries_df[
+        (summaries_df["outliers_removed"] == outliers_removed)
+        & (summaries_df["driver"].notna() if by == "driver" else summaries_df["driver"].isna())
+    ]
+    return selected.set_index(selected[by].astype(int).rename(by)).drop(columns=["constructor", "driver", "outliers_removed"])
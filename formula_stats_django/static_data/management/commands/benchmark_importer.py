@@ -0,0 +1,102 @@
+import time
+
+import numpy as np
+import pandas as pd
+from django.core.management.base import BaseCommand
+from django.utils.timezone import make_aware
+
+from static_data.models import CarData, Lap
+from static_data.importing.conversion import convert_samples, build_instances, CAR_DATA_COLUMNS
+
+# * python manage.py benchmark_importer --rows 200000
+
+
+def synthetic_car_data(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Builds a frame shaped like FastF1 car data (roughly 4 Hz samples)."""
+    rng = np.random.default_rng(seed)
+    session_time = pd.to_timedelta(np.arange(rows) * 240, unit="ms")
+
+    return pd.DataFrame({
+        "Date": pd.Timestamp("2025-03-23 07:00:00") + session_time,
+        "SessionTime": session_time,
+        "Time": session_time,
+        "Speed": rng.uniform(60, 340, rows),
+        "RPM": rng.uniform(7000, 12500, rows),
+        "nGear": rng.integers(1, 9, rows),
+        "Throttle": rng.uniform(0, 100, rows),
+        "Brake": rng.random(rows) > 0.8,
+        "DRS": rng.choice([0, 8, 10, 12, 14], rows),
+        "Source": "car",
+    })
+
+
+def legacy_car_data_rows(car_data: pd.DataFrame, lap: Lap) -> list:
+    """The per-row `iterrows` conversion the importer used before the columnar stage."""
+    car_data_bulk = []
+    for _, row in car_data.iterrows():
+        date = row["Date"]
+        if date and date.tzinfo is None:
+            date = make_aware(date)
+
+        session_time = row["SessionTime"]
+        if pd.notna(session_time):
+            session_time = session_time.to_pytimedelta()
+        else:
+            session_time = None
+
+        time = row["Time"].total_seconds() * 1000 if pd.notna(row["Time"]) else None
+
+        car_data_bulk.append(CarData(
+            lap = lap,
+            date = date,
+            speed = row["Speed"],
+            rpm = row["RPM"],
+            gear = row["nGear"],
+            throttle = row["Throttle"],
+            brake = row["Brake"],
+            drs = row["DRS"],
+            source = row["Source"],
+            time = time,
+            session_time = session_time,
+        ))
+    return car_data_bulk
+
+
+def columnar_car_data_rows(car_data: pd.DataFrame, lap: Lap) -> list:
+    """The column-at-a-time conversion used by the importer."""
+    return build_instances(CarData, convert_samples(car_data, CAR_DATA_COLUMNS), lap_id=lap.id)
+
+
+class Command(BaseCommand):
+    help = "Benchmark the sample conversion stage of import_fastf1_data (no database writes)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=200000, help="Number of synthetic samples to convert")
+        parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs, the best one is reported")
+
+
+    def handle(self, **kwargs):
+        rows = kwargs.get("rows")
+        repeat = kwargs.get("repeat")
+
+        car_data = synthetic_car_data(rows)
+        # Unsaved lap, the instances are never written to the database
+        lap = Lap(id=1)
+
+        self.stdout.write(self.style.NOTICE(f"Converting {rows} synthetic car data samples, best of {repeat}..."))
+
+        results = {}
+        for name, convert in (("iterrows", legacy_car_data_rows), ("columnar", columnar_car_data_rows)):
+            results[name] = self._time(convert, car_data, lap, repeat)
+            self.stdout.write(f"{name:>10}: {results[name]:8.3f} s  {rows / results[name]:>12,.0f} rows/s")
+
+        self.stdout.write(self.style.SUCCESS(f"Speedup: {results['iterrows'] / results['columnar']:.1f}x"))
+
+
+    def _time(self, convert, car_data: pd.DataFrame, lap: Lap, repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            convert(car_data, lap)
+            timings.append(time.perf_counter() - start_time)
+        return min(timings)
@@ -0,0 +1,93 @@
+import time
+from django.db import connection, transaction
+
+from static_data.importing.fingerprints import FINGERPRINT_TABLES
+from static_data.importing.replay import recorded_sessions
+from static_data.importing.sessions import load_sessions
+from static_data.management.commands.import_fastf1_data import Command as ImportCommand
+
+# * python manage.py benchmark_replay_import --fixtures fixtures/ --profile benchmark.json
+
+class Command(ImportCommand):
+    help = "Benchmark import_fastf1_data on recorded sessions (see record_fastf1_sessions), without network access."
+
+    # Add arguments to the command
+    def add_arguments(self, parser):
+        parser.add_argument("--fixtures", type=str, required=True, metavar="DIR", help="Directory of the recorded sessions")
+        parser.add_argument("--year", type=int, default=None, help="Only import the recorded sessions of this season")
+        parser.add_argument("--keep", action="store_true", help="Keep the imported rows, they are rolled back by default")
+        self.add_loader_arguments(parser)
+
+
+    def handle(self, **kwargs):
+        self.configure(**kwargs)
+        # Every table is written on every run and always measured
+        self.force = True
+        self.replay = kwargs.get("fixtures")
+        # The profiler of configure() only runs with --profile, the throughput table needs it always
+        self.profiler.enabled = True
+        self.profiler.start()
+
+        recordings = recorded_sessions(self.replay, kwargs.get("year"))
+        if not recordings:
+            self.profiler.stop()
+            self.stdout.write(self.style.WARNING(f"No recorded sessions found in {self.replay}"))
+            return
+
+        self.stdout.write(self.style.NOTICE(f"Importing {len(recordings)} recorded sessions into {connection.vendor} with {self.workers} workers..."))
+
+        start_time = time.time()
+
+        # The rows are rolled back so every run starts from the same database
+        with transaction.atomic():
+            self.import_recordings(recordings)
+            transaction.set_rollback(not kwargs.get("keep"))
+
+        self.complete_bulk_load()
+        if kwargs.get("keep"):
+            self.invalidate_caches()
+        elapsed_time = time.time() - start_time
+
+        self.stdout.write(self.throughput_table())
+        self.stdout.write(self.style.SUCCESS(f"Benchmark of {len(recordings)} recorded sessions finished in {elapsed_time:.1f} seconds."))
+
+        self.report_profile()
+
+
+    def import_recordings(self, recordings: list) -> None:
+        requests = [(recording.year, recording.event["EventName"], recording.session_name) for recording in recordings]
+        populated_events = set()
+        self.season_obj = None
+
+        loaded_sessions = self.profile_loading(load_sessions(requests, self.workers, driver_ahead=self.driver_ahead, replay_dir=self.replay))
+        for recording, (_, loaded_session, error) in zip(recordings, loaded_sessions):
+            if error is not None:
+                raise error
+
+            if self.season_obj is None or self.season_obj.year != recording.year:
+                self.populate_seasons(recording.year)
+
+            # Event level data comes from the first recorded session of the event
+            if (recording.year, recording.event["RoundNumber"]) not in populated_events:
+                self.populate_event_data(recording.year, loaded_session, recording.event)
+                populated_events.add((recording.year, recording.event["RoundNumber"]))
+
+            self.populate_session(recording.year, loaded_session, recording.event, recording.session_number)
+
+
+    def throughput_table(self) -> str:
+        # Conversion and write stages of every table, as recorded by the profiler
+        lines = [f"{'table':<24} {'rows':>10} {'convert s':>10} {'write s':>9} {'rows/s':>11} {'write rows/s':>13}"]
+        for table in FINGERPRINT_TABLES:
+            convert = self.profiler.stages.get(f"convert:{table}")
+            write = self.profiler.stages.get(f"write:{table}")
+            if write is None:
+                continue
+
+            convert_time = convert.wall_time if convert else 0.0
+            rows_per_second = write.rows / (convert_time + write.wall_time) if convert_time + write.wall_time else 0.0
+            lines.append(
+                f"{table:<24} {write.rows:>10} {convert_time:>10.2f} {write.wall_time:>9.2f} "
+                f"{rows_per_second:>11,.0f} {write.rows_per_second or 0:>13,.0f}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,78 @@
+import time
+from collections import defaultdict
+
+import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+
+from static_data.models import Lap, Result, Session, Telemetry
+from static_visuals.plotting.performance import team_speed_from_lap_aggregates, team_speed_from_telemetry
+
+# * python manage.py benchmark_team_speed --repeat 5
+
+
+def legacy_team_speed(year: int, session_id: int) -> pd.DataFrame:
+    """The pandas aggregation PerformanceVisuals used before the summary moved into SQL."""
+    lap_ids = Lap.objects.filter(session=session_id).values_list('id', flat=True).distinct()
+    telemetry = Telemetry.objects.filter(season_year=year, lap__in=lap_ids).values('speed', 'lap')
+    driver_constructor_dict = {entry["driver"]: entry["constructor"] for entry in Result.objects.filter(session=session_id).values("constructor", "driver")}
+
+    constructor_lap_ids = defaultdict(list)
+    for lap in Lap.objects.filter(session=session_id).values("id", "driver"):
+        constructor_id = driver_constructor_dict.get(lap["driver"])
+        if constructor_id is not None:
+            constructor_lap_ids[constructor_id].append(lap["id"])
+    lap_to_constructor = {lap_id: constructor_id for constructor_id, lap_ids in constructor_lap_ids.items() for lap_id in lap_ids}
+
+    telemetry_df = pd.DataFrame(telemetry)
+    if telemetry_df.empty:
+        return pd.DataFrame()
+    telemetry_df["constructor_id"] = telemetry_df["lap"].map(lap_to_constructor)
+    telemetry_df = telemetry_df.dropna(subset=["constructor_id"])
+    telemetry_df["constructor_id"] = telemetry_df["constructor_id"].astype(int)
+    return telemetry_df.groupby("constructor_id")["speed"].agg(["mean", "max"]).reset_index()
+
+
+class Command(BaseCommand):
+    help = "Benchmark the team speed summary of PerformanceVisuals: pandas over every sample vs. SQL aggregates."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--session", type=int, default=None, metavar="ID", help="Session to summarise, the race with the most laps by default")
+        parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs, the best one is reported")
+
+
+    def handle(self, **kwargs):
+        repeat = kwargs.get("repeat")
+        sessions = Session.objects.select_related("event")
+        if kwargs.get("session"):
+            session = sessions.filter(id=kwargs["session"]).first()
+        else:
+            session = sessions.filter(type="Race").annotate(laps=Count("lap")).order_by("-laps").first()
+        if session is None:
+            raise CommandError("No session to benchmark, import a race first")
+
+        year = session.event.season_year_id
+        samples = Telemetry.objects.filter(season_year=year, lap__session=session).count()
+        self.stdout.write(self.style.NOTICE(f"Summarising {year} {session.event.name} {session.type} ({samples:,} telemetry samples), best of {repeat}..."))
+
+        candidates = (
+            ("pandas", lambda: legacy_team_speed(year, session.id)),
+            ("sql telemetry", lambda: team_speed_from_telemetry(year, session.id)),
+            ("sql aggregates", lambda: team_speed_from_lap_aggregates(session.id)),
+        )
+        results = {}
+        for name, summarise in candidates:
+            results[name], rows = self._time(summarise, repeat)
+            self.stdout.write(f"{name:>15}: {results[name] * 1000:9.2f} ms  {rows:>3} rows")
+
+        for name in ("sql telemetry", "sql aggregates"):
+            self.stdout.write(self.style.SUCCESS(f"Speedup of {name}: {results['pandas'] / results[name]:.1f}x"))
+
+
+    def _time(self, summarise, repeat: int) -> tuple[float, int]:
+        timings = []
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            rows = len(summarise())
+            timings.append(time.perf_counter() - start_time)
+        return min(timings), rows
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from static_data.importing.summaries import build_pace_summaries
+from static_data.models import Session
+from static_data.reference import bump_data_version
+
+# * python manage.py build_pace_summaries --year 2024
+
+class Command(BaseCommand):
+    help = "Rebuild the per driver and per constructor pace summaries of already imported sessions."
+
+    # Add arguments to the command
+    def add_arguments(self, parser):
+        parser.add_argument("--year", type=int, default=None, help="Only rebuild the sessions of this season")
+        parser.add_argument("--session", type=int, default=None, metavar="ID", help="Only rebuild this session")
+
+
+    def handle(self, **kwargs):
+        sessions = Session.objects.order_by("id")
+        if kwargs.get("year"):
+            sessions = sessions.filter(event__season_year=kwargs["year"])
+        if kwargs.get("session"):
+            sessions = sessions.filter(id=kwargs["session"])
+
+        rows = 0
+        for session_id in sessions.values_list("id", flat=True):
+            rows += build_pace_summaries(session_id)
+        # Cached session bundles of the rebuilt seasons hold the old summaries
+        for year in sessions.order_by().values_list("event__season_year", flat=True).distinct():
+            bump_data_version(year)
+
+        self.stdout.write(self.style.SUCCESS(f"Pace summaries of {len(sessions)} sessions rebuilt ({rows} rows)."))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from static_data.importing.bulk_load import finish_bulk_load, missing_structures
+
+# * python manage.py finish_bulk_load
+
+class Command(BaseCommand):
+    help = "Rebuild and validate the sample tables' constraints and indexes after an interrupted --bulk-load import."
+
+    def handle(self, **kwargs):
+        missing = missing_structures()
+        if not missing:
+            self.stdout.write(self.style.SUCCESS("The sample tables are not in bulk-load mode, nothing to rebuild."))
+            return
+
+        self.stdout.write(self.style.NOTICE(f"Rebuilding {', '.join(missing)}..."))
+        removed = finish_bulk_load()
+
+        for table, rows in removed.items():
+            self.stdout.write(self.style.NOTICE(f"{table}: {rows} duplicated rows removed"))
+        self.stdout.write(self.style.SUCCESS("Sample tables rebuilt and validated."))
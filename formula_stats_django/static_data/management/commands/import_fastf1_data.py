@@ -1,20 +1,36 @@
 import fastf1 as ff1
-from fastf1 import plotting
 import pandas as pd
 import pycountry
 import logging
 import time
+from contextlib import nullcontext
+from django.db import connection, transaction
 from django.utils.timezone import make_aware
 from datetime import datetime, timezone
 from rapidfuzz import process
-from fastf1.core import Session
 # from fastf1.events import EventSchedule, Event
 
 from static_data.models import (
     Season, Event, Constructor, ConstructorColor, Driver, DriverRacingNumber, TyreCompounds, Session, Lap,
-    Telemetry, Result, Weather, RaceControlMessage, CarData, PositionData, Circuit
+    Telemetry, Result, Weather, RaceControlMessage, CarData, PositionData, Circuit, ImportFingerprint, LapTelemetry,
+    LapAggregate
     )
-from django.core.management.base import BaseCommand
+from static_data.importing.conversion import (
+    convert_samples, convert_frame, build_instances, aware_dates, pack_samples, aggregate_samples, PACKED_TELEMETRY_COLUMNS, POS_DATA_COLUMNS, CAR_DATA_COLUMNS, TELEMETRY_COLUMNS,
+    LAP_COLUMNS, LAP_DURATION_COLUMNS, LAP_FLAG_COLUMNS, RESULT_COLUMNS, RESULT_DURATION_COLUMNS, WEATHER_COLUMNS,
+    RACE_CONTROL_MESSAGE_COLUMNS
+    )
+from static_data.importing.loaders import get_sample_loader, SampleBuffer, upsert
+from static_data.importing.bulk_load import begin_bulk_load, finish_bulk_load, missing_structures
+from static_data.importing.fingerprints import Fingerprint, FINGERPRINT_TABLES
+from static_data.importing.lookups import lap_id_map, stored_fingerprints, IdentityResolver
+from static_data.importing.partitions import create_season_partitions
+from static_data.importing.profiling import ImportProfiler
+from static_data.importing.replay import recorded_sessions
+from static_data.importing.summaries import build_pace_summaries
+from static_data.importing.sessions import SessionData, load_sessions, scheduled_sessions, SAMPLE_KINDS
+from static_data.reference import bump_data_version
+from django.core.management.base import BaseCommand, CommandError
 
 # * python manage.py import_fastf1_data --year 2024 --event Australia
 
@@ -22,6 +38,20 @@ from django.core.management.base import BaseCommand
 
 logger = logging.getLogger(__name__)
 
+# Sample kind -> (model, FastF1 column -> model field, label used in the output)
+SAMPLE_TABLES = {
+    "pos_data": (PositionData, POS_DATA_COLUMNS, "Positional data"),
+    "car_data": (CarData, CAR_DATA_COLUMNS, "Car data"),
+    "telemetry": (Telemetry, TELEMETRY_COLUMNS, "Telemetry data"),
+}
+
+# --telemetry-storage -> fingerprinted tables the import leaves out
+SKIPPED_TABLES = {
+    "rows": {"lap_telemetry"},
+    "packed": {"telemetry"},
+    "both": set(),
+}
+
 class Command(BaseCommand):
     help = "Import F1 data into the database based on the FastF1 data."
 
@@ -29,27 +59,50 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument("--year", type=int, required=True, help="Season year (e.g., 2025)")
         parser.add_argument("--event", type=str, required=True, help="Grand Prix name (e.g., 'Monza')")
+        parser.add_argument("--replay", type=str, default=None, metavar="DIR", help="Import the sessions recorded in a fixture directory instead of loading them from FastF1")
+        self.add_loader_arguments(parser)
+    
+    
+    def add_loader_arguments(self, parser):
+        # Shared with import_fastf1_seasons
+        parser.add_argument("--no-copy", action="store_true", help="Load samples with bulk_create even on PostgreSQL")
+        parser.add_argument("--flush-rows", type=int, default=200000, help="Write samples every N rows to bound memory (0 to write once per session)")
+        parser.add_argument("--flush-per-driver", action="store_true", help="Write samples after every driver")
+        parser.add_argument("--workers", type=int, default=1, help="Load sessions in N worker processes")
+        parser.add_argument("--no-driver-ahead", action="store_true", help="Leave the driver ahead telemetry columns empty")
+        parser.add_argument("--force", action="store_true", help="Import every table, even if its source data is unchanged since the last import")
+        parser.add_argument("--telemetry-storage", choices=SKIPPED_TABLES, default="rows", help="Store telemetry one row per sample (rows), as packed arrays one row per lap (packed), or both")
+        parser.add_argument("--bulk-load", action="store_true", help="Drop the sample tables' unique constraints and lap indexes while loading and rebuild them at the end (PostgreSQL only)")
+        parser.add_argument("--profile", type=str, default=None, metavar="PATH", help="Profile the import stages and write the report to a JSON file")
+        parser.add_argument("--profile-table", action="store_true", help="Profile the import stages and print them as a table")
        
         
     def handle(self, **kwargs):
         year = kwargs.get("year")
         event = kwargs.get("event")
         
+        self.configure(**kwargs)
+        
         self.current_year = datetime.today().year
         # List of years for which data is available from FastF1
         self.years_available = list(range(2018, self.current_year + 1))
         # self.session_names = ['Practice 1', 'Practice 2', 'Practice 3', 'Sprint', 'Sprint Shootout', 'Sprint Qualifying', 'Qualifying', 'Race']
         # self.session_numbers = ["Session1", "Session2", "Session3", "Session4", "Session5"]
         
-        # Dictionary with available session for each event of the year.
-        # {'Pre-Season Testing': ['Practice 1', 'Practice 2', 'Practice 3', 'None', 'None']}
-        # {'Australian Grand Prix': ['Practice 1', 'Practice 2', 'Practice 3', 'Qualifying', 'Race']}
+        # Dictionary with available session for each event of the year, with their session numbers.
+        # {'Australian Grand Prix': [(1, 'Practice 1'), (2, 'Practice 2'), (3, 'Practice 3'), (4, 'Qualifying'), (5, 'Race')]}
         self.event_sessions = {}
-        for _, row in ff1.get_event_schedule(year).iterrows():
-            sessions = row[["Session1", "Session2", "Session3", "Session4", "Session5"]].tolist()
-            sessions = [session for session in sessions if session != "None"]
-        # Took this out of the for loop test if this works fine
-        self.event_sessions[row["EventName"]] = sessions
+        self.events = {}
+        if self.replay:
+            # Only the recorded sessions of the recorded events
+            for recording in recorded_sessions(self.replay, year):
+                self.events[recording.event["EventName"]] = recording.event
+                self.event_sessions.setdefault(recording.event["EventName"], []).append((recording.session_number, recording.session_name))
+            if not self.event_sessions:
+                raise CommandError(f"No sessions of {year} are recorded in {self.replay}")
+        else:
+            for _, row in ff1.get_event_schedule(year).iterrows():
+                self.event_sessions[row["EventName"]] = scheduled_sessions(row)
         
         self.matched_event = process.extractOne(event, list(self.event_sessions.keys()))[0]
         
@@ -66,41 +119,198 @@ class Command(BaseCommand):
         
         # Print out the time it took
         self.stdout.write(self.style.SUCCESS(f"Data import for {year} {event} completed in {int(minutes)} minutes and {int(seconds)} seconds."))
+        
+        self.complete_bulk_load()
+        self.invalidate_caches()
+        self.report_profile()
+
+
+    def configure(self, **kwargs):
+        # COPY based loader on PostgreSQL, bulk_create on every other backend
+        self.bulk_load = kwargs.get("bulk_load")
+        self.sample_loader = get_sample_loader(use_copy=not kwargs.get("no_copy"), bulk_load=self.bulk_load)
+        self.flush_rows = kwargs.get("flush_rows") or None
+        self.flush_per_driver = kwargs.get("flush_per_driver")
+        self.workers = kwargs.get("workers")
+        self.force = kwargs.get("force")
+        self.driver_ahead = not kwargs.get("no_driver_ahead")
+        self.telemetry_storage = kwargs.get("telemetry_storage") or "rows"
+        self.tables = [table for table in FINGERPRINT_TABLES if table not in SKIPPED_TABLES[self.telemetry_storage]]
+        self.replay = kwargs.get("replay")
+        # Seasons with sessions written by this run, only their cached data is reloaded
+        self.changed_years = set()
+        # Drivers, constructors and racing numbers resolved in memory for the whole run
+        self.identities = IdentityResolver.load()
+        # Stage timings, only measured when a report is asked for
+        self.profile_path = kwargs.get("profile")
+        self.profile_table = kwargs.get("profile_table")
+        self.profiler = ImportProfiler(enabled=bool(self.profile_path or self.profile_table)).start()
+        
+        self.prepare_sample_tables()
+    
+    
+    def prepare_sample_tables(self) -> None:
+        if self.bulk_load:
+            if connection.vendor != "postgresql":
+                raise CommandError("--bulk-load is only supported on PostgreSQL")
+            # Structures dropped by an interrupted bulk load stay dropped, the load resumes
+            dropped = begin_bulk_load()
+            self.stdout.write(self.style.NOTICE(f"Bulk-load mode, dropped {', '.join(dropped) or 'nothing (resuming)'}"))
+        elif missing_structures():
+            # Upserts need the natural key constraints
+            raise CommandError(
+                f"The sample tables are in bulk-load mode ({', '.join(missing_structures())} missing). "
+                "Resume with --bulk-load or rebuild them with `python manage.py finish_bulk_load`."
+            )
+    
+    
+    def complete_bulk_load(self) -> None:
+        if not self.bulk_load:
+            return
+        
+        self.stdout.write(self.style.NOTICE("Rebuilding the sample tables' constraints and indexes..."))
+        with self.profiler.stage("rebuild_sample_tables"):
+            removed = finish_bulk_load()
+        self.stdout.write(self.style.SUCCESS(
+            "Sample tables rebuilt and validated"
+            + "".join(f", {rows} duplicated {table} rows removed" for table, rows in removed.items() if rows)
+        ))
+    
+    
+    def invalidate_caches(self) -> None:
+        # Every web worker reloads its cached reference data and session bundles of the written seasons
+        if not self.changed_years:
+            self.stdout.write(self.style.NOTICE("No session was written, cached data is kept"))
+        for year in sorted(self.changed_years):
+            version = bump_data_version(year)
+            self.stdout.write(self.style.NOTICE(f"Data version of {year} bumped to {version}, its cached data will be reloaded"))
+
+
+    def report_profile(self) -> None:
+        self.profiler.stop()
+        if self.profile_path:
+            self.profiler.write_json(self.profile_path)
+            self.stdout.write(self.style.SUCCESS(f"Import profile written to {self.profile_path}"))
+        if self.profile_table:
+            self.stdout.write(self.profiler.table())
 
 
     def populate_data(self, year: int, event: str):
         self.populate_seasons(year)
         
-        loaded_session = ff1.get_session(year, event, 1)
-        loaded_session.load()
-        
         # loaded_schedule = ff1.get_event_schedule(year)
-        loaded_event = ff1.get_event(year, event)
-        
-        self.populate_circuit(loaded_session)
-        self.populate_event(year, loaded_event)
-        self.populate_tyre_compounds(year, loaded_session)
-        self.populate_constructors(year, loaded_session)
-        
-        
-        for i, sess in enumerate(self.event_sessions[self.matched_event], start=1):
-            print(i, sess)
-            loaded_session = ff1.get_session(year, event, sess)
-            loaded_session.load()
-            self.populate_drivers(year, loaded_session)
-            self.populate_sessions(year, loaded_session, loaded_event, i)
-            self.populate_results(year, loaded_session)
-            self.populate_weather(year, loaded_session)
-            self.populate_laps(year, loaded_session)
-            self.populate_race_control_messages(year, loaded_session)
-            self.populate_pos_data(year, loaded_session)
-            self.populate_car_data(year, loaded_session)
-            self.populate_telemetry(year, loaded_session)
+        if self.replay:
+            # Recordings are looked up by their exact event name
+            loaded_event, event = self.events[self.matched_event], self.matched_event
+        else:
+            loaded_event = ff1.get_event(year, event)
+        
+        sessions = self.event_sessions[self.matched_event]
+        requests = [(year, event, session_name) for _, session_name in sessions]
+        if self.workers > 1:
+            self.stdout.write(self.style.NOTICE(f"Loading {len(requests)} sessions with {self.workers} workers..."))
+        
+        wait_start = time.time()
+        loaded_sessions = self.profile_loading(load_sessions(requests, self.workers, driver_ahead=self.driver_ahead, replay_dir=self.replay))
+        for i, ((number, _), (_, loaded_session, error)) in enumerate(zip(sessions, loaded_sessions), start=1):
+            if error is not None:
+                raise error
+            self.stdout.write(self.style.NOTICE(f"Session {i} ready after waiting {time.time() - wait_start:.1f} seconds"))
+            
+            # In bulk-load mode every session is one transaction, an interrupted one leaves nothing behind
+            with transaction.atomic() if self.bulk_load else nullcontext():
+                # Event level data comes from the first session of the event
+                if i == 1:
+                    self.populate_event_data(year, loaded_session, loaded_event)
+                self.populate_session(year, loaded_session, loaded_event, number)
+            
+            wait_start = time.time()
+    
+    
+    def profile_loading(self, loaded_sessions):
+        # With workers the stage measures how long the writes wait for the pool, not the load itself
+        while True:
+            with self.profiler.stage("fastf1_load") as stage:
+                loaded = next(loaded_sessions, None)
+                if loaded is not None and loaded[1] is not None:
+                    stage.rows = loaded[1].fingerprints["laps"].row_count
+            if loaded is None:
+                return
+            yield loaded
+    
+    
+    def populate_event_data(self, year: int, session: SessionData, event) -> None:
+        with self.profiler.stage("populate_event_data"):
+            self.populate_circuit(session)
+            self.populate_event(year, event)
+            self.populate_tyre_compounds(year, session)
+            self.populate_constructors(year, session)
+    
+    
+    def populate_session(self, year: int, session: SessionData, event, i: int) -> None:
+        with self.profiler.stage("populate_sessions"):
+            self.populate_sessions(year, session, event, i)
+        
+        # Tables whose FastF1 source data is unchanged since the last import are skipped
+        stored = {} if self.force else stored_fingerprints(self.session_obj)
+        changed = [table for table in self.tables if stored.get(table) != session.fingerprints[table]]
+        if not changed:
+            self.stdout.write(self.style.NOTICE(f"{year} {session.session_info['Meeting']['Name']} {session.session_info['Name']} is unchanged, skipped."))
+            return
+        self.changed_years.add(year)
+        
+        with self.profiler.stage("populate_drivers") as stage:
+            self.populate_drivers(year, session)
+            stage.rows = len(session.results)
+        
+        populate_table = {
+            "results": self.populate_results,
+            "weather": self.populate_weather,
+            "laps": self.populate_laps,
+            "race_control_messages": self.populate_race_control_messages,
+        }
+        for table in self.tables:
+            if table not in changed:
+                self.stdout.write(self.style.NOTICE(f"{table} is unchanged, skipped."))
+            elif table in populate_table:
+                with self.profiler.stage(f"populate_{table}") as stage:
+                    populate_table[table](year, session)
+                    stage.rows = session.fingerprints[table].row_count
+                self.save_fingerprint(table, session.fingerprints[table])
+        
+        # The pace summaries are derived from the laps and results of the session
+        if "laps" in changed or "results" in changed:
+            with self.profiler.stage("populate_pace_summaries") as stage:
+                stage.rows = build_pace_summaries(self.session_obj.id)
+        
+        # The sample level tables are filled together, after the laps they belong to
+        sample_kinds = [kind for kind in SAMPLE_KINDS if kind in changed]
+        pack = "lap_telemetry" in changed
+        aggregate = "lap_aggregates" in changed
+        if sample_kinds or pack or aggregate:
+            self.lap_ids = lap_id_map(self.session_obj)
+            with self.profiler.stage("populate_lap_samples") as stage:
+                stage.rows = self.populate_lap_samples(year, session, sample_kinds, pack, aggregate)
+            for table in sample_kinds + ["lap_telemetry"] * pack + ["lap_aggregates"] * aggregate:
+                self.save_fingerprint(table, session.fingerprints[table])
+    
+    
+    def save_fingerprint(self, table: str, fingerprint: Fingerprint) -> None:
+        ImportFingerprint.objects.update_or_create(
+            session = self.session_obj,
+            table = table,
+            defaults = {
+                "row_count" : fingerprint.row_count,
+                "digest" : fingerprint.digest
+            }
+        )
         
     
     # Populate season data
     def populate_seasons(self, year:int) -> Season:
         self.season_obj, _ = Season.objects.get_or_create(year=year)
+        # The season's samples go to their own partitions on PostgreSQL
+        create_season_partitions(year)
         
         self.stdout.write(self.style.SUCCESS(f"Season {year} created successfully!"))
         
@@ -108,10 +318,10 @@ class Command(BaseCommand):
     
     
     # Populate circuit data
-    def populate_circuit(self, session: Session) -> Circuit:
+    def populate_circuit(self, session: SessionData) -> Circuit:
         self.circuit_obj, _ = Circuit.objects.get_or_create(
             name = session.session_info['Meeting']['Circuit']['ShortName'],
-            rotation = session.get_circuit_info().rotation,
+            rotation = session.circuit_rotation,
             country = session.session_info['Meeting']['Country']['Code'],
             location = session.session_info['Meeting']['Location']
         )
@@ -136,11 +346,11 @@ class Command(BaseCommand):
 
 
     # Populate tyre compounds
-    def populate_tyre_compounds(self, year: int, session: Session) -> TyreCompounds:
+    def populate_tyre_compounds(self, year: int, session: SessionData) -> TyreCompounds:
         # Populates tyre compounds available each season and their colors
         # season = Season.objects.get(year=year)
         
-        for name, color in plotting.get_compound_mapping(session).items():
+        for name, color in session.compound_colors.items():
             self.tyre_compounds_obj, _ = TyreCompounds.objects.get_or_create(
                 season_year = self.season_obj,
                 color = color,
@@ -152,18 +362,17 @@ class Command(BaseCommand):
     
     
     # Populate constructors and constructor colors
-    def populate_constructors(self, year: int, session: Session) -> tuple[Constructor, ConstructorColor]:
-        teams = plotting.list_team_names(session)
-        
-        for team in teams:
+    def populate_constructors(self, year: int, session: SessionData) -> tuple[Constructor, ConstructorColor]:
+        for team, colors in session.team_colors.items():
             self.constructor_obj, _ = Constructor.objects.get_or_create(name = team)
+            self.identities.remember_constructor(self.constructor_obj)
             
             self.constructor_colors_obj, _ = ConstructorColor.objects.get_or_create(
                 constructor = self.constructor_obj,
                 season_year = self.season_obj,
                 defaults = {
-                    "color_official" : plotting.get_team_color(team, session, colormap="official"),
-                    "color_fastf1" : plotting.get_team_color(team, session, colormap="fastf1")
+                    "color_official" : colors["official"],
+                    "color_fastf1" : colors["fastf1"]
                 }
             )
         self.stdout.write(self.style.SUCCESS(f"Constructor data for {year} created successfully!"))
@@ -172,7 +381,7 @@ class Command(BaseCommand):
         
     
     # Populate drivers and drivers numbers
-    def populate_drivers(self, year: int, session: Session) -> tuple[Driver, DriverRacingNumber]:
+    def populate_drivers(self, year: int, session: SessionData) -> tuple[Driver, DriverRacingNumber]:
         for _, row in session.results.iterrows():
             self.driver_obj, _ = Driver.objects.get_or_create(
                 first_name = row["FirstName"].split()[0],
@@ -182,9 +391,12 @@ class Command(BaseCommand):
             
             self.driver_racing_number_obj, _ = DriverRacingNumber.objects.get_or_create(
                 driver = self.driver_obj,
-                season_year = Season.objects.get(year = year),
+                season_year = self.season_obj,
                 defaults = {"racing_number" : row["DriverNumber"]}
             )
+            
+            self.identities.remember_driver(self.driver_obj)
+            self.identities.remember_racing_number(self.driver_racing_number_obj)
         
         self.stdout.write(self.style.SUCCESS(f"Driver data for {year} {session.session_info['Meeting']['Name']} {session.session_info['Name']} created successfully!"))
         
@@ -192,7 +404,7 @@ class Command(BaseCommand):
       
       
     # Populate sessions
-    def populate_sessions(self, year: int, session: Session, event: Event, i: int) -> Session:
+    def populate_sessions(self, year: int, session: SessionData, event: Event, i: int) -> Session:
         
         scheduled = make_aware((event[f"Session{i}DateUtc"]), timezone.utc)
         actual = make_aware(session.session_info["StartDate"] - session.session_info["GmtOffset"], timezone.utc)
@@ -214,349 +426,168 @@ class Command(BaseCommand):
     
     
     # Populate results
-    def populate_results(self, year:int, session: Session) -> Result:
-        for _, row in session.results.iterrows():
-            self.result_obj, _ = Result.objects.get_or_create(
-                session=self.session_obj,
-                driver=Driver.objects.get(first_name = row["FirstName"].split()[0], last_name = row["LastName"]),
-                constructor=Constructor.objects.get(name = row["TeamName"]),
-                defaults={
-                    "position": row["Position"] if pd.notna(row["Position"]) else None,
-                    "classified_position": row["ClassifiedPosition"],
-                    "grid_position": row["GridPosition"] if pd.notna(row["GridPosition"]) else None,
-                    "q1": row["Q1"].total_seconds() * 1000 if pd.notna(row["Q1"]) else None,
-                    "q2": row["Q2"].total_seconds() * 1000 if pd.notna(row["Q2"]) else None,
-                    "q3": row["Q3"].total_seconds() * 1000 if pd.notna(row["Q3"]) else None,
-                    "time": row["Time"].total_seconds() * 1000 if pd.notna(row["Time"]) else None,
-                    "status": row["Status"] if pd.notna(row["Status"]) else None,
-                    "points": row["Points"] if pd.notna(row["Points"]) else None
-                }
-            )
+    def populate_results(self, year:int, session: SessionData) -> None:
+        results = session.results
+        with self.profiler.stage("convert:results") as stage:
+            converted = convert_frame(results, columns=RESULT_COLUMNS, durations=RESULT_DURATION_COLUMNS)
+            converted["driver_id"] = [
+                self.identities.driver(first_name.split()[0], last_name)
+                for first_name, last_name in zip(results["FirstName"], results["LastName"])
+            ]
+            converted["constructor_id"] = [self.identities.constructor(team) for team in results["TeamName"]]
+            instances = build_instances(Result, converted, session_id=self.session_obj.id)
+            stage.rows = len(instances)
+        
+        with self.profiler.stage("write:results") as stage:
+            stage.rows = upsert(Result, instances, unique_fields=["session", "driver"])
             
         self.stdout.write(self.style.SUCCESS(f"Results data for {year} {session.session_info['Meeting']['Name']} {session.session_info['Name']} created successfully!"))
-        
-        return self.result_obj
     
     
     # Populate weather
-    def populate_weather(self, year:int,  session: Session) -> None:
-        for _, row in session.weather_data.iterrows():
-            self.weather_obj, _ = Weather.objects.get_or_create(
-                session = self.session_obj,
-                time_delta = row["Time"].total_seconds() * 1000,
-                defaults = {
-                    "air_temp" : row["AirTemp"],
-                    "track_temp" : row["TrackTemp"],
-                    "rainfall" : row["Rainfall"],
-                    "humidity" : row["Humidity"],
-                    "air_pressure" : row["Pressure"],
-                    "wind_speed" : row["WindSpeed"],
-                    "wind_direction" : row["WindDirection"]
-                }
-            )
+    def populate_weather(self, year:int,  session: SessionData) -> None:
+        weather_data = session.weather_data
+        with self.profiler.stage("convert:weather") as stage:
+            converted = convert_frame(weather_data, columns=WEATHER_COLUMNS, durations={"Time": "time_delta"})
+            instances = build_instances(Weather, converted, session_id=self.session_obj.id)
+            stage.rows = len(instances)
+        
+        with self.profiler.stage("write:weather") as stage:
+            stage.rows = upsert(Weather, instances, unique_fields=["session", "time_delta"])
             
         self.stdout.write(self.style.SUCCESS(f"Weather data for {year} {session.session_info['Meeting']['Name']} {session.session_info['Name']} created successfully!"))
         
     
     # Populate laps
-    def populate_laps(self, year: int, session: Session) -> Lap:
-        for _, row in session.laps.iterrows():
-            driver_name = plotting.get_driver_name(row["Driver"], session).split()
+    def populate_laps(self, year: int, session: SessionData) -> None:
+        # Resolve every driver of the session once instead of once per lap
+        driver_ids = {}
+        for abbreviation, full_name in session.driver_names.items():
+            driver_name = full_name.split()
             first_name, last_name = driver_name[0], driver_name[-1]
             
-            # Try exact match first
             try:
-                driver = Driver.objects.get(first_name=first_name, last_name=last_name)
+                driver_ids[abbreviation] = self.identities.match_driver(first_name, last_name)
             except Driver.DoesNotExist:
-                # Fuzzy match fallback
-                print(f"[WARNING] No exact match for: '{first_name} {last_name}'. Trying fuzzy match...")
-
-                # Fetch all drivers for the year
-                all_drivers = Driver.objects.filter(first_name=first_name)
-                all_last_names = list(all_drivers.values_list("last_name", flat=True))
-                
-                # Use rapidfuzz to get the closest match
-                match, score, _ = process.extractOne(last_name, all_last_names)
-
-                if match and score > 85:
-                    print(f"[INFO] Fuzzy matched last name '{last_name}' -> '{match}' (score={score})")
-                    driver = all_drivers.get(last_name=match)
-                else:
-                    print(f"[ERROR] No close match found for: '{first_name} {last_name}', year={year}")
-                    raise Driver.DoesNotExist(f"No match found for '{first_name} {last_name}'")
-
-
-            Lap.objects.get_or_create(
-                session=self.session_obj,
-                driver=driver,
-                lap_number=row["LapNumber"],
-                defaults={
-                    "lap_time": row["LapTime"].total_seconds() * 1000 if pd.notna(row["LapTime"]) else None,
-                    "stint": row["Stint"] if pd.notna(row["Stint"]) else None,
-                    "pit_out_time": row["PitOutTime"].total_seconds() * 1000 if pd.notna(row["PitOutTime"]) else None,
-                    "pit_in_time": row["PitInTime"].total_seconds() * 1000 if pd.notna(row["PitInTime"]) else None,
-                    "sector_1_time": row["Sector1Time"].total_seconds() * 1000 if pd.notna(row["Sector1Time"]) else None,
-                    "sector_2_time": row["Sector2Time"].total_seconds() * 1000 if pd.notna(row["Sector2Time"]) else None,
-                    "sector_3_time": row["Sector3Time"].total_seconds() * 1000 if pd.notna(row["Sector3Time"]) else None,
-                    "sector_1_session_time": row["Sector1SessionTime"].total_seconds() * 1000 if pd.notna(row["Sector1SessionTime"]) else None,
-                    "sector_2_session_time": row["Sector2SessionTime"].total_seconds() * 1000 if pd.notna(row["Sector2SessionTime"]) else None,
-                    "sector_3_session_time": row["Sector3SessionTime"].total_seconds() * 1000 if pd.notna(row["Sector3SessionTime"]) else None,
-                    "speed_i1": row["SpeedI1"] if pd.notna(row["SpeedI1"]) else None,
-                    "speed_i2": row["SpeedI2"] if pd.notna(row["SpeedI2"]) else None,
-                    "speed_fl": row["SpeedFL"] if pd.notna(row["SpeedFL"]) else None,
-                    "speed_st": row["SpeedST"] if pd.notna(row["SpeedST"]) else None,
-                    "is_personal_best": bool(row["IsPersonalBest"]) if pd.notna(row["IsPersonalBest"]) else False,
-                    "compound": row["Compound"] if pd.notna(row["Compound"]) else None,
-                    "tyre_life": row["TyreLife"] if pd.notna(row["TyreLife"]) else None,
-                    "fresh_tyre": bool(row["FreshTyre"]) if pd.notna(row["FreshTyre"]) else False,
-                    "track_status": row["TrackStatus"] if pd.notna(row["TrackStatus"]) else None,
-                    "position": row["Position"] if pd.notna(row["Position"]) else None,
-                    "deleted": bool(row["Deleted"]) if pd.notna(row["Deleted"]) else False,
-                    "deleted_reason": row["DeletedReason"] if pd.notna(row["DeletedReason"]) else None,
-                    "fastf1_generated": bool(row["FastF1Generated"]) if pd.notna(row["FastF1Generated"]) else False,
-                    "is_accurate": bool(row["IsAccurate"]) if pd.notna(row["IsAccurate"]) else False,
-                }
-
-            )
+                logger.error(f"No close match found for: '{first_name} {last_name}', year={year}")
+                raise
+        
+        laps = session.laps
+        with self.profiler.stage("convert:laps") as stage:
+            converted = convert_frame(laps, columns=LAP_COLUMNS, durations=LAP_DURATION_COLUMNS, flags=LAP_FLAG_COLUMNS)
+            converted["driver_id"] = laps["Driver"].map(driver_ids).tolist()
+            instances = build_instances(Lap, converted, session_id=self.session_obj.id)
+            stage.rows = len(instances)
+        
+        with self.profiler.stage("write:laps") as stage:
+            stage.rows = upsert(Lap, instances, unique_fields=["session", "driver", "lap_number"])
         
         self.stdout.write(self.style.SUCCESS(f"Laps data for {year} {session.session_info['Meeting']['Name']} {session.session_info['Name']} created successfully!"))
               
 
     # Populate race control messages
-    def populate_race_control_messages(self, year:int, session: Session) -> None:
-        for _, row in session.race_control_messages.iterrows():
-            RaceControlMessage.objects.get_or_create(
-                session = self.session_obj,
-                lap = row["Lap"],
-                date_time = make_aware(row["Time"], timezone.utc),
-                defaults = {
-                    "driver_number" : DriverRacingNumber.objects.get(racing_number = row["RacingNumber"], season_year = year) if pd.notna(row["RacingNumber"]) else None,
-                    "category" : row["Category"],
-                    "message" : row["Message"],
-                    "status" : row["Status"],
-                    "flag" : row["Flag"], 
-                    "scope" : row["Scope"],
-                    "sector" : row["Sector"] if pd.notna(row["Sector"]) else None
-                }
-            )
+    def populate_race_control_messages(self, year:int, session: SessionData) -> None:
+        messages = session.race_control_messages
+        with self.profiler.stage("convert:race_control_messages") as stage:
+            converted = convert_frame(messages, columns=RACE_CONTROL_MESSAGE_COLUMNS)
+            converted["date_time"] = aware_dates(messages["Time"], timezone.utc)
+            converted["driver_number_id"] = [
+                self.identities.racing_number(year, number) if pd.notna(number) else None
+                for number in messages["RacingNumber"]
+            ]
+            instances = build_instances(RaceControlMessage, converted, session_id=self.session_obj.id)
+            stage.rows = len(instances)
+        
+        with self.profiler.stage("write:race_control_messages") as stage:
+            stage.rows = upsert(RaceControlMessage, instances, unique_fields=["session", "date_time", "message"])
         
         self.stdout.write(self.style.SUCCESS(f"Race control messages data for {year} {session.session_info['Meeting']['Name']} {session.session_info['Name']} created successfully!"))
 
 
-    # Populate position data
-    def populate_pos_data(self, year:int, session: Session) -> None:
-        position_data_bulk = []
-
-        for driver in session.drivers:
-            driver_laps = session.laps.pick_drivers(driver)
-            
-            if not driver_laps["LapNumber"].notna().any():
-                self.stdout.write(self.style.NOTICE(f"No valid laps found for driver {driver}, skipping..."))
-                continue
-
-            max_lap = int(driver_laps["LapNumber"].max())
-            
-            driver_obj = Driver.objects.get(
-                first_name = session.results[session.results["DriverNumber"] == driver]["FirstName"].iloc[0].split()[0],
-                last_name = session.results[session.results["DriverNumber"] == driver]["LastName"].iloc[0]
-            )
-            
-            self.stdout.write(self.style.NOTICE(f"Creating positional data for driver number {driver}..."))
-            
-            for lap_number in range(1, max_lap + 1):
-                lap_data = driver_laps.pick_laps(lap_number)
-                lap_obj = Lap.objects.filter(session = self.session_obj, lap_number=lap_number, driver=driver_obj).first()
-
-                try:
-                    pos_data = lap_data.get_pos_data()
-                except Exception as e:
-                    self.stdout.write(self.style.WARNING(f"Skipping pos data lap {lap_number} for driver {driver} due to error: {e}"))
-                    logger.warning(f"Skipping pos data lap {lap_number} for driver {driver} due to error: {e}")
-                    continue
-                
-                self.stdout.write(self.style.NOTICE(f"Creating positional data for lap number {lap_number}..."))
-                
-                for _, row in pos_data.iterrows():
-                    date = row["Date"]
-                    if date and date.tzinfo is None:
-                        date = make_aware(date)
-
-                    session_time = row["SessionTime"]
-                    if pd.notna(session_time):
-                        session_time = session_time.to_pytimedelta()
-                    else:
-                        session_time = None
-
-                    time = row["Time"]
-                    time = time.total_seconds() * 1000 if pd.notna(time) else None
-
-                    position_data_bulk.append(PositionData(
-                        lap=lap_obj,
-                        date=date,
-                        status=row["Status"],
-                        x=row["X"],
-                        y=row["Y"],
-                        z=row["Z"],
-                        source=row["Source"],
-                        time=time,
-                        session_time=session_time
-                    ))
-
-        self.stdout.write(self.style.NOTICE(f"Populating tables..."))
-        PositionData.objects.bulk_create(
-            position_data_bulk,
-            batch_size=1000,
-            update_conflicts=True,
-            update_fields=["status", "x", "y", "z", "source", "time", "session_time"],
-            unique_fields=["lap", "date"]
-        )
-        
-        self.stdout.write(self.style.SUCCESS(f"Positional data for {year} {session.session_info['Meeting']['Name']} {session.session_info['Name']} created successfully!"))
-    
-    
-    # Populate car data
-    def populate_car_data(self, year:int, session: Session) -> None:
-        car_data_bulk = []
+    # Populate position data, car data, telemetry and packed lap telemetry
+    def populate_lap_samples(self, year: int, session: SessionData, kinds: list[str], pack: bool = False, aggregate: bool = False) -> int:
+        # Every driver's laps are extracted once and feed all requested tables
+        buffers = {kind: SampleBuffer(SAMPLE_TABLES[kind][0], self.sample_loader, self.flush_rows, self.profiler, season_year=year) for kind in kinds}
+        # The packed laps and lap aggregates are built from the telemetry samples, whether or not those are stored as rows
+        extract_kinds = kinds + ["telemetry"] if (pack or aggregate) and "telemetry" not in kinds else kinds
+        packed_rows = aggregate_rows = 0
         
         for driver in session.drivers:
-            driver_laps = session.laps.pick_drivers(driver)
+            driver_laps = session.driver_laps(driver)
             
             if not driver_laps["LapNumber"].notna().any():
                 self.stdout.write(self.style.NOTICE(f"No valid laps found for driver {driver}, skipping..."))
                 continue
-
-            max_lap = int(driver_laps["LapNumber"].max())
             
-            driver_obj = Driver.objects.get(
-                first_name = session.results[session.results["DriverNumber"] == driver]["FirstName"].iloc[0].split()[0],
-                last_name = session.results[session.results["DriverNumber"] == driver]["LastName"].iloc[0]
+            driver_id = self.identities.driver(
+                session.results[session.results["DriverNumber"] == driver]["FirstName"].iloc[0].split()[0],
+                session.results[session.results["DriverNumber"] == driver]["LastName"].iloc[0]
             )
             
-            self.stdout.write(self.style.NOTICE(f"Creating car data for driver number {driver}..."))
+            self.stdout.write(self.style.NOTICE(f"Creating lap samples for driver number {driver}..."))
             
-            for lap_number in range(1, max_lap + 1):
-                lap_data = driver_laps.pick_laps(lap_number)
-                lap_obj = Lap.objects.filter(session=self.session_obj, lap_number=lap_number, driver=driver_obj).first()
-                
-                try:
-                    car_data = lap_data.get_car_data()
-                except Exception as e:
-                    self.stdout.write(self.style.WARNING(f"Skipping car data lap {lap_number} for driver {driver} due to error: {e}"))
-                    logger.warning(f"Skipping car data lap {lap_number} for driver {driver} due to error: {e}")
-                    continue
-                self.stdout.write(self.style.NOTICE(f"Creating car data for lap number {lap_number}..."))
+            with self.profiler.stage("extract_lap_samples") as stage:
+                driver_samples = session.driver_samples(driver, extract_kinds)
+                stage.rows = sum(len(lap.samples) for laps in driver_samples.values() for lap in laps if lap.error is None)
+            packed_laps = []
+            lap_aggregates = []
+            for kind in extract_kinds:
+                _, columns, label = SAMPLE_TABLES[kind]
                 
-                for _, row in car_data.iterrows():
-                    date = row["Date"]
-                    if date and date.tzinfo is None:
-                        date = make_aware(date)
-                        
-                    session_time = row["SessionTime"]
-                    if pd.notna(session_time):
-                        session_time = session_time.to_pytimedelta()
-                    else:
-                        session_time = None
-                        
-                    time = row["Time"].total_seconds() * 1000 if pd.notna(row["Time"]) else None
-                
-                    car_data_bulk.append(CarData(
-                        lap = lap_obj,
-                        date = date,
-                        speed = row["Speed"],
-                        rpm = row["RPM"],
-                        gear = row["nGear"],
-                        throttle = row["Throttle"],
-                        brake = row["Brake"],
-                        drs = row["DRS"],
-                        source = row["Source"],
-                        time = time,
-                        session_time = session_time,
-                    ))
-        
-        self.stdout.write(self.style.NOTICE(f"Populating tables..."))
-        CarData.objects.bulk_create(
-            car_data_bulk,
-            batch_size=1000,
-            update_conflicts=True,
-            update_fields=["speed", "rpm", "gear", "throttle", "brake", "drs", "source", "time", "session_time"],
-            unique_fields=["lap", "date"]
-        )
-        
-        self.stdout.write(self.style.SUCCESS(f"Car data for {year} {session.session_info['Meeting']['Name']} {session.session_info['Name']} created successfully!"))
-        
-    
-    # Populate telemetry
-    def populate_telemetry(self, year:int, session: Session) -> None:
-        telemetry_data_bulk = []
-        
-        for driver in session.drivers:
-            driver_laps = session.laps.pick_drivers(driver)
-            
-            if not driver_laps["LapNumber"].notna().any():
-                self.stdout.write(self.style.NOTICE(f"No valid laps found for driver {driver}, skipping..."))
-                continue
-
-            max_lap = int(driver_laps["LapNumber"].max())
+                for lap in driver_samples[kind]:
+                    if lap.error is not None:
+                        self.stdout.write(self.style.WARNING(f"Skipping {label.lower()} lap {lap.lap_number} for driver {driver} due to error: {lap.error}"))
+                        logger.warning(f"Skipping {label.lower()} lap {lap.lap_number} for driver {driver} due to error: {lap.error}")
+                        continue
+                    
+                    lap_id = self.lap_ids.get((driver_id, lap.lap_number))
+                    if lap_id is None:
+                        self.stdout.write(self.style.WARNING(f"Lap {lap.lap_number} for driver {driver} not found in the database, skipping..."))
+                        continue
+                    
+                    if kind == "telemetry" and pack:
+                        with self.profiler.stage("convert:lap_telemetry") as stage:
+                            packed_laps.append(LapTelemetry(lap_id=lap_id, **pack_samples(lap.samples, PACKED_TELEMETRY_COLUMNS, LapTelemetry.CHANNELS)))
+                            stage.rows = 1
+                    if kind == "telemetry" and aggregate:
+                        with self.profiler.stage("convert:lap_aggregates") as stage:
+                            lap_aggregates.append(LapAggregate(lap_id=lap_id, **aggregate_samples(lap.samples)))
+                            stage.rows = 1
+                    if kind not in buffers:
+                        continue
+                    
+                    with self.profiler.stage(f"convert:{kind}") as stage:
+                        converted = convert_samples(lap.samples, columns)
+                        stage.rows = len(lap.samples)
+                    buffers[kind].add(lap_id, converted)
             
-            driver_obj = Driver.objects.get(
-                first_name = session.results[session.results["DriverNumber"] == driver]["FirstName"].iloc[0].split()[0],
-                last_name = session.results[session.results["DriverNumber"] == driver]["LastName"].iloc[0]
-            )
+            # Release the driver's samples before extracting the next driver
+            del driver_samples
             
-            self.stdout.write(self.style.NOTICE(f"Creating telemetry data for driver number {driver}..."))
+            # One row per lap, small enough to be written driver by driver
+            if packed_laps:
+                with self.profiler.stage("write:lap_telemetry") as stage:
+                    stage.rows = upsert(LapTelemetry, packed_laps, unique_fields=["lap"], batch_size=100)
+                    packed_rows += stage.rows
+            if lap_aggregates:
+                with self.profiler.stage("write:lap_aggregates") as stage:
+                    stage.rows = upsert(LapAggregate, lap_aggregates, unique_fields=["lap"])
+                    aggregate_rows += stage.rows
             
-            for lap_number in range(1, max_lap + 1):
-                lap_data = driver_laps.pick_laps(lap_number)
-                lap_obj = Lap.objects.filter(session=self.session_obj, lap_number=lap_number, driver=driver_obj).first()
-                
-                try:
-                    telemetry_data = lap_data.get_telemetry().add_differential_distance().add_distance().add_driver_ahead().add_relative_distance()
-                except Exception as e:
-                    self.stdout.write(self.style.WARNING(f"Skipping telemetry lap {lap_number} for driver {driver} due to error: {e}"))
-                    logger.warning(f"Skipping telemetry lap {lap_number} for driver {driver} due to error: {e}")
-                    continue
-                self.stdout.write(self.style.NOTICE(f"Creating telemetry data for lap number {lap_number}..."))
-                
-                for _, row in telemetry_data.iterrows():
-                    date = row["Date"]
-                    if date and date.tzinfo is None:
-                        date = make_aware(date)
-                        
-                    session_time = row["SessionTime"].to_pytimedelta() if pd.notna(row["SessionTime"]) else None
-                    
-                    time = row["Time"].total_seconds() * 1000 if pd.notna(row["Time"]) else None
-                    
-                    telemetry_data_bulk.append(Telemetry(
-                        lap = lap_obj,
-                        date = date,
-                        session_time = session_time,
-                        time = time,
-                        rpm = row["RPM"],
-                        speed = row["Speed"],
-                        n_gear = row["nGear"],
-                        throttle = row["Throttle"],
-                        brake = row["Brake"],
-                        drs = row["DRS"],
-                        source = row["Source"],
-                        status = row["Status"],
-                        x = row["X"],
-                        y = row["Y"],
-                        z = row["Z"],
-                        differential_distance = row["DifferentialDistance"],
-                        distance = row["Distance"],
-                        distance_to_driver_ahead = row["DistanceToDriverAhead"],
-                        relative_distance = row["RelativeDistance"]
-                    ))
+            if self.flush_per_driver:
+                for buffer in buffers.values():
+                    buffer.flush()
         
         self.stdout.write(self.style.NOTICE(f"Populating tables..."))
-        Telemetry.objects.bulk_create(
-            telemetry_data_bulk,
-            batch_size=1000,
-            update_conflicts=True,
-            update_fields=["session_time", "time", "rpm", "speed", "n_gear",
-                           "throttle", "brake", "drs", "source", "status",
-                           "x", "y", "z", "differential_distance", "distance", "distance_to_driver_ahead", "relative_distance"],
-            unique_fields=["lap", "date"]
-        )
-        
-        self.stdout.write(self.style.SUCCESS(f"Telemetry data for {year} {session.session_info['Meeting']['Name']} {session.session_info['Name']} created successfully!"))
\ No newline at end of file
+        for kind, buffer in buffers.items():
+            label = SAMPLE_TABLES[kind][2]
+            buffer.flush()
+            self.stdout.write(self.style.NOTICE(f"{label}: {buffer.rows_written} rows written, peak memory {buffer.peak_rss / 1024 ** 2:.0f} MB"))
+            self.stdout.write(self.style.SUCCESS(f"{label} for {year} {session.session_info['Meeting']['Name']} {session.session_info['Name']} created successfully!"))
+        
+        if pack:
+            self.stdout.write(self.style.SUCCESS(f"Packed lap telemetry for {year} {session.session_info['Meeting']['Name']} {session.session_info['Name']} created successfully! ({packed_rows} laps)"))
+        if aggregate:
+            self.stdout.write(self.style.SUCCESS(f"Lap aggregates for {year} {session.session_info['Meeting']['Name']} {session.session_info['Name']} created successfully! ({aggregate_rows} laps)"))
+        
+        return sum(buffer.rows_written for buffer in buffers.values()) + packed_rows + aggregate_rows
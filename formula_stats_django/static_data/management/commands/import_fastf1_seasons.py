@@ -0,0 +1,161 @@
+import fastf1 as ff1
+import pandas as pd
+import logging
+import time
+from django.db import transaction
+from django.utils import timezone
+
+from static_data.models import ImportJob
+from static_data.importing.lookups import IdentityResolver
+from static_data.importing.sessions import load_sessions, scheduled_sessions
+from static_data.management.commands.import_fastf1_data import Command as ImportCommand
+
+# * python manage.py import_fastf1_seasons --start-year 2023 --end-year 2025 --workers 4
+
+logger = logging.getLogger(__name__)
+
+class Command(ImportCommand):
+    help = "Import whole seasons from FastF1, resuming from the import job manifest."
+
+    # Add arguments to the command
+    def add_arguments(self, parser):
+        parser.add_argument("--start-year", type=int, required=True, help="First season to import (e.g., 2023)")
+        parser.add_argument("--end-year", type=int, default=None, help="Last season to import, defaults to --start-year")
+        parser.add_argument("--retry-failed", action="store_true", help="Run failed jobs again, they are skipped otherwise")
+        self.add_loader_arguments(parser)
+
+
+    def handle(self, **kwargs):
+        start_year = kwargs.get("start_year")
+        end_year = kwargs.get("end_year") or start_year
+        years = list(range(start_year, end_year + 1))
+
+        self.configure(**kwargs)
+
+        self.stdout.write(self.style.NOTICE(f"Planning import jobs for {start_year}-{end_year}..."))
+        self.plan_jobs(years)
+
+        jobs = self.runnable_jobs(years, kwargs.get("retry_failed"))
+        if not jobs:
+            self.stdout.write(self.style.SUCCESS("Nothing to import, every planned job is done."))
+            self.complete_bulk_load()
+            return
+
+        self.stdout.write(self.style.NOTICE(f"Running {len(jobs)} import jobs with {self.workers} workers..."))
+
+        start_time = time.time()
+
+        self.run_jobs(jobs)
+
+        elapsed_time = time.time() - start_time
+        counts = {status: ImportJob.objects.filter(year__in=years, status=status).count() for status in ImportJob.Status.values}
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Season import for {start_year}-{end_year} finished in {int(elapsed_time // 60)} minutes and {int(elapsed_time % 60)} seconds: "
+            + ", ".join(f"{count} {status}" for status, count in counts.items())
+        ))
+        
+        self.complete_bulk_load()
+        self.invalidate_caches()
+        self.report_profile()
+
+
+    def plan_jobs(self, years: list[int]) -> None:
+        # One job per session that already took place, jobs planned by an earlier run are kept as they are
+        now = pd.Timestamp.now(tz="UTC").tz_localize(None)
+        self.schedules = {}
+
+        for year in years:
+            self.schedules[year] = ff1.get_event_schedule(year, include_testing=False)
+
+            for _, event in self.schedules[year].iterrows():
+                for number, name in scheduled_sessions(event):
+                    session_date = event.get(f"Session{number}DateUtc")
+                    if pd.isna(session_date) or session_date > now:
+                        continue
+
+                    ImportJob.objects.get_or_create(
+                        year = year,
+                        round_number = event["RoundNumber"],
+                        session_number = number,
+                        defaults = {
+                            "event_name" : event["EventName"],
+                            "session_name" : name
+                        }
+                    )
+
+
+    def runnable_jobs(self, years: list[int], retry_failed: bool = False) -> list[ImportJob]:
+        # Jobs left running by an interrupted import are picked up again
+        statuses = [ImportJob.Status.PENDING, ImportJob.Status.RUNNING]
+        if retry_failed:
+            statuses.append(ImportJob.Status.FAILED)
+
+        return list(ImportJob.objects.filter(year__in=years, status__in=statuses).order_by("year", "round_number", "session_number"))
+
+
+    def run_jobs(self, jobs: list[ImportJob]) -> None:
+        # Sessions of different events load side by side in the pool, the writes happen here one job at a time
+        requests = [(job.year, job.round_number, job.session_name) for job in jobs]
+        populated_events = set()
+
+        for job, (_, loaded_session, error) in zip(jobs, self.profile_loading(load_sessions(requests, self.workers, driver_ahead=self.driver_ahead))):
+            self.start_job(job)
+
+            if error is not None:
+                self.fail_job(job, error)
+                continue
+
+            loaded_event = self.schedules[job.year].get_event_by_round(job.round_number)
+
+            try:
+                # A failed job leaves nothing half written behind
+                with transaction.atomic():
+                    if getattr(self, "season_obj", None) is None or self.season_obj.year != job.year:
+                        self.populate_seasons(job.year)
+
+                    # Event level data comes from the first session of the event imported in this run
+                    if (job.year, job.round_number) not in populated_events:
+                        self.populate_event_data(job.year, loaded_session, loaded_event)
+                        populated_events.add((job.year, job.round_number))
+
+                    self.populate_session(job.year, loaded_session, loaded_event, job.session_number)
+            except Exception as e:
+                # Rows remembered during the rolled back job are gone, start from what the database holds
+                self.identities = IdentityResolver.load()
+                self.season_obj = None
+                populated_events.discard((job.year, job.round_number))
+                self.fail_job(job, e)
+                continue
+
+            self.finish_job(job)
+
+
+    def start_job(self, job: ImportJob) -> None:
+        job.status = ImportJob.Status.RUNNING
+        job.attempts += 1
+        job.error = None
+        job.started_at = timezone.now()
+        job.finished_at = None
+        job.save()
+
+        self.stdout.write(self.style.NOTICE(f"Importing {job.year} {job.event_name} {job.session_name} (attempt {job.attempts})..."))
+
+
+    def finish_job(self, job: ImportJob) -> None:
+        job.status = ImportJob.Status.DONE
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "finished_at"])
+
+        self.stdout.write(self.style.SUCCESS(f"Import of {job.year} {job.event_name} {job.session_name} done."))
+
+
+    def fail_job(self, job: ImportJob, error: Exception) -> None:
+        logger.error(f"Import of {job.year} {job.event_name} {job.session_name} failed: {error}")
+
+        job.status = ImportJob.Status.FAILED
+        job.error = str(error)
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "error", "finished_at"])
+
+        self.stdout.write(self.style.WARNING(f"Import of {job.year} {job.event_name} {job.session_name} failed: {error}"))
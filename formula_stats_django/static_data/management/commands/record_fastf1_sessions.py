@@ -0,0 +1,29 @@
+import fastf1 as ff1
+from django.core.management.base import BaseCommand
+
+from static_data.importing.sessions import record_fastf1_session, scheduled_sessions
+
+# * python manage.py record_fastf1_sessions --year 2024 --event Australia --session Race --fixtures fixtures/
+
+class Command(BaseCommand):
+    help = "Record FastF1 sessions as replay fixtures for offline imports and benchmarks."
+
+    # Add arguments to the command
+    def add_arguments(self, parser):
+        parser.add_argument("--year", type=int, required=True, help="Season year (e.g., 2025)")
+        parser.add_argument("--event", type=str, required=True, help="Grand Prix name (e.g., 'Monza')")
+        parser.add_argument("--session", type=str, action="append", default=None, help="Session to record (e.g., 'Race'), can be repeated; every session of the event by default")
+        parser.add_argument("--fixtures", type=str, required=True, metavar="DIR", help="Directory the fixtures are written to")
+
+
+    def handle(self, **kwargs):
+        year = kwargs.get("year")
+        fixtures = kwargs.get("fixtures")
+
+        event = ff1.get_event(year, kwargs.get("event"))
+        session_names = kwargs.get("session") or [name for _, name in scheduled_sessions(event)]
+
+        for session_name in session_names:
+            self.stdout.write(self.style.NOTICE(f"Recording {year} {event['EventName']} {session_name}..."))
+            path = record_fastf1_session(year, event["EventName"], session_name, fixtures)
+            self.stdout.write(self.style.SUCCESS(f"{year} {event['EventName']} {session_name} recorded to {path}"))
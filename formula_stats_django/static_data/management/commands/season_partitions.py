@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from static_data.importing.partitions import (
+    create_season_partitions, detach_season_partitions, drop_season_partitions, season_partitions, PARTITIONED_TABLES
+    )
+
+# * python manage.py season_partitions --list
+# * python manage.py season_partitions --detach 2018
+
+class Command(BaseCommand):
+    help = "List, create, detach or drop the season partitions of the sample tables (PostgreSQL only)."
+
+    # Add arguments to the command
+    def add_arguments(self, parser):
+        actions = parser.add_mutually_exclusive_group(required=True)
+        actions.add_argument("--list", action="store_true", help="List the partitions of every sample table")
+        actions.add_argument("--create", type=int, metavar="YEAR", help="Create the partitions of a season")
+        actions.add_argument("--detach", type=int, metavar="YEAR", help="Detach the partitions of a season, keeping their tables for archiving")
+        actions.add_argument("--drop", type=int, metavar="YEAR", help="Drop the partitions of a season with all their samples")
+
+
+    def handle(self, **kwargs):
+        if connection.vendor != "postgresql":
+            raise CommandError(f"The sample tables are only partitioned on PostgreSQL, not on {connection.vendor}")
+
+        if kwargs.get("list"):
+            for table, partitions in season_partitions().items():
+                self.stdout.write(self.style.NOTICE(table))
+                for name, bound, rows in partitions:
+                    self.stdout.write(f"  {name:<24} {bound:<28} ~{rows:,} rows")
+            return
+
+        if kwargs.get("create"):
+            year, names = kwargs["create"], create_season_partitions(kwargs["create"])
+            action = "created"
+        elif kwargs.get("detach"):
+            year, names = kwargs["detach"], detach_season_partitions(kwargs["detach"])
+            action = "detached"
+        else:
+            year, names = kwargs["drop"], drop_season_partitions(kwargs["drop"])
+            action = "dropped"
+
+        if not names:
+            self.stdout.write(self.style.WARNING(f"No partitions of {', '.join(PARTITIONED_TABLES)} {action} for {year}."))
+            return
+        self.stdout.write(self.style.SUCCESS(f"Season {year} partitions {action}: {', '.join(names)}"))
@@ -0,0 +1,75 @@
+from django.db import migrations, models
+
+# Natural key of every table that gets a unique constraint, see the operations below
+NATURAL_KEYS = {
+    "Lap": ("session", "driver", "lap_number"),
+    "RaceControlMessage": ("session", "date_time", "message"),
+    "Result": ("session", "driver"),
+    "Weather": ("session", "time_delta"),
+}
+
+
+def delete_duplicates(apps, schema_editor):
+    """Deletes all but the newest row of every duplicated natural key.
+
+    The importer used to insert a session again when it was imported twice; the newest
+    row is the one the upserting importer would have kept. Rows with a NULL in their
+    key never conflict, as in the unique constraints, and are kept.
+    """
+    quote = schema_editor.quote_name
+    for model_name, fields in NATURAL_KEYS.items():
+        model = apps.get_model("static_data", model_name)
+        table = quote(model._meta.db_table)
+        primary_key = quote(model._meta.pk.column)
+        matches = " AND ".join(
+            f"newer.{column} = {table}.{column}"
+            for column in (quote(model._meta.get_field(field).column) for field in fields)
+        )
+        schema_editor.execute(
+            f"DELETE FROM {table} WHERE EXISTS (SELECT 1 FROM {table} AS newer "
+            f"WHERE {matches} AND newer.{primary_key} > {table}.{primary_key})"
+        )
+
+
+class Migration(migrations.Migration):
+
+    # Folded from a lap index that the natural key constraint replaced right after
+    replaces = [
+        ("static_data", "0003_lap_session_driver_index"),
+        ("static_data", "0004_natural_key_constraints"),
+    ]
+
+    dependencies = [
+        ("static_data", "0002_alter_telemetry_drs"),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="lap",
+            constraint=models.UniqueConstraint(
+                fields=("session", "driver", "lap_number"),
+                name="unique_session_driver_lap_number",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="racecontrolmessage",
+            constraint=models.UniqueConstraint(
+                fields=("session", "date_time", "message"),
+                name="unique_session_datetime_message_race_control",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="result",
+            constraint=models.UniqueConstraint(
+                fields=("session", "driver"), name="unique_session_driver_result"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="weather",
+            constraint=models.UniqueConstraint(
+                fields=("session", "time_delta"),
+                name="unique_session_time_delta_weather",
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.1 on 2026-10-18 13:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("static_data", "0003_natural_key_constraints"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("year", models.IntegerField()),
+                ("round_number", models.IntegerField()),
+                ("event_name", models.CharField(max_length=100)),
+                ("session_number", models.IntegerField()),
+                ("session_name", models.CharField(max_length=50)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.IntegerField(default=0)),
+                ("error", models.TextField(null=True)),
+                ("started_at", models.DateTimeField(null=True)),
+                ("finished_at", models.DateTimeField(null=True)),
+            ],
+            options={
+                "db_table": "import_jobs",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("year", "round_number", "session_number"),
+                        name="unique_year_round_session_import_job",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.1 on 2026-10-18 13:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("static_data", "0005_import_jobs"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportFingerprint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("table", models.CharField(max_length=30)),
+                ("row_count", models.BigIntegerField()),
+                ("digest", models.CharField(max_length=64)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "session",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="static_data.session",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "import_fingerprints",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("session", "table"),
+                        name="unique_session_table_import_fingerprint",
+                    )
+                ],
+            },
+        ),
+    ]
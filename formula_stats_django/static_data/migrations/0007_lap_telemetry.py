@@ -0,0 +1,49 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("static_data", "0006_import_fingerprints"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LapTelemetry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("samples", models.IntegerField()),
+                ("time", models.BinaryField(help_text="Milliseconds")),
+                ("speed", models.BinaryField()),
+                ("rpm", models.BinaryField()),
+                ("n_gear", models.BinaryField()),
+                ("throttle", models.BinaryField()),
+                ("brake", models.BinaryField()),
+                ("drs", models.BinaryField()),
+                ("distance", models.BinaryField()),
+                ("x", models.BinaryField()),
+                ("y", models.BinaryField()),
+                (
+                    "lap",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="static_data.lap",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "lap_telemetry",
+            },
+        ),
+    ]
@@ -0,0 +1,229 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.migrations.exceptions import IrreversibleError
+
+# Sample tables partitioned by season on PostgreSQL
+SAMPLE_TABLES = ("telemetry", "car_data", "pos_data")
+
+LAP_SEASON_JOIN = (
+    "JOIN laps ON laps.id = {table}.lap_id "
+    "JOIN sessions ON sessions.id = laps.session_id "
+    "JOIN events ON events.id = sessions.event_id"
+)
+
+
+def _partition_table(schema_editor, table: str) -> None:
+    """Rebuilds a sample table as a table partitioned by LIST (season_year_id).
+
+    The rows are copied into a new partitioned table with their season filled in, the
+    old table is dropped and the new one takes its name. The primary key becomes
+    (id, season_year_id), as PostgreSQL requires the partition key in every unique
+    index; the remaining indexes and foreign keys are recreated under their names.
+    """
+    partitioned = f"{table}_partitioned"
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexdef FROM pg_indexes WHERE schemaname = current_schema() AND tablename = %s "
+            "AND indexname NOT IN (SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p')",
+            [table, table],
+        )
+        indexes = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'",
+            [table],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            "SELECT attname FROM pg_attribute WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped "
+            "AND attname NOT IN ('id', 'season_year_id') ORDER BY attnum",
+            [table],
+        )
+        columns = [f'"{row[0]}"' for row in cursor.fetchall()]
+        cursor.execute("SELECT year FROM seasons ORDER BY year")
+        years = [row[0] for row in cursor.fetchall()]
+
+    execute = schema_editor.execute
+    execute(
+        f"CREATE TABLE {partitioned} (LIKE {table} INCLUDING DEFAULTS) PARTITION BY LIST (season_year_id)"
+    )
+    execute(f"CREATE SEQUENCE {table}_partitioned_id_seq")
+    execute(
+        f"ALTER TABLE {partitioned} ALTER COLUMN id SET DEFAULT nextval('{table}_partitioned_id_seq')"
+    )
+
+    for year in years:
+        execute(
+            f"CREATE TABLE {table}_{year} PARTITION OF {partitioned} FOR VALUES IN ({year})"
+        )
+    execute(f"CREATE TABLE {table}_default PARTITION OF {partitioned} DEFAULT")
+
+    execute(
+        f"INSERT INTO {partitioned} (id, season_year_id, {', '.join(columns)}) "
+        f"SELECT {table}.id, events.season_year_id, {', '.join(f'{table}.{column}' for column in columns)} "
+        f"FROM {table} {LAP_SEASON_JOIN.format(table=table)}"
+    )
+    execute(
+        f"SELECT setval('{table}_partitioned_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM {partitioned}"
+    )
+
+    execute(f"DROP TABLE {table}")
+    execute(f"ALTER TABLE {partitioned} RENAME TO {table}")
+    execute(f"ALTER SEQUENCE {table}_partitioned_id_seq RENAME TO {table}_id_seq")
+    execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, season_year_id)"
+    )
+
+    for index in indexes:
+        execute(index)
+    for name, definition in foreign_keys:
+        execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} {definition}")
+
+
+def partition_sample_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        # Other databases only get the season column
+        for table in SAMPLE_TABLES:
+            schema_editor.execute(
+                f"UPDATE {table} SET season_year_id = (SELECT events.season_year_id FROM {table} AS sample "
+                f"{LAP_SEASON_JOIN.format(table='sample')} WHERE sample.id = {table}.id)"
+            )
+        return
+
+    for table in SAMPLE_TABLES:
+        _partition_table(schema_editor, table)
+
+
+def unpartition_sample_tables(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        raise IrreversibleError(
+            "The partitioned sample tables cannot be converted back"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("static_data", "0007_lap_telemetry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cardata",
+            name="season_year",
+            field=models.ForeignKey(
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="static_data.season",
+            ),
+        ),
+        migrations.AddField(
+            model_name="positiondata",
+            name="season_year",
+            field=models.ForeignKey(
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="static_data.season",
+            ),
+        ),
+        migrations.AddField(
+            model_name="telemetry",
+            name="season_year",
+            field=models.ForeignKey(
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="static_data.season",
+            ),
+        ),
+        # Unique indexes have to include the partition key, the lap indexes are rebuilt
+        # on the partitioned tables
+        migrations.RemoveConstraint(
+            model_name="cardata",
+            name="unique_lap_datetime_car_data",
+        ),
+        migrations.RemoveConstraint(
+            model_name="positiondata",
+            name="unique_lap_datetime_pos_data",
+        ),
+        migrations.RemoveConstraint(
+            model_name="telemetry",
+            name="unique_lap_datetime_telemetry_data",
+        ),
+        migrations.RemoveIndex(
+            model_name="cardata",
+            name="idx_car_data_lap",
+        ),
+        migrations.RemoveIndex(
+            model_name="positiondata",
+            name="idx_pos_data_lap",
+        ),
+        migrations.RemoveIndex(
+            model_name="telemetry",
+            name="idx_telemetry_lap",
+        ),
+        migrations.RunPython(partition_sample_tables, unpartition_sample_tables),
+        migrations.AlterField(
+            model_name="cardata",
+            name="season_year",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="static_data.season",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="positiondata",
+            name="season_year",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="static_data.season",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="telemetry",
+            name="season_year",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="static_data.season",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="cardata",
+            constraint=models.UniqueConstraint(
+                fields=("season_year", "lap", "date"),
+                name="unique_lap_datetime_car_data",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="positiondata",
+            constraint=models.UniqueConstraint(
+                fields=("season_year", "lap", "date"),
+                name="unique_lap_datetime_pos_data",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="telemetry",
+            constraint=models.UniqueConstraint(
+                fields=("season_year", "lap", "date"),
+                name="unique_lap_datetime_telemetry_data",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cardata",
+            index=models.Index(fields=["lap"], name="idx_car_data_lap"),
+        ),
+        migrations.AddIndex(
+            model_name="positiondata",
+            index=models.Index(fields=["lap"], name="idx_pos_data_lap"),
+        ),
+        migrations.AddIndex(
+            model_name="telemetry",
+            index=models.Index(fields=["lap"], name="idx_telemetry_lap"),
+        ),
+    ]
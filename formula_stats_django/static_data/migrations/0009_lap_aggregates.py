@@ -0,0 +1,59 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("static_data", "0008_partition_sample_tables"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LapAggregate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("samples", models.IntegerField()),
+                ("max_speed", models.FloatField(null=True)),
+                ("mean_speed", models.FloatField(null=True)),
+                ("min_speed", models.FloatField(null=True)),
+                ("max_rpm", models.FloatField(null=True)),
+                (
+                    "full_throttle_pct",
+                    models.FloatField(
+                        help_text="Share of samples at full throttle, in percent",
+                        null=True,
+                    ),
+                ),
+                (
+                    "braking_pct",
+                    models.FloatField(
+                        help_text="Share of samples with the brake applied, in percent",
+                        null=True,
+                    ),
+                ),
+                ("drs_open_distance", models.FloatField(help_text="Meters", null=True)),
+                ("gear_changes", models.IntegerField()),
+                (
+                    "lap",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="static_data.lap",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "lap_aggregates",
+            },
+        ),
+    ]
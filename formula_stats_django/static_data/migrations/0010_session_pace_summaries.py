@@ -0,0 +1,66 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("static_data", "0009_lap_aggregates"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SessionPaceSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("outliers_removed", models.BooleanField()),
+                ("laps", models.IntegerField()),
+                ("min_lap_time", models.IntegerField(help_text="Milliseconds")),
+                ("q1_lap_time", models.FloatField(help_text="Milliseconds")),
+                ("median_lap_time", models.FloatField(help_text="Milliseconds")),
+                ("q3_lap_time", models.FloatField(help_text="Milliseconds")),
+                ("max_lap_time", models.IntegerField(help_text="Milliseconds")),
+                (
+                    "constructor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="static_data.constructor",
+                    ),
+                ),
+                (
+                    "driver",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="static_data.driver",
+                    ),
+                ),
+                (
+                    "session",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="static_data.session",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "session_pace_summaries",
+                "indexes": [
+                    models.Index(
+                        fields=["session", "outliers_removed"],
+                        name="idx_pace_summary_session",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("static_data", "0010_session_pace_summaries"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sessionpacesummary",
+            name="lower_bound_lap_time",
+            field=models.FloatField(
+                help_text="Milliseconds, faster laps of the session are outliers",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="sessionpacesummary",
+            name="outlier_laps",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sessionpacesummary",
+            name="upper_bound_lap_time",
+            field=models.FloatField(
+                help_text="Milliseconds, slower laps of the session are outliers",
+                null=True,
+            ),
+        ),
+    ]
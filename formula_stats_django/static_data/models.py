@@ -1,3 +1,4 @@
+import numpy as np
 from django.db import models
 """
 Order in which the models need to populated with the data to ensure proper functionality
@@ -18,6 +19,9 @@ of the foreign keys.
 13. RaceControlMessage: Depends on Lap, so insert after Lap.
 14. CarData: Depends on Lap, so insert after Lap.
 15. PositionData: Depends on Lap, so insert after Lap.
+16. LapTelemetry: Depends on Lap, so insert after Lap.
+17. LapAggregate: Depends on Lap, so insert after Lap.
+18. SessionPaceSummary: Depends on Lap and Result, so insert after both.
 
 """
 
@@ -138,10 +142,15 @@ class Lap(models.Model):
     
     class Meta:
         db_table = "laps"
+        constraints = [
+        models.UniqueConstraint(fields=["session", "driver", "lap_number"], name="unique_session_driver_lap_number")
+        ]
 
 
 class Telemetry(models.Model):
     lap = models.ForeignKey(Lap, on_delete=models.CASCADE)
+    # Partition key on PostgreSQL, the season of the lap
+    season_year = models.ForeignKey(Season, on_delete=models.CASCADE, db_index=False)
     date = models.DateTimeField(null=True)
     session_time = models.DurationField(null=True)
     time = models.IntegerField(null=True)
@@ -165,13 +174,110 @@ class Telemetry(models.Model):
     class Meta:
         db_table = "telemetry"
         constraints = [
-        models.UniqueConstraint(fields=["lap", "date"], name="unique_lap_datetime_telemetry_data")
+        models.UniqueConstraint(fields=["season_year", "lap", "date"], name="unique_lap_datetime_telemetry_data")
         ]
         indexes = [
             models.Index(fields=["lap"], name="idx_telemetry_lap")
         ]
 
 
+class LapTelemetry(models.Model):
+    """
+    Telemetry of one lap as packed arrays, one row per lap.
+    
+    A compact alternative to the one row per sample `Telemetry` table, filled when the
+    importer runs with `--telemetry-storage packed` (or `both`). Every channel is a
+    little-endian array of the dtype given in `CHANNELS`, so a lap is a single-row
+    fetch that decodes straight into NumPy. Missing float samples are NaN, missing
+    integer samples are stored as -1 and masked when decoded.
+    """
+    # Channel -> dtype of its packed array
+    CHANNELS = {
+        "time": "<i4",
+        "speed": "<f4",
+        "rpm": "<f4",
+        "n_gear": "<i2",
+        "throttle": "<f4",
+        "brake": "<i1",
+        "drs": "<i2",
+        "distance": "<f4",
+        "x": "<f4",
+        "y": "<f4",
+    }
+    
+    lap = models.OneToOneField(Lap, on_delete=models.CASCADE)
+    samples = models.IntegerField()
+    time = models.BinaryField(help_text="Milliseconds")
+    speed = models.BinaryField()
+    rpm = models.BinaryField()
+    n_gear = models.BinaryField()
+    throttle = models.BinaryField()
+    brake = models.BinaryField()
+    drs = models.BinaryField()
+    distance = models.BinaryField()
+    x = models.BinaryField()
+    y = models.BinaryField()
+    
+    class Meta:
+        db_table = "lap_telemetry"
+    
+    def arrays(self, channels: list[str] | None = None) -> dict[str, np.ndarray]:
+        """Decodes the packed channels.
+        
+        Args:
+            channels (list[str] | None): Channels to decode, all of `CHANNELS` by default.
+        
+        Returns:
+            dict[str, np.ndarray]: Channel -> read-only array of `samples` values, a masked
+            array for an integer channel with missing samples.
+        """
+        arrays = {}
+        for channel in channels or self.CHANNELS:
+            values = np.frombuffer(getattr(self, channel), dtype=self.CHANNELS[channel])
+            if values.dtype.kind == "i" and (values == -1).any():
+                values = np.ma.MaskedArray(values, values == -1)
+            arrays[channel] = values
+        return arrays
+    
+    @classmethod
+    def load(cls, lap_id: int, channels: list[str] | None = None) -> dict[str, np.ndarray] | None:
+        """Fetches and decodes the telemetry of one lap.
+        
+        Args:
+            lap_id (int): ID of the lap.
+            channels (list[str] | None): Channels to fetch, all of `CHANNELS` by default.
+        
+        Returns:
+            dict[str, np.ndarray] | None: Channel -> array, None if the lap is not stored packed.
+        """
+        channels = list(channels or cls.CHANNELS)
+        packed = cls.objects.filter(lap=lap_id).only("samples", *channels).first()
+        return packed.arrays(channels) if packed is not None else None
+
+
+class LapAggregate(models.Model):
+    """
+    Statistics of one lap's telemetry, computed by the importer.
+
+    Lets plots and models compare laps, drivers and teams from one row per lap instead
+    of aggregating every telemetry sample of a session on each request. Statistics of
+    a channel without any valid sample are null.
+    """
+    lap = models.OneToOneField(Lap, on_delete=models.CASCADE)
+    samples = models.IntegerField()
+    max_speed = models.FloatField(null=True)
+    mean_speed = models.FloatField(null=True)
+    min_speed = models.FloatField(null=True)
+    max_rpm = models.FloatField(null=True)
+    full_throttle_pct = models.FloatField(null=True, help_text="Share of samples at full throttle, in percent")
+    braking_pct = models.FloatField(null=True, help_text="Share of samples with the brake applied, in percent")
+    drs_open_distance = models.FloatField(null=True, help_text="Meters")
+    gear_changes = models.IntegerField()
+
+    class Meta:
+        db_table = "lap_aggregates"
+
+
 class Result(models.Model):
     session = models.ForeignKey(Session, on_delete=models.CASCADE)
     driver = models.ForeignKey(Driver, on_delete=models.PROTECT)
@@ -188,6 +294,9 @@ class Result(models.Model):
     
     class Meta:
         db_table = "results"
+        constraints = [
+        models.UniqueConstraint(fields=["session", "driver"], name="unique_session_driver_result")
+        ]
 
 
 class Weather(models.Model):
@@ -203,6 +312,9 @@ class Weather(models.Model):
     
     class Meta:
         db_table = "weather"
+        constraints = [
+        models.UniqueConstraint(fields=["session", "time_delta"], name="unique_session_time_delta_weather")
+        ]
 
 
 class RaceControlMessage(models.Model):
@@ -219,10 +331,15 @@ class RaceControlMessage(models.Model):
 
     class Meta:
         db_table = "race_control_msgs"
+        constraints = [
+        models.UniqueConstraint(fields=["session", "date_time", "message"], name="unique_session_datetime_message_race_control")
+        ]
 
 
 class CarData(models.Model):
     lap = models.ForeignKey(Lap, on_delete=models.CASCADE)
+    # Partition key on PostgreSQL, the season of the lap
+    season_year = models.ForeignKey(Season, on_delete=models.CASCADE, db_index=False)
     date = models.DateTimeField()
     speed = models.IntegerField()
     rpm = models.IntegerField()
@@ -237,7 +354,7 @@ class CarData(models.Model):
     class Meta:
         db_table = "car_data"
         constraints = [
-        models.UniqueConstraint(fields=["lap", "date"], name="unique_lap_datetime_car_data")
+        models.UniqueConstraint(fields=["season_year", "lap", "date"], name="unique_lap_datetime_car_data")
         ]
         indexes = [
             models.Index(fields=["lap"], name="idx_car_data_lap")
@@ -246,6 +363,8 @@ class CarData(models.Model):
 
 class PositionData(models.Model):
     lap = models.ForeignKey(Lap, on_delete=models.CASCADE)
+    # Partition key on PostgreSQL, the season of the lap
+    season_year = models.ForeignKey(Season, on_delete=models.CASCADE, db_index=False)
     date = models.DateTimeField()
     status = models.CharField(max_length=20)
     x = models.IntegerField()
@@ -258,8 +377,90 @@ class PositionData(models.Model):
     class Meta:
         db_table = "pos_data"
         constraints = [
-        models.UniqueConstraint(fields=["lap", "date"], name="unique_lap_datetime_pos_data")
+        models.UniqueConstraint(fields=["season_year", "lap", "date"], name="unique_lap_datetime_pos_data")
         ]
         indexes = [
             models.Index(fields=["lap"], name="idx_pos_data_lap")
         ]
+
+
+class ImportJob(models.Model):
+    """
+    Manifest of the season import: one job per (year, round, session).
+    
+    Jobs are planned from the FastF1 schedule by `import_fastf1_seasons` and marked
+    done once the session and all its samples are written, so an interrupted import
+    resumes from the first unfinished session instead of starting over.
+    """
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        RUNNING = "running"
+        DONE = "done"
+        FAILED = "failed"
+    
+    year = models.IntegerField()
+    round_number = models.IntegerField()
+    event_name = models.CharField(max_length=100)
+    session_number = models.IntegerField()
+    session_name = models.CharField(max_length=50)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.IntegerField(default=0)
+    error = models.TextField(null=True)
+    started_at = models.DateTimeField(null=True)
+    finished_at = models.DateTimeField(null=True)
+    
+    class Meta:
+        db_table = "import_jobs"
+        constraints = [
+        models.UniqueConstraint(fields=["year", "round_number", "session_number"], name="unique_year_round_session_import_job")
+        ]
+
+
+class ImportFingerprint(models.Model):
+    """
+    Row count and content hash of the FastF1 data behind one table of one session.
+    
+    Written by the importer after the table has been imported; a re-import skips the
+    tables whose fingerprint has not changed since.
+    """
+    session = models.ForeignKey(Session, on_delete=models.CASCADE)
+    table = models.CharField(max_length=30)
+    row_count = models.BigIntegerField()
+    digest = models.CharField(max_length=64)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = "import_fingerprints"
+        constraints = [
+        models.UniqueConstraint(fields=["session", "table"], name="unique_session_table_import_fingerprint")
+        ]
+
+
+class SessionPaceSummary(models.Model):
+    """
+    Lap time statistics of one driver or one constructor in a session.
+    
+    Rebuilt by the importer whenever the laps or results of a session change, once with
+    every lap and once without the session's lap time outliers (outside 1.5 IQR of all
+    laps of the session). Constructor rows have no driver. Every row of a session holds
+    the session's outlier bounds, null for summaries built before they were stored.
+    """
+    session = models.ForeignKey(Session, on_delete=models.CASCADE)
+    constructor = models.ForeignKey(Constructor, on_delete=models.CASCADE)
+    driver = models.ForeignKey(Driver, on_delete=models.CASCADE, null=True)
+    outliers_removed = models.BooleanField()
+    laps = models.IntegerField()
+    min_lap_time = models.IntegerField(help_text="Milliseconds")
+    q1_lap_time = models.FloatField(help_text="Milliseconds")
+    median_lap_time = models.FloatField(help_text="Milliseconds")
+    q3_lap_time = models.FloatField(help_text="Milliseconds")
+    max_lap_time = models.IntegerField(help_text="Milliseconds")
+    lower_bound_lap_time = models.FloatField(null=True, help_text="Milliseconds, faster laps of the session are outliers")
+    upper_bound_lap_time = models.FloatField(null=True, help_text="Milliseconds, slower laps of the session are outliers")
+    outlier_laps = models.IntegerField(default=0)
+    
+    class Meta:
+        db_table = "session_pace_summaries"
+        indexes = [
+            models.Index(fields=["session", "outliers_removed"], name="idx_pace_summary_session")
+        ]
@@ -0,0 +1,81 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from static_data.models import Constructor, ConstructorColor, Driver, TyreCompounds
+
+
+# Cache key of a season's data version, bumped by the import commands once they have
+# written data of the season
+DATA_VERSION_KEY = "static_data:data_version:{year}"
+
+# Lifetime of a cached season when REFERENCE_DATA_CACHE_TIMEOUT is not set, entries of
+# older data versions are never read again and expire on their own
+DEFAULT_TIMEOUT = 24 * 60 * 60
+
+
+def data_version(year: int) -> int:
+    """Current version of the imported data of a season.
+
+    Versions are nanosecond timestamps, so a version key lost to an eviction or a
+    cache flush is recreated with a version no older entry was stored under.
+
+    Args:
+        year (int): Season year.
+
+    Returns:
+        int: The data version, shared by every process using the same cache.
+    """
+    key = DATA_VERSION_KEY.format(year=int(year))
+    version = cache.get(key)
+    if version is None:
+        # Another process may create it first, everyone then reads the same version
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_data_version(year: int) -> int:
+    """Invalidates everything cached for an older data version of a season.
+
+    Called by the import commands for every season they have written data of; what
+    is cached for the other seasons stays valid.
+
+    Args:
+        year (int): Season year.
+
+    Returns:
+        int: The new data version of the season.
+    """
+    version = time.time_ns()
+    cache.set(DATA_VERSION_KEY.format(year=int(year)), version, timeout=None)
+    return version
+
+
+def season_reference_data(year: int) -> dict[str, list[dict]]:
+    """Constructors, constructor colors, drivers and tyre compounds of a season.
+
+    Read from Django's cache, which every web worker shares, and loaded from the
+    database once per data version of the season.
+
+    Args:
+        year (int): Season year.
+
+    Returns:
+        dict[str, list[dict]]: "constructors" (id, name), "constructor_colors"
+            (constructor, color_fastf1), "drivers" (id, abbreviation) and
+            "tyre_compounds" (name, color) of the season.
+    """
+    key = f"static_data:reference:{int(year)}"
+    version = data_version(year)
+    reference = cache.get(key, version=version)
+    if reference is None:
+        reference = {
+            "constructors": list(Constructor.objects.values("id", "name")),
+            "constructor_colors": list(ConstructorColor.objects.filter(season_year=year).values("constructor", "color_fastf1")),
+            "drivers": list(Driver.objects.values("id", "abbreviation")),
+            "tyre_compounds": list(TyreCompounds.objects.filter(season_year=year).values("name", "color")),
+        }
+        cache.set(key, reference, timeout=getattr(settings, "REFERENCE_DATA_CACHE_TIMEOUT", DEFAULT_TIMEOUT), version=version)
+    return reference
@@ -0,0 +1,46 @@
+from datetime import date, datetime, timezone
+
+from static_data.models import Circuit, Constructor, ConstructorColor, Driver, Event, Lap, Result, Season, Session, TyreCompounds
+
+
+def create_session(year: int = 2024, drivers: int = 2, laps: int = 3, round_number: int = 1) -> Session:
+    """Creates a race with a constructor, drivers, results and laps to import samples into.
+
+    Every driver's lap n takes 90 + n seconds and runs on the MEDIUM compound.
+
+    Args:
+        year (int): Season year.
+        drivers (int): Number of drivers, all in the same constructor.
+        laps (int): Laps per driver.
+        round_number (int): Round of the event, the drivers and the constructor are
+            shared by the sessions of one season.
+
+    Returns:
+        Session: The race.
+    """
+    season, _ = Season.objects.get_or_create(year=year)
+    circuit, _ = Circuit.objects.get_or_create(name="Albert Park", location="Melbourne")
+    event = Event.objects.create(
+        season_year=season, circuit=circuit, round_number=round_number, date_utc=date(year, 3, 24),
+        name="Australian Grand Prix", format="conventional"
+    )
+    start = datetime(year, 3, 24, 4, tzinfo=timezone.utc)
+    session = Session.objects.create(
+        event=event, type="Race", scheduled_start_timestamp_utc=start,
+        actual_start_timestamp_utc=start, end_timestamp_utc=start
+    )
+    constructor, created = Constructor.objects.get_or_create(name="Ferrari")
+    if created:
+        ConstructorColor.objects.create(constructor=constructor, season_year=season, color_official="#E80020", color_fastf1="#E8002D")
+        TyreCompounds.objects.create(name="MEDIUM", color="#FFD12E", season_year=season)
+
+    for number in range(drivers):
+        driver, _ = Driver.objects.get_or_create(first_name="Driver", last_name=str(number), abbreviation=f"D{number:02}")
+        Result.objects.create(session=session, driver=driver, constructor=constructor, position=number + 1)
+        for lap_number in range(1, laps + 1):
+            Lap.objects.create(
+                session=session, driver=driver, lap_number=lap_number, lap_time=(90 + lap_number) * 1000,
+                is_personal_best=False, compound="MEDIUM", fresh_tyre=True, track_status="1",
+                fastf1_generated=False, is_accurate=True
+            )
+    return session
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from django.test import TestCase
+
+from static_data import columnar
+from static_data.columnar import NARROW_DTYPES, fetch_arrays, fetch_frame, frame_from_arrays
+from static_data.importing.conversion import PACKED_TELEMETRY_COLUMNS, pack_samples
+from static_data.models import Lap, LapTelemetry, Telemetry
+from static_data.tests.fixtures import create_session
+
+COLUMNS = ["time", "speed", "n_gear", "brake", "drs"]
+
+
+class FetchFrameTests(TestCase):
+
+    def setUp(self):
+        session = create_session(drivers=1, laps=1)
+        self.lap = Lap.objects.get(session=session)
+        start = datetime(2024, 3, 24, 5, tzinfo=timezone.utc)
+        # Every third sample misses its gear, brake and DRS state
+        Telemetry.objects.bulk_create([
+            Telemetry(
+                lap=self.lap, season_year_id=2024, date=start + timedelta(milliseconds=100 * sample), time=100 * sample,
+                speed=200.0 + sample, n_gear=None if sample % 3 == 0 else 7, brake=None if sample % 3 == 0 else True,
+                drs=None if sample % 3 == 0 else 12
+            )
+            for sample in range(7)
+        ])
+        self.missing = np.arange(7) % 3 == 0
+        self.queryset = Telemetry.objects.filter(lap=self.lap).order_by("date")
+
+    def test_default_dtypes_use_nan(self):
+        telemetry_df = fetch_frame(self.queryset, COLUMNS)
+
+        self.assertEqual(telemetry_df["n_gear"].dtype, np.float64)
+        np.testing.assert_array_equal(telemetry_df["n_gear"].isna(), self.missing)
+        np.testing.assert_array_equal(telemetry_df["brake"].isna(), self.missing)
+
+    def test_narrow_dtypes_are_nullable(self):
+        telemetry_df = fetch_frame(self.queryset, COLUMNS, NARROW_DTYPES[Telemetry])
+
+        self.assertEqual(telemetry_df.dtypes.astype(str).to_dict(),
+                         {"time": "int32", "speed": "float32", "n_gear": "Int8", "brake": "boolean", "drs": "Int8"})
+        for column in ("n_gear", "brake", "drs"):
+            np.testing.assert_array_equal(telemetry_df[column].isna(), self.missing)
+        self.assertEqual(telemetry_df["n_gear"].dropna().unique().tolist(), [7])
+
+    def test_masks_span_chunks(self):
+        with mock.patch.object(columnar, "CHUNK_SIZE", 2):
+            arrays = fetch_arrays(self.queryset, COLUMNS, NARROW_DTYPES[Telemetry])
+
+        self.assertIsInstance(arrays["n_gear"], np.ma.MaskedArray)
+        np.testing.assert_array_equal(np.ma.getmaskarray(arrays["n_gear"]), self.missing)
+        self.assertNotIsInstance(arrays["time"], np.ma.MaskedArray)
+
+    def test_no_rows(self):
+        telemetry_df = fetch_frame(Telemetry.objects.none(), COLUMNS, NARROW_DTYPES[Telemetry])
+
+        self.assertEqual(list(telemetry_df.columns), COLUMNS)
+        self.assertTrue(telemetry_df.empty)
+
+
+class PackedTelemetryTests(TestCase):
+
+    def test_missing_integer_samples_are_masked(self):
+        samples = pd.DataFrame({
+            "Time": pd.to_timedelta([0, 100, 200], unit="ms"), "Speed": [200.0, np.nan, 202.0], "RPM": 11000.0,
+            "nGear": [7, np.nan, 7], "Throttle": 100.0, "Brake": [False, None, True], "DRS": [12, 12, np.nan],
+            "Distance": [0.0, 5.5, 11.0], "X": 0.0, "Y": 0.0,
+        })
+        packed = LapTelemetry(**pack_samples(samples, PACKED_TELEMETRY_COLUMNS, LapTelemetry.CHANNELS))
+        telemetry_df = frame_from_arrays(packed.arrays())
+
+        self.assertEqual(telemetry_df["time"].tolist(), [0, 100, 200])
+        self.assertTrue(np.isnan(telemetry_df["speed"][1]))
+        self.assertEqual(telemetry_df["n_gear"].tolist(), [7, pd.NA, 7])
+        self.assertEqual(telemetry_df["brake"].tolist(), [0, pd.NA, 1])
+        self.assertEqual(telemetry_df["drs"].tolist(), [12, 12, pd.NA])
@@ -0,0 +1,67 @@
+import tempfile
+import threading
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from static_data.importing.fingerprints import Fingerprint
+from static_data.management.commands.import_fastf1_data import Command as ImportCommand
+from static_data.models import ImportFingerprint
+from static_data.tests.fixtures import create_session
+
+
+class BenchmarkReplayImportTests(TestCase):
+
+    def test_leaves_no_profiler_running(self):
+        for options in ({}, {"profile_table": True}):
+            with self.subTest(**options):
+                threads = set(threading.enumerate())
+                with tempfile.TemporaryDirectory() as fixtures:
+                    call_command("benchmark_replay_import", fixtures=fixtures, stdout=StringIO(), **options)
+
+                self.assertEqual(set(threading.enumerate()) - threads, set())
+
+
+class PopulateSessionTests(TestCase):
+
+    def setUp(self):
+        self.session = create_session()
+        self.command = ImportCommand(stdout=StringIO())
+        self.command.configure()
+        self.command.session_obj = self.session
+        self.fingerprints = {table: Fingerprint(index, f"digest-{table}") for index, table in enumerate(self.command.tables)}
+        for table, fingerprint in self.fingerprints.items():
+            ImportFingerprint.objects.create(session=self.session, table=table, row_count=fingerprint.row_count, digest=fingerprint.digest)
+        self.loaded = SimpleNamespace(
+            session_info={"Meeting": {"Name": "Australian Grand Prix"}, "Name": "Race"},
+            fingerprints=dict(self.fingerprints), results=[]
+        )
+
+    def populate(self):
+        # The session row and the drivers exist already, only the tables are of interest
+        with mock.patch.object(ImportCommand, "populate_sessions"), mock.patch.object(ImportCommand, "populate_drivers"), \
+                mock.patch.object(ImportCommand, "populate_weather") as populate_weather, \
+                mock.patch.object(ImportCommand, "populate_laps") as populate_laps, \
+                mock.patch("static_data.management.commands.import_fastf1_data.bump_data_version") as bump_data_version:
+            self.command.populate_session(2024, self.loaded, None, 5)
+            self.command.invalidate_caches()
+        return populate_weather, populate_laps, bump_data_version
+
+    def test_unchanged_session_is_skipped(self):
+        populate_weather, populate_laps, bump_data_version = self.populate()
+
+        populate_weather.assert_not_called()
+        populate_laps.assert_not_called()
+        bump_data_version.assert_not_called()
+
+    def test_only_changed_tables_are_written(self):
+        self.loaded.fingerprints["weather"] = Fingerprint(10, "changed")
+        populate_weather, populate_laps, bump_data_version = self.populate()
+
+        populate_weather.assert_called_once()
+        populate_laps.assert_not_called()
+        bump_data_version.assert_called_once_with(2024)
+        self.assertEqual(ImportFingerprint.objects.get(session=self.session, table="weather").digest, "changed")
@@ -0,0 +1,67 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase
+
+from static_data.importing.conversion import aggregate_samples, to_milliseconds, to_timedeltas
+
+
+class DurationTests(SimpleTestCase):
+
+    def test_milliseconds_are_truncated(self):
+        durations = pd.Series(pd.to_timedelta([83456900, 83457000, -1500], unit="us"))
+
+        self.assertEqual(to_milliseconds(durations), [83456, 83457, -1])
+
+    def test_milliseconds_match_the_row_by_row_import(self):
+        durations = pd.Series(pd.to_timedelta(np.random.default_rng(0).integers(0, 10 ** 8, 1000), unit="us"))
+
+        self.assertEqual(to_milliseconds(durations), [int(duration.total_seconds() * 1000) for duration in durations])
+
+    def test_columns_without_values(self):
+        # FastF1 types empty columns by what they held elsewhere
+        for durations in (pd.Series([pd.NaT, pd.NaT]), pd.Series([None, None], dtype=object),
+                          pd.Series([np.nan, np.nan]), pd.Series([pd.NaT, pd.NaT], dtype="timedelta64[ns]")):
+            with self.subTest(dtype=durations.dtype):
+                self.assertEqual(to_milliseconds(durations), [None, None])
+                self.assertEqual(to_timedeltas(durations), [None, None])
+
+    def test_timedeltas(self):
+        durations = pd.Series([pd.Timedelta(seconds=1.5), pd.NaT])
+
+        self.assertEqual(to_timedeltas(durations), [timedelta(seconds=1.5), None])
+
+
+def lap_samples(**channels) -> pd.DataFrame:
+    """Merged telemetry of a lap of four samples, 10 m apart, overridden by `channels`."""
+    samples = {
+        "Speed": [100.0, 200.0, 300.0, 200.0], "RPM": [10000.0, 11000.0, 12000.0, 11500.0],
+        "Throttle": [0.0, 100.0, 104.0, 50.0], "Brake": [True, False, False, False],
+        "DRS": [8, 12, 12, 8], "Distance": [0.0, 10.0, 20.0, 30.0], "nGear": [3, 4, 5, 5],
+    }
+    return pd.DataFrame(samples | channels)
+
+
+class AggregateSamplesTests(SimpleTestCase):
+
+    def test_statistics(self):
+        self.assertEqual(aggregate_samples(lap_samples()), {
+            "samples": 4, "max_speed": 300.0, "mean_speed": 200.0, "min_speed": 100.0, "max_rpm": 12000.0,
+            "full_throttle_pct": 50.0, "braking_pct": 25.0, "drs_open_distance": 20.0, "gear_changes": 2,
+        })
+
+    def test_missing_samples_are_left_out(self):
+        aggregates = aggregate_samples(lap_samples(
+            Speed=[100.0, np.nan, 300.0, np.nan], Brake=[True, None, False, None], nGear=[3, None, 3, 4]
+        ))
+
+        self.assertEqual(aggregates["mean_speed"], 200.0)
+        self.assertEqual(aggregates["braking_pct"], 50.0)
+        self.assertEqual(aggregates["gear_changes"], 1)
+
+    def test_channels_without_samples(self):
+        aggregates = aggregate_samples(lap_samples(Speed=[np.nan] * 4, Distance=[np.nan] * 4))
+
+        self.assertEqual((aggregates["max_speed"], aggregates["mean_speed"], aggregates["drs_open_distance"]), (None, None, None))
+        self.assertEqual(aggregate_samples(lap_samples().iloc[:0])["samples"], 0)
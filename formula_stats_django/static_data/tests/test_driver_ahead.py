@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase
+
+from static_data.importing.driver_ahead import DriverAheadGrid
+
+
+class Laps(pd.DataFrame):
+    """The part of FastF1's Laps the grid uses."""
+
+    @property
+    def _constructor(self):
+        return Laps
+
+    def pick_drivers(self, driver: str) -> "Laps":
+        return self[self["DriverNumber"] == driver]
+
+
+def seconds(values) -> pd.Series:
+    return pd.Series(pd.to_timedelta(values, unit="s"))
+
+
+def two_car_session() -> SimpleNamespace:
+    """Two cars lapping a 1000 m track at 50 m/s, car 2 crossing the line 2 s after car 1."""
+    times = np.arange(0, 60.5, 0.5)
+    car_data = {driver: pd.DataFrame({"SessionTime": seconds(times), "Speed": 180.0}) for driver in ("1", "2")}
+    laps = Laps([
+        {"DriverNumber": driver, "LapNumber": lap + 1, "LapStartTime": pd.Timedelta(seconds=offset + 20 * lap),
+         "Time": pd.Timedelta(seconds=offset + 20 * (lap + 1))}
+        for driver, offset, count in (("1", 0, 3), ("2", 2, 2))
+        for lap in range(count)
+    ])
+    return SimpleNamespace(drivers=["1", "2"], car_data=car_data, laps=laps)
+
+
+class DriverAheadGridTests(SimpleTestCase):
+
+    def setUp(self):
+        self.grid = DriverAheadGrid(two_car_session())
+
+    def test_lap_length(self):
+        self.assertAlmostEqual(self.grid.lap_length, 1000.0)
+
+    def test_car_behind_sees_the_leader(self):
+        driver_ahead, distance = self.grid.lookup("2", seconds([10.0, 10.25, 30.0]))
+
+        self.assertEqual(driver_ahead.tolist(), [1, 1, 1])
+        np.testing.assert_allclose(distance, [100.0, 100.0, 100.0])
+
+    def test_leader_has_nobody_ahead(self):
+        # Car 2 is 900 m in front across the line, but a lap down
+        driver_ahead, distance = self.grid.lookup("1", seconds([10.0, 30.0]))
+
+        self.assertTrue(driver_ahead.isna().all())
+        self.assertTrue(np.isnan(distance).all())
+
+    def test_outside_the_grid(self):
+        driver_ahead, distance = self.grid.lookup("2", seconds([-1.0, 61.0]))
+
+        self.assertTrue(driver_ahead.isna().all())
+        self.assertTrue(np.isnan(distance).all())
+
+    def test_unknown_driver_and_no_samples(self):
+        self.assertTrue(self.grid.lookup("99", seconds([10.0]))[0].isna().all())
+        self.assertEqual(len(self.grid.lookup("2", seconds([]))[0]), 0)
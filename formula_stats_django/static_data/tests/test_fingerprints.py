@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import pandas as pd
+from django.test import SimpleTestCase
+
+from static_data.importing.fingerprints import FINGERPRINT_TABLES, frame_fingerprint, session_fingerprints
+
+
+def fastf1_session(lap_time: float = 91.0, speed: float = 200.0) -> SimpleNamespace:
+    """The frames of a loaded FastF1 session the fingerprints are taken of."""
+    times = pd.to_timedelta([0, 100], unit="ms")
+    return SimpleNamespace(
+        laps=pd.DataFrame({"Driver": ["VER", "VER"], "LapNumber": [1, 2], "LapTime": pd.to_timedelta([lap_time, 92.0], unit="s")}),
+        results=pd.DataFrame({"Abbreviation": ["VER"], "Position": [1.0]}),
+        weather_data=pd.DataFrame({"AirTemp": [20.0, 20.5]}),
+        race_control_messages=pd.DataFrame({"Message": ["GREEN LIGHT - PIT EXIT OPEN"]}),
+        car_data={"1": pd.DataFrame({"Time": times, "Speed": [speed, speed + 1]})},
+        pos_data={"1": pd.DataFrame({"Time": times, "X": [10.0, 12.0]})},
+    )
+
+
+class FingerprintTests(SimpleTestCase):
+
+    def test_same_data_same_fingerprint(self):
+        self.assertEqual(session_fingerprints(fastf1_session()), session_fingerprints(fastf1_session()))
+
+    def test_only_the_tables_of_changed_data_differ(self):
+        before = session_fingerprints(fastf1_session())
+        after = session_fingerprints(fastf1_session(speed=210.0))
+
+        self.assertEqual({table for table in FINGERPRINT_TABLES if before[table] != after[table]},
+                         {"car_data", "telemetry", "lap_telemetry", "lap_aggregates"})
+
+    def test_lap_changes_reach_the_sample_tables(self):
+        # Samples are split by the laps, new lap times move them between laps
+        before = session_fingerprints(fastf1_session())
+        after = session_fingerprints(fastf1_session(lap_time=90.5))
+
+        self.assertEqual({table for table in FINGERPRINT_TABLES if before[table] != after[table]},
+                         {"laps", "pos_data", "car_data", "telemetry", "lap_telemetry", "lap_aggregates"})
+
+    def test_driver_ahead_changes_the_telemetry_only(self):
+        with_ahead = session_fingerprints(fastf1_session())
+        without_ahead = session_fingerprints(fastf1_session(), driver_ahead=False)
+
+        self.assertEqual({table for table in FINGERPRINT_TABLES if with_ahead[table] != without_ahead[table]}, {"telemetry"})
+
+    def test_column_names_are_part_of_the_digest(self):
+        frame = pd.DataFrame({"Speed": [200.0]})
+
+        self.assertNotEqual(frame_fingerprint(frame), frame_fingerprint(frame.rename(columns={"Speed": "RPM"})))
+        self.assertEqual(frame_fingerprint(frame, frame).row_count, 2)
+
+    def test_unhashable_cells(self):
+        frame = pd.DataFrame({"Sectors": [[1, 2], [3]]})
+
+        self.assertEqual(frame_fingerprint(frame), frame_fingerprint(frame.copy()))
@@ -0,0 +1,99 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase
+
+from static_data.importing.loaders import BulkCreateLoader, PostgresBulkLoader, PostgresCopyLoader, SampleBuffer, upsert
+from static_data.models import Lap, Telemetry, Weather
+from static_data.tests.fixtures import create_session
+
+
+def lap_samples(lap_number: int, samples: int = 4, source: str | None = "car") -> dict[str, list]:
+    """Converted telemetry columns of one lap, one sample every 100 ms."""
+    start = datetime(2024, 3, 24, 5, tzinfo=timezone.utc) + timedelta(minutes=lap_number)
+    return {
+        "date": [start + timedelta(milliseconds=100 * sample) for sample in range(samples)],
+        "session_time": [timedelta(minutes=lap_number, milliseconds=100 * sample) for sample in range(samples)],
+        "time": [100 * sample for sample in range(samples)],
+        "speed": [200.0 + sample for sample in range(samples)],
+        "n_gear": [7.0] * samples,
+        "brake": [False] * samples,
+        "source": [source] * samples,
+        "status": [None] * samples,
+    }
+
+
+class SampleLoaderTests:
+    """Shared by the tests of every loader, `loader` is set by the subclasses."""
+
+    loader = None
+
+    def setUp(self):
+        self.session = create_session()
+        self.laps = list(Lap.objects.filter(session=self.session).order_by("id"))
+
+    def test_flushes_twice_in_one_transaction(self):
+        # A season import job wraps the whole session in one atomic block
+        buffer = SampleBuffer(Telemetry, self.loader, flush_rows=4, season_year=2024)
+        with transaction.atomic():
+            for lap in self.laps[:3]:
+                buffer.add(lap.id, lap_samples(lap.lap_number))
+            buffer.flush()
+
+        self.assertEqual(buffer.rows_written, 12)
+        self.assertEqual(Telemetry.objects.filter(lap__in=self.laps).count(), 12)
+
+    def test_keeps_empty_strings_and_nulls_apart(self):
+        buffer = SampleBuffer(Telemetry, self.loader, season_year=2024)
+        buffer.add(self.laps[0].id, lap_samples(1, source=""))
+        buffer.flush()
+
+        self.assertEqual(set(Telemetry.objects.values_list("source", "status")), {("", None)})
+
+
+class BulkCreateLoaderTests(SampleLoaderTests, TestCase):
+    loader = BulkCreateLoader()
+
+    def test_reimport_updates_in_place(self):
+        lap = self.laps[0]
+        for speed in (200.0, 250.0):
+            samples = lap_samples(1)
+            samples["speed"] = [speed] * 4
+            buffer = SampleBuffer(Telemetry, self.loader, season_year=2024)
+            buffer.add(lap.id, samples)
+            buffer.flush()
+
+        self.assertEqual(list(Telemetry.objects.values_list("speed", flat=True).distinct()), [250.0])
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "COPY is only available on PostgreSQL")
+class PostgresCopyLoaderTests(SampleLoaderTests, TestCase):
+    loader = PostgresCopyLoader()
+
+
+class PostgresCopyStagingTests(SimpleTestCase):
+
+    def test_staging_table_differs_per_loader(self):
+        self.assertNotEqual(PostgresBulkLoader.staging_suffix, PostgresCopyLoader.staging_suffix)
+
+    def test_csv_marks_nulls_explicitly(self):
+        samples = lap_samples(1, samples=1, source="")
+        buffer, rows = PostgresCopyLoader()._to_csv(["lap", "source", "status"], [(7, samples)], {})
+
+        # Unquoted empty fields are read as empty strings with NULL '\N'
+        self.assertEqual((buffer.getvalue(), rows), ("7,,\\N\r\n", 1))
+
+
+class UpsertTests(TestCase):
+
+    def test_collapses_duplicated_keys(self):
+        session = create_session()
+        rows = [
+            Weather(session=session, time_delta=0, air_temp=20.0 + offset, track_temp=30.0, rainfall=False,
+                    humidity=50.0, air_pressure=1010.0, wind_speed=1.0, wind_direction=180.0)
+            for offset in range(3)
+        ]
+
+        self.assertEqual(upsert(Weather, rows, ["session", "time_delta"]), 1)
+        self.assertEqual(list(Weather.objects.values_list("air_temp", flat=True)), [22.0])
@@ -0,0 +1,111 @@
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+from static_data.importing.partitions import PARTITIONED_TABLES, is_partitioned, partition_name, season_partitions
+
+BEFORE = [("static_data", "0007_lap_telemetry")]
+AFTER = [("static_data", "0008_partition_sample_tables")]
+
+
+def create_lap(apps, year: int):
+    """Creates a race lap of a season with the historical models of `apps`."""
+    circuit, _ = apps.get_model("static_data", "Circuit").objects.get_or_create(name="Albert Park", location="Melbourne")
+    driver, _ = apps.get_model("static_data", "Driver").objects.get_or_create(first_name="Driver", last_name="0", abbreviation="D00")
+    season = apps.get_model("static_data", "Season").objects.create(year=year)
+    event = apps.get_model("static_data", "Event").objects.create(
+        season_year=season, circuit=circuit, round_number=1, date_utc=date(year, 3, 24),
+        name="Australian Grand Prix", format="conventional"
+    )
+    start = datetime(year, 3, 24, 4, tzinfo=timezone.utc)
+    session = apps.get_model("static_data", "Session").objects.create(
+        event=event, type="Race", scheduled_start_timestamp_utc=start,
+        actual_start_timestamp_utc=start, end_timestamp_utc=start
+    )
+    return apps.get_model("static_data", "Lap").objects.create(
+        session=session, driver=driver, lap_number=1, lap_time=91000, is_personal_best=False, compound="MEDIUM",
+        fresh_tyre=True, track_status="1", fastf1_generated=False, is_accurate=True
+    )
+
+
+class MigrationTestCase(TransactionTestCase):
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        # Back to the latest schema for the tests that follow
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+
+class NaturalKeyConstraintsTests(MigrationTestCase):
+    """Migration 0003 on a session imported twice by the old importer."""
+
+    def test_duplicates_are_deleted_before_the_constraints(self):
+        apps = self.migrate([("static_data", "0002_alter_telemetry_drs")])
+        lap = create_lap(apps, 2024)
+        Lap, Weather = apps.get_model("static_data", "Lap"), apps.get_model("static_data", "Weather")
+        constructor = apps.get_model("static_data", "Constructor").objects.create(name="Ferrari")
+        message = {"session": lap.session, "date_time": datetime(2024, 3, 24, 4, tzinfo=timezone.utc), "category": "Flag"}
+        for copy in range(2):
+            Lap.objects.create(
+                session=lap.session, driver=lap.driver, lap_number=2, lap_time=92000 + copy, is_personal_best=False,
+                compound="MEDIUM", fresh_tyre=True, track_status="1", fastf1_generated=False, is_accurate=True
+            )
+            apps.get_model("static_data", "Result").objects.create(session=lap.session, driver=lap.driver, constructor=constructor, points=copy)
+            Weather.objects.create(session=lap.session, time_delta=0, air_temp=20.0 + copy, track_temp=30.0, rainfall=False,
+                                   humidity=50.0, air_pressure=1010.0, wind_speed=1.0, wind_direction=180.0)
+            apps.get_model("static_data", "RaceControlMessage").objects.create(message="GREEN LIGHT", lap=copy, **message)
+            # Messages without a session are not duplicates of each other
+            apps.get_model("static_data", "RaceControlMessage").objects.create(message="CLEAR", **message | {"session": None})
+
+        apps = self.migrate([("static_data", "0003_natural_key_constraints")])
+
+        self.assertEqual(sorted(apps.get_model("static_data", "Lap").objects.values_list("lap_number", "lap_time")),
+                         [(1, 91000), (2, 92001)])
+        self.assertEqual(list(apps.get_model("static_data", "Result").objects.values_list("points", flat=True)), [1.0])
+        self.assertEqual(list(apps.get_model("static_data", "Weather").objects.values_list("air_temp", flat=True)), [21.0])
+        self.assertEqual(sorted(apps.get_model("static_data", "RaceControlMessage").objects.values_list("message", "lap")),
+                         [("CLEAR", None), ("CLEAR", None), ("GREEN LIGHT", 1)])
+
+
+class PartitionSampleTablesTests(MigrationTestCase):
+    """Migration 0008 on the samples of two seasons imported before it."""
+
+    def setUp(self):
+        apps = self.migrate(BEFORE)
+        self.laps = {}
+        for year in (2023, 2024):
+            lap = create_lap(apps, year)
+            self.laps[year] = lap.id
+            start = datetime(year, 3, 24, 4, tzinfo=timezone.utc)
+            for sample in range(2):
+                sample_date = start + timedelta(milliseconds=100 * sample)
+                apps.get_model("static_data", "Telemetry").objects.create(lap=lap, date=sample_date, speed=200.0)
+                apps.get_model("static_data", "CarData").objects.create(
+                    lap=lap, date=sample_date, speed=200, rpm=11000, gear=7, throttle=100, brake=False, drs=12
+                )
+                apps.get_model("static_data", "PositionData").objects.create(lap=lap, date=sample_date, status="OnTrack", x=0, y=0, z=0)
+
+        self.apps = self.migrate(AFTER)
+
+    def test_samples_get_the_season_of_their_lap(self):
+        for model in ("Telemetry", "CarData", "PositionData"):
+            with self.subTest(model=model):
+                samples = self.apps.get_model("static_data", model).objects.values_list("lap", "season_year")
+                self.assertEqual(sorted(samples), [(self.laps[2023], 2023)] * 2 + [(self.laps[2024], 2024)] * 2)
+
+    @unittest.skipUnless(connection.vendor == "postgresql", "The sample tables are only partitioned on PostgreSQL")
+    def test_sample_tables_are_partitioned_by_season(self):
+        partitions = season_partitions()
+        for table in PARTITIONED_TABLES:
+            with self.subTest(table=table):
+                self.assertTrue(is_partitioned(table))
+                self.assertEqual([name for name, _, _ in partitions[table]],
+                                 [partition_name(table, 2023), partition_name(table, 2024), f"{table}_default"])
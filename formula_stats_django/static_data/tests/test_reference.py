@@ -0,0 +1,33 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from static_data.models import Driver
+from static_data.reference import bump_data_version, data_version, season_reference_data
+from static_data.tests.fixtures import create_session
+
+
+class DataVersionTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        # The reference data cached here refers to rows rolled back after the test
+        cache.clear()
+
+    def test_bump_keeps_the_other_seasons(self):
+        versions = {year: data_version(year) for year in (2023, 2024)}
+        bumped = bump_data_version(2024)
+
+        self.assertNotEqual(bumped, versions[2024])
+        self.assertEqual((data_version(2023), data_version(2024)), (versions[2023], bumped))
+
+    def test_reference_data_reloads_after_a_bump_of_its_season(self):
+        create_session(year=2023)
+        create_session(year=2024)
+        reference = {year: season_reference_data(year) for year in (2023, 2024)}
+        Driver.objects.create(first_name="New", last_name="Driver", abbreviation="NEW")
+        bump_data_version(2024)
+
+        self.assertEqual(season_reference_data(2023), reference[2023])
+        self.assertEqual(len(season_reference_data(2024)["drivers"]), len(reference[2024]["drivers"]) + 1)
@@ -0,0 +1,37 @@
+from django.test import TestCase
+
+from static_data.columnar import fetch_frame
+from static_data.importing.summaries import (
+    build_pace_summaries, lap_time_bounds, pace_summaries, remove_lap_time_outliers, summary_lap_time_bounds
+)
+from static_data.models import Lap, SessionPaceSummary
+from static_data.tests.fixtures import create_session
+
+
+class PaceSummaryTests(TestCase):
+
+    def setUp(self):
+        self.session = create_session(drivers=2, laps=5)
+        # A safety car lap of the first driver
+        Lap.objects.filter(session=self.session, driver__abbreviation="D00", lap_number=5).update(lap_time=150000)
+        build_pace_summaries(self.session.id)
+        self.laps_df = fetch_frame(Lap.objects.filter(session=self.session), ["lap_time", "driver"])
+
+    def test_stores_the_session_bounds(self):
+        bounds = summary_lap_time_bounds(pace_summaries(self.session.id))
+
+        self.assertEqual(bounds, lap_time_bounds(self.laps_df))
+        self.assertTrue(remove_lap_time_outliers(self.laps_df, bounds).equals(remove_lap_time_outliers(self.laps_df)))
+
+    def test_counts_the_outlier_laps(self):
+        summaries = SessionPaceSummary.objects.filter(session=self.session)
+        outlier_laps = dict(summaries.filter(outliers_removed=True).values_list("driver__abbreviation", "outlier_laps"))
+
+        self.assertEqual(outlier_laps, {"D00": 1, "D01": 0, None: 1})
+        self.assertEqual(summaries.get(driver__abbreviation="D00", outliers_removed=True).laps, 4)
+
+    def test_summaries_without_bounds(self):
+        SessionPaceSummary.objects.update(lower_bound_lap_time=None, upper_bound_lap_time=None)
+
+        self.assertIsNone(summary_lap_time_bounds(pace_summaries(self.session.id)))
+        self.assertIsNone(summary_lap_time_bounds(pace_summaries(0)))
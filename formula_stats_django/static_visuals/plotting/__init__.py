@@ -19,6 +19,10 @@ SNS_BOXPLOT_STYLE = {
     "dodge": False
 }
 
+# Version of the look of the plots, part of the key of every cached plot image.
+# Bump it with any change to the plotting code that changes the rendered images.
+PLOT_STYLE_VERSION = 1
+
 
 def format_lap_time(ms: int) -> str:
     """Formats a duration from milliseconds to a "m:ss.mmm" string.
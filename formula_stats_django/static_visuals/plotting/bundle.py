@@ -0,0 +1,154 @@
+import sys
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+from django.conf import settings
+
+from static_data.columnar import fetch_frame
+from static_data.importing.summaries import pace_summaries
+from static_data.models import Event, Lap, Result, Session, Weather
+from static_data.reference import data_version, season_reference_data
+
+
+# Memory budget of the process-local bundle cache when SESSION_BUNDLE_CACHE_BYTES is not set
+DEFAULT_CACHE_BYTES = 256 * 1024 ** 2
+
+
+def _size(value) -> int:
+    """Approximate memory footprint of a bundle attribute in bytes."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, list):
+        return sys.getsizeof(value) + sum(_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value.values())
+    if hasattr(value, "__dict__"):
+        return _size(vars(value))
+    return sys.getsizeof(value)
+
+
+class SessionDataBundle:
+    """
+    Data of one session shared by every visual of the session.
+
+    Loads the event, session, results, laps, weather, pace summaries and the season's
+    reference data (constructors, colors, drivers, tyre compounds) in one go, so
+    switching between visuals of the same session does not query them again. The
+    bundle is shared between requests and must be treated as read-only; copy a frame
+    before changing it.
+
+    Attributes:
+        year (int): Season year.
+        event_id (int): ID of the event.
+        session_id (int): ID of the session.
+        data_version (int): Data version the bundle was loaded at, see `data_version`.
+        nbytes (int): Approximate memory footprint.
+    """
+
+    def __init__(self, year: int, event_id: int, session_id: int):
+        self.year = int(year)
+        self.event_id = int(event_id)
+        self.session_id = int(session_id)
+        self.data_version = data_version(year)
+
+        self.event = Event.objects.get(id=self.event_id)
+        self.session = Session.objects.get(id=self.session_id)
+        self.results = list(Result.objects.filter(session=self.session_id).values("id", "position", "classified_position", "constructor", "driver"))
+        self.laps = fetch_frame(Lap.objects.filter(session=self.session_id), ["id", "driver", "lap_number", "lap_time", "compound"])
+        self.weather = fetch_frame(Weather.objects.filter(session=self.session_id))
+        self.pace_summaries = pace_summaries(self.session_id)
+
+        # Shared with the bundles of the other sessions of the season
+        reference = season_reference_data(self.year)
+        self.constructors = reference["constructors"]
+        self.constructor_colors = reference["constructor_colors"]
+        self.drivers = reference["drivers"]
+        self.tyre_compounds = reference["tyre_compounds"]
+
+        self.nbytes = sum(_size(value) for value in vars(self).values())
+
+
+class SessionBundleCache:
+    """
+    Process-local LRU of session bundles, bounded by their total size.
+
+    A bundle is reloaded once an import has bumped the data version. The least recently
+    used bundles are evicted when the budget is exceeded, a bundle larger than the
+    whole budget is returned without being cached.
+
+    Attributes:
+        max_bytes (int): Memory budget.
+        hits (int): Bundles served from the cache.
+        misses (int): Bundles loaded from the database.
+    """
+
+    def __init__(self, max_bytes: int | None = None):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bundles = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def budget(self) -> int:
+        if self.max_bytes is not None:
+            return self.max_bytes
+        return getattr(settings, "SESSION_BUNDLE_CACHE_BYTES", DEFAULT_CACHE_BYTES)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def get(self, year: int, event_id: int, session_id: int) -> SessionDataBundle:
+        """Returns the bundle of a session, loading it on a miss.
+
+        Args:
+            year (int): Season year.
+            event_id (int): ID of the event.
+            session_id (int): ID of the session.
+
+        Returns:
+            SessionDataBundle: The session's bundle.
+        """
+        key = (int(year), int(event_id), int(session_id))
+        with self._lock:
+            bundle = self._bundles.get(key)
+        if bundle is not None and bundle.data_version == data_version(year):
+            with self._lock:
+                if key in self._bundles:
+                    self._bundles.move_to_end(key)
+                self.hits += 1
+            return bundle
+
+        # Loaded outside the lock, concurrent misses of the same session load it twice
+        bundle = SessionDataBundle(*key)
+        with self._lock:
+            self.misses += 1
+            self._discard(key)
+            if bundle.nbytes <= self.budget:
+                self._bundles[key] = bundle
+                self._nbytes += bundle.nbytes
+                while self._nbytes > self.budget:
+                    self._discard(next(iter(self._bundles)))
+        return bundle
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bundles.clear()
+            self._nbytes = 0
+
+    def _discard(self, key: tuple) -> None:
+        bundle = self._bundles.pop(key, None)
+        if bundle is not None:
+            self._nbytes -= bundle.nbytes
+
+
+# Shared by every visual of the process
+session_bundles = SessionBundleCache()
+
+
+def session_bundle(year: int, event_id: int, session_id: int) -> SessionDataBundle:
+    """The cached bundle of a session, see `SessionBundleCache.get`."""
+    return session_bundles.get(year, event_id, session_id)
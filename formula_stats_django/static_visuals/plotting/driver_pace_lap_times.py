@@ -13,7 +13,8 @@ import numpy as np
 import io
 import base64
 
-from static_data.models import Result, Lap, ConstructorColor, Constructor, Event, Session, TyreCompounds, Driver
+from static_data.importing.summaries import remove_lap_time_outliers, summary_lap_time_bounds, summary_statistics
+from static_visuals.plotting.bundle import SessionDataBundle, session_bundle
 
 # def plot_name(name):
 #     def decorator(func):
@@ -55,11 +56,13 @@ class DriverLapVisuals:
     #     'point_scorers_laps'
     #     ]
     
-    def __init__(self, year: int, event_id: int, session_id: int):
+    def __init__(self, year: int, event_id: int, session_id: int, bundle: SessionDataBundle | None = None):
         # Initialise basic parameters
         self.year = year
         self.event_id = event_id
         self.session_id = session_id
+        # Data shared with the other visuals of the session
+        self.bundle = bundle or session_bundle(year, event_id, session_id)
         
         # Load, process data and set general plot properties
         self._load_data()
@@ -68,14 +71,15 @@ class DriverLapVisuals:
         
     def _load_data(self) -> None:
         """Fetch all necessary raw data from the database"""
-        self._raw_laps = Lap.objects.filter(session=self.session_id).values("lap_time", "driver")
-        self._raw_results = Result.objects.filter(session=self.session_id).values("id", "position","classified_position", "constructor", "driver")
-        self._raw_driver_details = Driver.objects.values('id', 'abbreviation')
-        self._raw_event_details = Event.objects.get(id=self.event_id)
-        self._raw_session_details = Session.objects.get(id=self.session_id)
-        self._raw_constructor = Constructor.objects.values()
-        self._raw_constructor_color = ConstructorColor.objects.filter(season_year=self.year).values("constructor", "color_fastf1")
-        self._raw_tyre_compounds = TyreCompounds.objects.filter(season_year=self.year).values('name', 'color')
+        self._raw_laps = self.bundle.laps[["lap_time", "driver"]]
+        self._raw_results = self.bundle.results
+        self._raw_driver_details = self.bundle.drivers
+        self._raw_event_details = self.bundle.event
+        self._raw_session_details = self.bundle.session
+        self._raw_pace_summaries = self.bundle.pace_summaries
+        self._raw_constructor = self.bundle.constructors
+        self._raw_constructor_color = self.bundle.constructor_colors
+        self._raw_tyre_compounds = self.bundle.tyre_compounds
 
     def _process_data(self, remove_outliers: bool = True) -> None:
         """Process fetched data and make it a pandas dataframe"""
@@ -92,35 +96,30 @@ class DriverLapVisuals:
         # Dictionary {'driver_id': 'abbreviation'}
         driver_id_abbreviation_dict = {entry['id']: entry['abbreviation'] for entry in self._raw_driver_details}
         
-        # DataFrame with laps data
-        lap_data = []
-        for lap in self._raw_laps:
-            driver = lap["driver"]
-            constructor = driver_constructor_dict.get(driver)
-            constructor_name = team_name_dict.get(constructor)
-            if constructor:
-                lap_data.append({
-                    "constructor": constructor,
-                    'constructor_name': constructor_name,
-                    'driver': driver,
-                    "lap_time": lap["lap_time"] if isinstance(lap["lap_time"], int) else lap["lap_time"],
-                })
-        
-        laps_df = pd.DataFrame(lap_data)
-        
-        # Remove outliers
+        # DataFrame with laps data, laps of drivers without a result are left out
+        laps_df = pd.DataFrame({
+            "constructor": self._raw_laps["driver"].map(driver_constructor_dict),
+            "driver": self._raw_laps["driver"],
+            "lap_time": self._raw_laps["lap_time"],
+        }).dropna(subset=["constructor"]).reset_index(drop=True)
+        laps_df["constructor"] = laps_df["constructor"].astype(int)
+        laps_df["constructor_name"] = laps_df["constructor"].map(team_name_dict)
+        
+        # Remove outliers, outside the session's bounds stored with its pace summaries when it has them
         if remove_outliers:
-            Q1 = laps_df["lap_time"].quantile(0.25)
-            Q3 = laps_df["lap_time"].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            laps_df = laps_df[(laps_df["lap_time"] >= lower_bound) & (laps_df["lap_time"] <= upper_bound)]
+            laps_df = remove_lap_time_outliers(laps_df, summary_lap_time_bounds(self._raw_pace_summaries))
         
         # Calculate driver median, fast, slow laps and team order based on the median laps
-        self.driver_medians = laps_df.groupby("driver")["lap_time"].median().sort_values()
-        self.driver_mins = laps_df.groupby("driver")["lap_time"].min().sort_values()
-        self.driver_maxs = laps_df.groupby("driver")["lap_time"].max().sort_values()
+        # The summaries stored at import time are used when the session has them
+        if not self._raw_pace_summaries.empty:
+            driver_statistics = summary_statistics(self._raw_pace_summaries, "driver", remove_outliers)
+            self.driver_medians = driver_statistics["median_lap_time"].sort_values()
+            self.driver_mins = driver_statistics["min_lap_time"].sort_values()
+            self.driver_maxs = driver_statistics["max_lap_time"].sort_values()
+        else:
+            self.driver_medians = laps_df.groupby("driver")["lap_time"].median().sort_values()
+            self.driver_mins = laps_df.groupby("driver")["lap_time"].min().sort_values()
+            self.driver_maxs = laps_df.groupby("driver")["lap_time"].max().sort_values()
         self.driver_order = self.driver_medians.index
         
         # Create results_df DataFrame
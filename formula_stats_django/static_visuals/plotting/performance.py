@@ -1,7 +1,5 @@
 from . import add_watermark, plot_name, register_plots
 
-from collections import defaultdict
-
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
@@ -9,18 +7,70 @@ import numpy as np
 import io
 import base64
 
-from static_data.models import Event, Session, Telemetry, Constructor, ConstructorColor, Lap, Result
+from django.db import connection
+
+from static_visuals.plotting.bundle import SessionDataBundle, session_bundle
+
+
+# Matches every lap to the constructor of its driver's result in the same session
+LAP_RESULT_JOIN = (
+    "JOIN laps ON laps.id = {table}.lap_id "
+    "JOIN results ON results.session_id = laps.session_id AND results.driver_id = laps.driver_id"
+)
+
+
+def team_speed_from_telemetry(year: int, session_id: int) -> list[tuple]:
+    """Mean and max speed of every constructor over the session's telemetry samples.
 
+    Aggregated by the database, filtering on the season keeps PostgreSQL to a single
+    partition.
+
+    Returns:
+        list[tuple]: (constructor_id, mean speed, max speed) rows.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT results.constructor_id, AVG(telemetry.speed), MAX(telemetry.speed) "
+            f"FROM telemetry {LAP_RESULT_JOIN.format(table='telemetry')} "
+            "WHERE telemetry.season_year_id = %s AND laps.session_id = %s AND telemetry.speed IS NOT NULL "
+            "GROUP BY results.constructor_id",
+            [year, session_id]
+        )
+        return cursor.fetchall()
+
+
+def team_speed_from_lap_aggregates(session_id: int) -> list[tuple]:
+    """Mean and max speed of every constructor from the session's lap aggregates.
+
+    Lap means are weighted by their sample count, which gives the mean of the samples.
+
+    Returns:
+        list[tuple]: (constructor_id, mean speed, max speed) rows, empty if the session
+            has no lap aggregates.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT results.constructor_id, "
+            "SUM(lap_aggregates.mean_speed * lap_aggregates.samples) / SUM(lap_aggregates.samples), "
+            "MAX(lap_aggregates.max_speed) "
+            f"FROM lap_aggregates {LAP_RESULT_JOIN.format(table='lap_aggregates')} "
+            "WHERE laps.session_id = %s AND lap_aggregates.mean_speed IS NOT NULL "
+            "GROUP BY results.constructor_id",
+            [session_id]
+        )
+        return cursor.fetchall()
 
 
 @register_plots
 class PerformanceVisuals:
     
-    def __init__(self, year: int, event_id: int, session_id: int):
+    def __init__(self, year: int, event_id: int, session_id: int, bundle: SessionDataBundle | None = None):
         # Initialise basic parameters
         self.year = year
         self.event_id = event_id
         self.session_id = session_id
+        # Data shared with the other visuals of the session
+        self.bundle = bundle or session_bundle(year, event_id, session_id)
         
         
         self._load_data()
@@ -29,79 +79,17 @@ class PerformanceVisuals:
         
     def _load_data(self) -> None:
         """Fetch all necessary raw data from the database"""
-        lap_ids = Lap.objects.filter(session=self.session_id).values_list('id', flat=True).distinct()
-        laps_raw = Lap.objects.filter(id__in=lap_ids).values('driver')
-
-        self._raw_telemetry = Telemetry.objects.filter(lap__in=lap_ids).values('speed', 'lap')
-        self._raw_constructor_color = ConstructorColor.objects.filter(season_year=self.year).values("constructor", "color_fastf1")
-        self._raw_results = Result.objects.filter(session=self.session_id).values("id", "constructor", "driver")
-        self._raw_constructor = Constructor.objects.values("id", "name")
-        self._raw_event_details = Event.objects.get(id=self.event_id)
-        self._raw_session_details = Session.objects.get(id=self.session_id)
-
+        # Only one row per constructor crosses the wire, the lap aggregates are preferred
+        self._raw_team_speed = team_speed_from_lap_aggregates(self.session_id) or team_speed_from_telemetry(self.year, self.session_id)
+        self._raw_constructor_color = self.bundle.constructor_colors
+        self._raw_constructor = self.bundle.constructors
+        self._raw_event_details = self.bundle.event
+        self._raw_session_details = self.bundle.session
         
         
     def _process_data(self) -> None:
         """Process fetched data and make it a dataframe"""
-        # telemetry_df = pd.DataFrame(self._raw_telemetry)
-        # self.telemetry_df = telemetry_df
-        
-        # Dictionary {"id": "team name"}
-        team_names_dict = {entry["id"]: entry["name"] for entry in self._raw_constructor}
-        
-        # Dictionary {"team name": "team color"}
-        team_colors_dict = {team_names_dict.get(
-            entry["constructor"], entry["constructor"]): entry["color_fastf1"] for entry in self._raw_constructor_color}
-        
-        # Dictionary {"driver": "team name"}
-        driver_constructor_dict = {entry["driver"]: entry["constructor"] for entry in self._raw_results}
-        
-        # Build the dictionary: constructor_id -> list of lap_ids
-        constructor_lap_ids = defaultdict(list)
-
-        # Get all laps with 'id' and 'driver'
-        laps_raw = Lap.objects.filter(session=self.session_id).values("id", "driver")
-
-        for lap in laps_raw:
-            lap_id = lap["id"]
-            driver_id = lap["driver"]
-            constructor_id = driver_constructor_dict.get(driver_id)
-
-            if constructor_id is not None:
-                constructor_lap_ids[constructor_id].append(lap_id)
-
-        self.constructor_lap_ids = dict(constructor_lap_ids)
-        print(self.constructor_lap_ids)
-       
-        # Build a reverse mapping: lap_id -> constructor_id
-        lap_to_constructor = {
-            lap_id: constructor_id
-            for constructor_id, lap_ids in self.constructor_lap_ids.items()
-            for lap_id in lap_ids
-        }
-
-        # Create DataFrame from telemetry
-        telemetry_df = pd.DataFrame(self._raw_telemetry)
-
-        # Skip if telemetry is empty
-        if telemetry_df.empty:
-            self.team_speed_df = pd.DataFrame()
-            return
-
-        # Assuming telemetry contains 'lap' and 'speed'
-        telemetry_df["constructor_id"] = telemetry_df["lap"].map(lap_to_constructor)
-
-        # Drop rows with no matching constructor
-        telemetry_df = telemetry_df.dropna(subset=["constructor_id"])
-
-        # Convert constructor_id to integer (optional but useful for grouping)
-        telemetry_df["constructor_id"] = telemetry_df["constructor_id"].astype(int)
-
-        # Group and calculate mean and max
-        team_speed_summary = telemetry_df.groupby("constructor_id")["speed"].agg(["mean", "max"]).reset_index()
-
-        self.team_speed_df = team_speed_summary
-        print(self.team_speed_df)
+        self.team_speed_df = pd.DataFrame(self._raw_team_speed, columns=["constructor_id", "mean", "max"])
         
 
     @plot_name('team_speed_comparison')
@@ -116,7 +104,6 @@ class PerformanceVisuals:
             str: A base64 encoded string of the plot image.
         """
         if self.team_speed_df.empty:
-            print("No speed data available to generate plot.")
             return ""
 
         # Map constructor IDs to names and colors
@@ -0,0 +1,321 @@
+import base64
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import caches
+
+from static_data.reference import data_version
+from static_visuals.plotting import PLOT_STYLE_VERSION
+from static_visuals.plotting.render_pool import render_plot_methods
+
+
+# Size bound of the filesystem and memory stores when PLOT_CACHE_MAX_BYTES is not set
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+
+def plot_cache_key(visual: str, plot: str, year: int, session_id: int, driver_id: int | None = None,
+                   lap_id: int | None = None, version: int | None = None) -> str:
+    """Key of a rendered plot.
+
+    An import into the season (its data version) or a change to the plotting code
+    (style version) leads to new keys, the images cached under the old ones are evicted
+    eventually.
+
+    Args:
+        visual (str): Name of the visual class, e.g. "TeamLapVisuals".
+        plot (str): Plot name, one of the class' `PLOT_METHODS`.
+        year (int): Season year of the session.
+        session_id (int): ID of the session.
+        driver_id (int | None): ID of the driver, for the per lap visuals.
+        lap_id (int | None): ID of the lap, for the per lap visuals.
+        version (int | None): Data version of the season, the current one by default.
+
+    Returns:
+        str: The cache key.
+    """
+    parts = (visual, plot, session_id, driver_id, lap_id)
+    ids = ":".join("-" if part in (None, "") else str(part) for part in parts)
+    if version is None:
+        version = data_version(year)
+    return f"plot:{PLOT_STYLE_VERSION}:{int(year)}:{version}:{ids}"
+
+
+class FileSystemPlotStore:
+    """
+    PNG files in a directory, shared by the processes of one host.
+
+    Reading a plot touches its file, so the modification times order the plots by last
+    use; after a write the least recently used files are removed until the directory
+    fits in `max_bytes` again.
+
+    Attributes:
+        directory (Path): Directory holding the images.
+        max_bytes (int): Size bound of the directory.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha1(key.encode()).hexdigest()}.png"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            png = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            # Never stored, or evicted by another process in between
+            return None
+        return png
+
+    def contains(self, key: str) -> bool:
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def set(self, key: str, png: bytes) -> None:
+        # Readers in other processes never see a partially written file
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(png)
+        os.replace(temporary, self._path(key))
+        self._evict()
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.png"):
+            path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".png"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            Path(path).unlink(missing_ok=True)
+            total -= size
+
+
+class MemoryPlotStore:
+    """
+    Process-local LRU of PNG images bounded by their total size.
+
+    The local stand-in for a shared cache, e.g. in development or tests.
+
+    Attributes:
+        max_bytes (int): Size bound of the stored images.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._plots = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            png = self._plots.get(key)
+            if png is not None:
+                self._plots.move_to_end(key)
+            return png
+
+    def contains(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def set(self, key: str, png: bytes) -> None:
+        if len(png) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._plots:
+                self._nbytes -= len(self._plots.pop(key))
+            self._plots[key] = png
+            self._nbytes += len(png)
+            while self._nbytes > self.max_bytes:
+                _, evicted = self._plots.popitem(last=False)
+                self._nbytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plots.clear()
+            self._nbytes = 0
+
+
+class DjangoCachePlotStore:
+    """
+    PNG images in one of Django's caches, e.g. Redis shared by several hosts.
+
+    The size bound and the eviction are the cache's own; for Redis set `maxmemory` with
+    the `allkeys-lru` policy. Best used with a cache alias of its own, see `clear`.
+
+    Attributes:
+        alias (str): Alias of the cache in `CACHES`.
+    """
+
+    def __init__(self, alias: str = "default"):
+        self.alias = alias
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get(self, key: str) -> bytes | None:
+        return self.cache.get(key)
+
+    def contains(self, key: str) -> bool:
+        return self.cache.has_key(key)
+
+    def set(self, key: str, png: bytes) -> None:
+        self.cache.set(key, png, timeout=None)
+
+    def clear(self) -> None:
+        # Clears the whole cache, give the plots an alias of their own
+        self.cache.clear()
+
+
+def get_plot_store():
+    """Store selected by PLOT_CACHE_BACKEND: "filesystem" (default), "memory" or "cache"."""
+    backend = getattr(settings, "PLOT_CACHE_BACKEND", "filesystem")
+    max_bytes = getattr(settings, "PLOT_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+    if backend == "filesystem":
+        directory = getattr(settings, "PLOT_CACHE_DIR", None) or Path(settings.BASE_DIR) / ".cache" / "plots"
+        return FileSystemPlotStore(directory, max_bytes)
+    if backend == "memory":
+        return MemoryPlotStore(max_bytes)
+    if backend == "cache":
+        return DjangoCachePlotStore(getattr(settings, "PLOT_CACHE_ALIAS", "default"))
+    raise ValueError(f"Unknown PLOT_CACHE_BACKEND {backend!r}, expected 'filesystem', 'memory' or 'cache'")
+
+
+class PlotCache:
+    """
+    Rendered plot images in a pluggable store, with hit and miss counters.
+
+    Attributes:
+        hits (int): Plots this process read from the store.
+        misses (int): Plots this process looked for in the store but did not find.
+    """
+
+    def __init__(self, store=None):
+        self._store = store
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def store(self):
+        # Created on first use, once the settings are configured
+        if self._store is None:
+            self._store = get_plot_store()
+        return self._store
+
+    def get(self, key: str) -> bytes | None:
+        png = self.store.get(key)
+        self._count(png is not None)
+        return png
+
+    def contains(self, key: str) -> bool:
+        """Whether a plot is cached, without reading it or counting a hit or miss."""
+        return self.store.contains(key)
+
+    def set(self, key: str, png: bytes) -> None:
+        self.store.set(key, png)
+
+    def clear(self) -> None:
+        self.store.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+# Shared by every view of the process
+plot_cache = PlotCache()
+
+
+def render_plot(visual_cls, plot: str, year: int, event_id: int, session_id: int, *args) -> bytes | None:
+    """Renders one plot of a visual and stores it in the cache.
+
+    A visual with nothing to plot (e.g. a session without telemetry) renders an empty
+    image; it is not cached, so the plot is rendered again once there is data.
+
+    Args:
+        visual_cls (type): Visual class, e.g. `TeamLapVisuals`.
+        plot (str): Plot name, one of the class' `PLOT_METHODS`.
+        year (int): Season year.
+        event_id (int): ID of the event.
+        session_id (int): ID of the session.
+        *args: Remaining arguments of the visual, the driver and lap ID of
+            `TelemetryVisuals`.
+
+    Returns:
+        bytes | None: The PNG image, None if the visual has nothing to plot.
+    """
+    plotter = visual_cls(year, event_id, session_id, *args)
+    # Plot methods return the image base64 encoded, for inlining
+    png = base64.b64decode(getattr(plotter, plot)())
+    if not png:
+        return None
+    plot_cache.set(plot_cache_key(visual_cls.__name__, plot, year, session_id, *args), png)
+    return png
+
+
+def render_plots(visual_cls, year: int, event_id: int, session_id: int, *args) -> list[str]:
+    """Renders the plots of a visual that are not cached yet.
+
+    Cached plots are only checked for, not read. The visual is only created, and its
+    data only loaded, when at least one of its plots is missing; the missing plots are
+    then rendered concurrently in the rendering pool, see `render_plot_methods`.
+
+    Args:
+        visual_cls (type): Visual class, e.g. `TeamLapVisuals`.
+        year (int): Season year.
+        event_id (int): ID of the event.
+        session_id (int): ID of the session.
+        *args: Remaining arguments of the visual, the driver and lap ID of
+            `TelemetryVisuals`.
+
+    Returns:
+        list[str]: Names of the cached plots, in `PLOT_METHODS` order; plots the visual
+        has nothing for (empty images) are left out and not cached.
+    """
+    version = data_version(year)
+    missing = {}
+    for name in visual_cls.PLOT_METHODS:
+        key = plot_cache_key(visual_cls.__name__, name, year, session_id, *args, version=version)
+        if not plot_cache.contains(key):
+            missing[name] = key
+
+    empty = set()
+    if missing:
+        plotter = visual_cls(year, event_id, session_id, *args)
+        for (name, key), plot_data in zip(missing.items(), render_plot_methods(plotter, list(missing))):
+            png = base64.b64decode(plot_data)
+            if png:
+                plot_cache.set(key, png)
+            else:
+                empty.add(name)
+    return [name for name in visual_cls.PLOT_METHODS if name not in empty]
@@ -0,0 +1,84 @@
+import logging
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _init_worker() -> None:
+    # The visuals' modules import the models, which need the app registry
+    import django
+    django.setup()
+
+
+def _render(visual_cls, state: bytes, plot: str) -> str:
+    """Renders one plot of a processed visual in a worker process."""
+    plotter = visual_cls.__new__(visual_cls)
+    plotter.__dict__.update(pickle.loads(state))
+    return getattr(plotter, plot)()
+
+
+def get_render_pool() -> ProcessPoolExecutor | None:
+    """The process-wide rendering pool, None when PLOT_RENDER_WORKERS is below 2.
+
+    The pool is created on first use and its workers are reused by every later
+    request of the process.
+    """
+    global _pool
+    workers = getattr(settings, "PLOT_RENDER_WORKERS", 0)
+    if workers <= 1:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # Spawned workers never inherit the caller's database connections or pyplot state
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_worker)
+        return _pool
+
+
+def shutdown_render_pool() -> None:
+    """Stops the rendering workers, a new pool is created on the next use."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+
+def render_plot_methods(plotter, plots: list[str]) -> list[str]:
+    """Renders plots of a processed visual, concurrently when a pool is configured.
+
+    Pyplot is not thread-safe, so the plots are rendered in worker processes. They
+    get the processed data of the visual (its attributes, without the session
+    bundle) pickled once and render one plot each, the request then waits for the
+    slowest plot instead of all of them in turn. Without a pool, or for a single plot,
+    they are rendered here one after another.
+
+    Args:
+        plotter: Visual whose data is loaded and processed, e.g. a `TeamLapVisuals`.
+        plots (list[str]): Plot names, from the visual's `PLOT_METHODS`.
+
+    Returns:
+        list[str]: The base64 encoded PNG images, in `plots` order.
+    """
+    pool = get_render_pool() if len(plots) > 1 else None
+    if pool is None:
+        return [getattr(plotter, plot)() for plot in plots]
+
+    state = pickle.dumps({name: value for name, value in vars(plotter).items() if name != "bundle"})
+    try:
+        futures = [pool.submit(_render, type(plotter), state, plot) for plot in plots]
+        return [future.result() for future in futures]
+    except BrokenProcessPool:
+        # A worker died (e.g. killed for its memory), the next request starts a new pool
+        logger.exception("Plot rendering pool broke, rendering in the request process")
+        shutdown_render_pool()
+        return [getattr(plotter, plot)() for plot in plots]
@@ -17,7 +17,9 @@ import numpy as np
 import io
 import base64
 
-from static_data.models import Driver, Event, Session, Constructor, ConstructorColor, Telemetry, Result, Lap
+from static_data.columnar import fetch_arrays, frame_from_arrays, NARROW_DTYPES
+from static_data.models import Telemetry, LapTelemetry
+from static_visuals.plotting.bundle import SessionDataBundle, session_bundle
 
 
 @register_plots
@@ -33,13 +35,15 @@ class TelemetryVisuals:
     """
 
     
-    def __init__(self, year: int, event_id: int, session_id: int, driver_id: int, lap_id: int):
+    def __init__(self, year: int, event_id: int, session_id: int, driver_id: int, lap_id: int, bundle: SessionDataBundle | None = None):
         # Initialise basic parameters
         self.year = year
         self.event_id = event_id
         self.session_id = session_id
         self.driver_id = driver_id
         self.lap_id = lap_id
+        # Data shared with the other visuals of the session
+        self.bundle = bundle or session_bundle(year, event_id, session_id)
         
         # Load, process data
         self._load_data()
@@ -47,26 +51,38 @@ class TelemetryVisuals:
         
     def _load_data(self) -> None:
         """Fetch all necessary raw data from the database"""
-        self._raw_driver_details = Driver.objects.filter(id=self.driver_id).values('id', 'abbreviation')
-        self._raw_event_details = Event.objects.get(id=self.event_id)
-        self._raw_session_details = Session.objects.get(id=self.session_id)
-        self._raw_results = Result.objects.filter(session=self.session_id, driver=self.driver_id).values('constructor')
-        self._raw_constructor = Constructor.objects.values()
-        self._raw_telemetry = Telemetry.objects.filter(lap=self.lap_id).values(
-            'time', 'rpm', 'speed', 'n_gear', 'throttle', 'brake', 'drs', 'distance', 'x', 'y')
+        self._raw_driver_details = [driver for driver in self.bundle.drivers if driver['id'] == int(self.driver_id)]
+        self._raw_event_details = self.bundle.event
+        self._raw_session_details = self.bundle.session
+        self._raw_results = [result for result in self.bundle.results if result['driver'] == int(self.driver_id)]
+        self._raw_constructor = self.bundle.constructors
+        # A lap stored packed is a single row decoded into arrays, otherwise one row per sample
+        self._raw_telemetry = LapTelemetry.load(self.lap_id)
+        if self._raw_telemetry is None:
+            # Filtering on the season lets PostgreSQL scan a single partition
+            self._raw_telemetry = fetch_arrays(
+                Telemetry.objects.filter(season_year=self.year, lap=self.lap_id),
+                ['time', 'rpm', 'speed', 'n_gear', 'throttle', 'brake', 'drs', 'distance', 'x', 'y'],
+                NARROW_DTYPES[Telemetry])
     
     def _process_data(self) -> None:
         """Process fetched data and make it a pandas dataframe"""
-        telemetry_df = pd.DataFrame(self._raw_telemetry)
+        telemetry_df = frame_from_arrays(self._raw_telemetry)
         
         # telemetry_df['drs'] = pd.to_numeric(telemetry_df['drs'])
-        telemetry_df['drs'] = telemetry_df['drs'].apply(drs_to_boolean)
+        telemetry_df['drs'] = telemetry_df['drs'].map(drs_to_boolean, na_action="ignore")
+        # Missing samples are NaN and drawn as gaps, not as gear -1 or brake and DRS off
+        telemetry_df = telemetry_df.astype({"n_gear": "float64", "brake": "float64", "drs": "float64"})
         
     
-        constructor_id = self._raw_results[0]['constructor']
+        # Drivers without a result, or constructors without a color of the season, are drawn in white
+        constructor_id = self._raw_results[0]['constructor'] if self._raw_results else None
         
-        self.lap_number = Lap.objects.filter(id=self.lap_id).values_list('lap_number', flat=True)[0]
-        self.constructor_color = ConstructorColor.objects.filter(constructor=constructor_id).values_list('color_fastf1', flat=True)[0]
+        laps = self.bundle.laps
+        self.lap_number = int(laps.loc[laps['id'] == int(self.lap_id), 'lap_number'].iloc[0])
+        self.constructor_color = next(
+            (color['color_fastf1'] for color in self.bundle.constructor_colors if color['constructor'] == constructor_id), 'white'
+        )
 
         self.driver_abbreviation = self._raw_driver_details[0]['abbreviation']
 
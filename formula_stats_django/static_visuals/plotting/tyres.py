@@ -13,15 +13,17 @@ import numpy as np
 import io
 import base64
 
-from static_data.models import Lap, TyreCompounds, Session, Event
+from static_visuals.plotting.bundle import SessionDataBundle, session_bundle
 
 @register_plots
 class TyreVisuals:
-    def __init__(self, year: int, event_id: int, session_id: int):
+    def __init__(self, year: int, event_id: int, session_id: int, bundle: SessionDataBundle | None = None):
         # Initialise basic parameters
         self.year = year
         self.event_id = event_id
         self.session_id = session_id
+        # Data shared with the other visuals of the session
+        self.bundle = bundle or session_bundle(year, event_id, session_id)
         
         # Load, process data and set general plot properties
         self._load_data()
@@ -29,17 +31,17 @@ class TyreVisuals:
         
     def _load_data(self) -> None:
         """Fetch all necessary raw data from the database"""
-        self._raw_laps = Lap.objects.filter(session=self.session_id).values('lap_number', "lap_time", "compound")
-        self._raw_tyre_compounds = TyreCompounds.objects.filter(season_year=self.year).values('name', 'color')
-        self._raw_event_details = Event.objects.get(id=self.event_id)
-        self._raw_session_details = Session.objects.get(id=self.session_id)
+        self._raw_laps = self.bundle.laps[['lap_number', "lap_time", "compound"]]
+        self._raw_tyre_compounds = self.bundle.tyre_compounds
+        self._raw_event_details = self.bundle.event
+        self._raw_session_details = self.bundle.session
     
     def _process_data(self, remove_outliers: bool = True) -> None:
         """Process fetched data and make it a pandas dataframe"""
         # Tyre colors dict
         self.tyre_colors_dict = {entry['name']: entry['color'] for entry in self._raw_tyre_compounds}
         
-        laps_df = pd.DataFrame(self._raw_laps)
+        laps_df = self._raw_laps
         
         # Remove outliers
         if remove_outliers:
@@ -9,7 +9,7 @@ import pandas as pd
 import io
 import base64
 
-from static_data.models import Event, Session, Weather
+from static_visuals.plotting.bundle import SessionDataBundle, session_bundle
 
 
 @register_plots
@@ -23,11 +23,13 @@ class WeatherVisuals:
         session_id (int): ID of the session.
     """
     
-    def __init__(self, year: int, event_id: int, session_id: int):
+    def __init__(self, year: int, event_id: int, session_id: int, bundle: SessionDataBundle | None = None):
     
         self.year = year
         self.event_id = event_id
         self.session_id = session_id
+        # Data shared with the other visuals of the session
+        self.bundle = bundle or session_bundle(year, event_id, session_id)
         
         # Load, process data and set general plot properties
         self._load_data()
@@ -36,13 +38,14 @@ class WeatherVisuals:
         
     def _load_data(self):
         """Fetch all necessary raw data from the database"""
-        self._raw_weather = Weather.objects.filter(session=self.session_id).values()
-        self._raw_event_details = Event.objects.get(id=self.event_id)
-        self._raw_session_details = Session.objects.get(id=self.session_id)
+        self._raw_weather = self.bundle.weather
+        self._raw_event_details = self.bundle.event
+        self._raw_session_details = self.bundle.session
     
     def _process_data(self):
         """Process fetched data and make it a pandas dataframe"""
-        self.weather_df = pd.DataFrame(self._raw_weather)
+        # The bundle's frame is shared, the minutes column goes on a copy
+        self.weather_df = self._raw_weather.copy()
         self.weather_df['time_m'] = self.weather_df['time_delta'] // 60000
     
     def _set_general_plot_properties(self):
@@ -0,0 +1,120 @@
+import base64
+import os
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from static_visuals.plotting import PLOT_STYLE_VERSION, plot_name, register_plots
+from static_visuals.plotting.plot_cache import (
+    FileSystemPlotStore, MemoryPlotStore, PlotCache, plot_cache, plot_cache_key, render_plot, render_plots
+)
+
+PNG = b"\x89PNG\r\n\x1a\n"
+
+
+@register_plots
+class FakeVisuals:
+    """A visual with one plot and one plot it has no data for."""
+
+    instances = 0
+
+    def __init__(self, year, event_id, session_id, *args):
+        FakeVisuals.instances += 1
+
+    @plot_name("speed")
+    def speed(self) -> str:
+        return base64.b64encode(PNG).decode()
+
+    @plot_name("gaps")
+    def gaps(self) -> str:
+        return ""
+
+
+class PlotCacheKeyTests(SimpleTestCase):
+
+    def test_key_parts(self):
+        self.assertEqual(plot_cache_key("TelemetryVisuals", "telemetry_plot", 2024, 7, 3, 42, version=5),
+                         f"plot:{PLOT_STYLE_VERSION}:2024:5:TelemetryVisuals:telemetry_plot:7:3:42")
+        self.assertEqual(plot_cache_key("TeamLapVisuals", "lap_time_distribution", 2024, 7, version=5),
+                         f"plot:{PLOT_STYLE_VERSION}:2024:5:TeamLapVisuals:lap_time_distribution:7:-:-")
+
+    def test_key_changes_with_the_data_version(self):
+        self.assertNotEqual(plot_cache_key("TeamLapVisuals", "lap_time_distribution", 2024, 7, version=5),
+                            plot_cache_key("TeamLapVisuals", "lap_time_distribution", 2024, 7, version=6))
+
+    @mock.patch("static_visuals.plotting.plot_cache.data_version", side_effect=lambda year: year - 2000)
+    def test_key_uses_the_data_version_of_the_season(self, data_version):
+        self.assertIn(":2024:24:", plot_cache_key("TeamLapVisuals", "lap_time_distribution", 2024, 7))
+        data_version.assert_called_once_with(2024)
+
+
+class PlotStoreTests(SimpleTestCase):
+
+    def check_lru(self, store):
+        store.set("a", b"1" * 40)
+        store.set("b", b"2" * 40)
+        store.get("a")
+        store.set("c", b"3" * 40)
+
+        self.assertEqual(store.get("a"), b"1" * 40)
+        self.assertIsNone(store.get("b"))
+        self.assertTrue(store.contains("c"))
+
+    def test_memory_store_evicts_the_least_recently_used(self):
+        self.check_lru(MemoryPlotStore(max_bytes=100))
+
+    def test_filesystem_store_evicts_the_least_recently_used(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = FileSystemPlotStore(directory, max_bytes=100)
+            store.set("a", b"1" * 40)
+            store.set("b", b"2" * 40)
+            # Reading touches a file, set distinct modification times instead
+            os.utime(store._path("a"), (2, 2))
+            os.utime(store._path("b"), (1, 1))
+            store.set("c", b"3" * 40)
+
+            self.assertTrue(store.contains("a"))
+            self.assertFalse(store.contains("b"))
+            self.assertTrue(store.contains("c"))
+
+
+class PlotCacheTests(SimpleTestCase):
+
+    def test_counts_only_reads(self):
+        cache = PlotCache(MemoryPlotStore(max_bytes=100))
+        cache.set("a", PNG)
+        cache.contains("a")
+        cache.contains("b")
+        cache.get("a")
+        cache.get("b")
+
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+@mock.patch("static_visuals.plotting.plot_cache.data_version", return_value=1)
+@mock.patch.object(plot_cache, "_store", new_callable=lambda: MemoryPlotStore(max_bytes=10000))
+class RenderPlotTests(SimpleTestCase):
+
+    def setUp(self):
+        FakeVisuals.instances = 0
+
+    def test_renders_and_caches(self, store, data_version):
+        self.assertEqual(render_plot(FakeVisuals, "speed", 2024, 1, 7), PNG)
+        self.assertEqual(store.get(plot_cache_key("FakeVisuals", "speed", 2024, 7)), PNG)
+
+    def test_empty_plot_is_not_cached(self, store, data_version):
+        self.assertIsNone(render_plot(FakeVisuals, "gaps", 2024, 1, 7))
+        self.assertFalse(store.contains(plot_cache_key("FakeVisuals", "gaps", 2024, 7)))
+
+    def test_render_plots_leaves_out_empty_plots(self, store, data_version):
+        self.assertEqual(render_plots(FakeVisuals, 2024, 1, 7), ["speed"])
+        self.assertEqual(FakeVisuals.instances, 1)
+        self.assertFalse(store.contains(plot_cache_key("FakeVisuals", "gaps", 2024, 7)))
+
+    def test_render_plots_skips_the_visual_when_cached(self, store, data_version):
+        for name in FakeVisuals.PLOT_METHODS:
+            store.set(plot_cache_key("FakeVisuals", name, 2024, 7), PNG)
+
+        self.assertEqual(render_plots(FakeVisuals, 2024, 1, 7), FakeVisuals.PLOT_METHODS)
+        self.assertEqual(FakeVisuals.instances, 0)
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from django.core.cache import cache
+from django.test import TestCase
+
+from static_data.models import ConstructorColor, Lap, Result, Telemetry
+from static_data.tests.fixtures import create_session
+from static_visuals.plotting.bundle import session_bundles
+from static_visuals.plotting.telemetry import TelemetryVisuals
+
+
+class TelemetryVisualsTests(TestCase):
+
+    def setUp(self):
+        # Bundles and reference data of other tests could carry the same IDs
+        session_bundles.clear()
+        cache.clear()
+
+    def add_samples(self, lap: Lap) -> None:
+        start = datetime(2024, 3, 24, 5, tzinfo=timezone.utc)
+        Telemetry.objects.bulk_create([
+            Telemetry(
+                lap=lap, season_year_id=2024, date=start + timedelta(milliseconds=100 * sample), time=100 * sample,
+                speed=200.0, rpm=11000.0, throttle=100.0, distance=5.5 * sample, x=0.0, y=0.0,
+                n_gear=None if sample == 1 else 7, brake=None if sample == 1 else False, drs=None if sample == 1 else 12
+            )
+            for sample in range(3)
+        ])
+
+    def test_missing_samples_are_nan(self):
+        session = create_session(drivers=1, laps=1)
+        lap = Lap.objects.get(session=session)
+        self.add_samples(lap)
+
+        visuals = TelemetryVisuals(2024, session.event_id, session.id, lap.driver_id, lap.id)
+
+        for channel, value in (("n_gear", 7.0), ("brake", 0.0), ("drs", 1.0)):
+            np.testing.assert_array_equal(visuals.telemetry_df[channel], [value, np.nan, value])
+
+    def test_constructor_color(self):
+        session = create_session(drivers=1, laps=1)
+        lap = Lap.objects.get(session=session)
+        self.add_samples(lap)
+
+        self.assertEqual(TelemetryVisuals(2024, session.event_id, session.id, lap.driver_id, lap.id).constructor_color, "#E8002D")
+
+    def test_white_without_a_constructor_color(self):
+        session = create_session(drivers=1, laps=1)
+        lap = Lap.objects.get(session=session)
+        self.add_samples(lap)
+        ConstructorColor.objects.all().delete()
+
+        self.assertEqual(TelemetryVisuals(2024, session.event_id, session.id, lap.driver_id, lap.id).constructor_color, "white")
+
+    def test_white_without_a_result(self):
+        session = create_session(drivers=1, laps=1)
+        lap = Lap.objects.get(session=session)
+        self.add_samples(lap)
+        Result.objects.all().delete()
+
+        self.assertEqual(TelemetryVisuals(2024, session.event_id, session.id, lap.driver_id, lap.id).constructor_color, "white")